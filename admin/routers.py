@@ -8,9 +8,11 @@ from starlette.templating import Jinja2Templates
 
 from feedback.models import Feedback
 from common.dependencies import get_admin
+from common.two_tier_cache import get_two_tier_cache_stats
 from tortoise.expressions import Q
 
 from parties.models import PartyParticipant, Party
+from parties.utils import refresh_party_approved_counts, refresh_party_geohashes
 from users.models import User
 from tortoise.functions import Count
 
@@ -152,3 +154,23 @@ async def toggle_user_active(user_id: int) -> Dict[str, Any]:
     user.is_active = not user.is_active
     await user.save()
     return {"success": True, "is_active": user.is_active}
+
+
+@admin_router.post("/parties/recount-approved")
+async def recount_party_approved(party_id: Optional[int] = None) -> Dict[str, Any]:
+    updated_count = await refresh_party_approved_counts(
+        [party_id] if party_id else None
+    )
+    return {"success": True, "updated_count": updated_count}
+
+
+@admin_router.post("/parties/refresh-geohash")
+async def refresh_party_geohash() -> Dict[str, Any]:
+    updated_count = await refresh_party_geohashes()
+    return {"success": True, "updated_count": updated_count}
+
+
+@admin_router.get("/cache-stats")
+async def cache_stats() -> Dict[str, Any]:
+    """요청을 처리한 워커의 two tier 캐시 적중 통계"""
+    return get_two_tier_cache_stats()
@@ -1,9 +1,46 @@
 # CACHE KEY
 CACHE_KEY_LOGIN_REDIRECT_UUID = "redirect_str:{uuid}"
-CACHE_KEY_POST_VIEWS = "post_views:{post_id}"
+CACHE_KEY_POST_VIEW_DELTAS = "post_view_deltas"  # hash, field: post_id
+CACHE_KEY_POST_VIEW_DELTAS_FLUSHING = "post_view_deltas:flushing"
 CACHE_KEY_POST_LIKES = "post_likes:{post_id}"
-VIEW_COUNT_UPDATE_THRESHOLD = 10  # 조회수 DB 업데이트 임계값
+CACHE_KEY_POST_ACTIVE_COUNT = "post_active_count"
+CACHE_KEY_POST_SEARCH_COUNT = "post_search_count:{search_hash}"
+CACHE_KEY_PARTY_DETAIL = "party_detail:v1:{party_id}:{version}"
+CACHE_KEY_PARTY_DETAIL_VERSION = "party_detail_version:{party_id}"
+CACHE_KEY_PARTY_EXPIRY_QUEUE = "party_expiry_queue"  # sorted set, score: gather_at
+CACHE_KEY_POST_TRENDING = "post_trending"  # sorted set, score: 감쇠 가중치 합
+CACHE_KEY_POST_TRENDING_EPOCH = "post_trending:epoch"  # 점수 기준 시각(timestamp)
+CACHE_KEY_TWO_TIER = "two_tier:{namespace}:{key}"
+CACHE_KEY_TWO_TIER_GENERATION = "two_tier_generation:{namespace}"  # 무효화할 때마다 증가
+CACHE_CHANNEL_TWO_TIER_INVALIDATION = "two_tier_invalidation"  # pub/sub 채널
+CACHE_KEY_RECOMPUTE_LOCK = "recompute_lock:{key}"
+CACHE_KEY_JOB_LOCK = "job_lock:{name}"  # 스케줄러 작업 중복 실행 방지
+CACHE_KEY_NOTIFICATION_STREAM = "notification_events"  # stream, 파티 알림 이벤트
+CACHE_KEY_NOTIFICATION_DEAD_LETTER = "notification_events:dead"  # 재시도 후에도 실패한 이벤트
+NOTIFICATION_STREAM_GROUP = "notification_workers"
+NOTIFICATION_STREAM_MAX_LEN = 100000  # 알림 이벤트 스트림 최대 길이
+POST_VIEW_FLUSH_BATCH_SIZE = 500  # 조회수 DB 반영 시 UPDATE 1회당 게시글 수
+POST_VIEW_FLUSH_LOCK_EXPIRE_TIME = 60 * 5  # 5분, 조회수 반영 작업 잠금 유지 시간
+CACHE_COMPRESS_THRESHOLD = 1024  # 직렬화 결과가 1KB 이상이면 zlib 압축
 CACHE_EXPIRE_TIME = 60 * 60 * 24  # 24시간
+PARTY_DETAIL_CACHE_EXPIRE_TIME = 60 * 10  # 10분
+# 1시간, 파티 상세 캐시 버전 유지 시간 (버전이 사라질 때 이전 버전 캐시가 모두 만료되도록 상세 캐시보다 길게)
+PARTY_DETAIL_VERSION_EXPIRE_TIME = 60 * 60
+POST_ACTIVE_COUNT_EXPIRE_TIME = 60 * 60  # 1시간, 카운터 오차 보정 주기
+POST_SEARCH_COUNT_EXPIRE_TIME = 60  # 1분
+TWO_TIER_LOCAL_EXPIRE_TIME = 60  # 1분, 워커 메모리 캐시 유지 시간
+TWO_TIER_LOCAL_MAX_SIZE = 256  # 네임스페이스별 워커 메모리 캐시 최대 항목 수
+RECOMPUTE_LOCK_EXPIRE_TIME = 5  # 5초, 캐시 재계산 잠금 유지 시간
+RECOMPUTE_LOCK_WAIT_TIME = 3  # 잠금을 얻지 못한 요청이 다른 워커의 재계산을 기다리는 최대 시간
+TAG_CACHE_MISS_REFRESH_INTERVAL = 10  # 10초, 캐시에 없는 태그 id 로 tags 전체를 다시 로드하는 최소 간격
+USER_CACHE_EXPIRE_TIME = 30  # 30초, 인증 사용자 row 워커 메모리 캐시 유지 시간
+USER_CACHE_MAX_SIZE = 10000  # 워커별 인증 사용자 캐시 최대 항목 수
+POST_TRENDING_HALF_LIFE = 60 * 60 * 6  # 6시간마다 이벤트 가중치가 절반으로 감쇠
+POST_TRENDING_MAX_SIZE = 10000  # 인기 게시글 sorted set 최대 크기
+POST_TRENDING_REBASE_LOCK_EXPIRE_TIME = 60  # 1분, 인기 게시글 점수 rebase 작업 잠금 유지 시간
+POST_TRENDING_WEIGHT_VIEW = 1
+POST_TRENDING_WEIGHT_LIKE = 5
+POST_TRENDING_WEIGHT_COMMENT = 3
 
 # DURATION
 DURATION_LOGIN_REDIRECT_UUID = 60
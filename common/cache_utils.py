@@ -1,49 +1,611 @@
 import json
+import uuid
+import zlib
+from abc import ABC, abstractmethod
 
-import redis
 import fakeredis
-from contextlib import contextmanager
-from typing import Any, Iterator
+import orjson
+import redis
+import redis.asyncio as aioredis
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 from os import getenv
-from common.config import IS_TEST
+from common.cache_constants import CACHE_COMPRESS_THRESHOLD
+from common.config import IS_TEST, logger
+
+# 테스트 환경에서는 클라이언트 간에 데이터가 공유되도록 하나의 가짜 서버를 사용
+FAKE_REDIS_SERVER = fakeredis.FakeServer() if IS_TEST else None
+
+# version 바이트의 최상위 비트는 zlib 압축 여부
+CACHE_FLAG_COMPRESSED = 0x80
+
+
+class CacheCodec(ABC):
+    """캐시 값 직렬화 방식. version 은 저장 값의 첫 바이트에 기록됩니다. (1 ~ 31)"""
+
+    version: int = 0
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+
+class OrjsonCacheCodec(CacheCodec):
+    version = 1
+
+    def dumps(self, value: Any) -> bytes:
+        # stdlib json 과 같이 int 키 등을 문자열 키로 저장
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class CacheSerializer:
+    """
+    캐시 값을 [version 바이트][payload] 형태로 변환합니다.
+    payload 가 compress_threshold 이상이면 zlib 으로 압축하고,
+    읽을 때는 version 으로 codec 을 골라 이전 형식으로 저장된 값도 읽을 수 있습니다.
+    첫 바이트가 출력 가능한 ASCII 인 값은 version 도입 전 stdlib json 으로 저장된 값입니다.
+    """
+
+    def __init__(
+        self,
+        codec: CacheCodec,
+        compress_threshold: Optional[int] = CACHE_COMPRESS_THRESHOLD,
+        legacy_codecs: Iterable[CacheCodec] = (),
+    ) -> None:
+        self.codec = codec
+        self.compress_threshold = compress_threshold
+        self._codecs = {c.version: c for c in (*legacy_codecs, codec)}
+
+    def dumps(self, value: Any) -> bytes:
+        payload = self.codec.dumps(value)
+        header = self.codec.version
+        if self.compress_threshold is not None and len(payload) >= (
+            self.compress_threshold
+        ):
+            payload = zlib.compress(payload, 1)
+            header |= CACHE_FLAG_COMPRESSED
+        return bytes([header]) + payload
+
+    def loads(self, data: bytes) -> Any:
+        header = data[0]
+        if 0x20 <= header < CACHE_FLAG_COMPRESSED:
+            return json.loads(data)
+
+        codec = self._codecs.get(header & ~CACHE_FLAG_COMPRESSED)
+        if codec is None:
+            # 알 수 없는 형식은 캐시 miss 로 처리
+            logger.warning(f"[Cache] unknown cache value version: {header}")
+            return None
+        payload = data[1:]
+        if header & CACHE_FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        return codec.loads(payload)
+
+
+default_cache_serializer = CacheSerializer(OrjsonCacheCodec())
 
 
 class RedisManager:
-    """Redis 클라이언트 관리자 클래스"""
+    """
+    Redis 클라이언트 관리자 클래스
+    프로세스 전체에서 하나의 커넥션 풀을 공유하며, 모든 명령은 이벤트 루프를 막지 않는 async 로 실행합니다.
+    """
 
-    def __init__(self) -> None:
+    _pool: Optional[aioredis.ConnectionPool] = None  # type: ignore[type-arg]
+
+    def __init__(self, serializer: Optional[CacheSerializer] = None) -> None:
+        self.serializer = serializer or default_cache_serializer
         self.redis_host = getenv("REDIS_HOST", "localhost")
         self.redis_port = int(getenv("REDIS_PORT", 6379))
         self.redis_db = int(getenv("REDIS_DB", 0))
 
-    @contextmanager
-    def _get_redis_client(self) -> Iterator[redis.Redis]:  # type: ignore[type-arg]
-        client = (
-            fakeredis.FakeRedis()
-            if IS_TEST
-            else redis.Redis(
-                host=self.redis_host,
-                port=self.redis_port,
-                db=self.redis_db,
-                # decode_responses=True
-            )
+    @classmethod
+    def start(cls, max_connections: int = 50) -> None:
+        """앱 시작(lifespan) 시 커넥션 풀 생성"""
+        if cls._pool is not None or IS_TEST:
+            return
+        manager = cls()
+        cls._pool = aioredis.ConnectionPool(
+            host=manager.redis_host,
+            port=manager.redis_port,
+            db=manager.redis_db,
+            max_connections=max_connections,
         )
 
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pool is not None:
+            await cls._pool.disconnect()
+        cls._pool = None
+
+    @asynccontextmanager
+    async def _get_redis_client(self) -> AsyncIterator[aioredis.Redis]:  # type: ignore[type-arg]
+        if IS_TEST:
+            client = fakeredis.FakeAsyncRedis(server=FAKE_REDIS_SERVER)
+            try:
+                yield client
+            finally:
+                await client.aclose()  # type: ignore[attr-defined]
+            return
+
+        # lifespan 밖(스크립트 등)에서 호출되면 풀을 지연 생성
+        if RedisManager._pool is None:
+            RedisManager.start()
+        # 공유 풀을 사용하므로 클라이언트를 닫아도 연결은 풀로 반환됨
+        yield aioredis.Redis(connection_pool=RedisManager._pool)
+
+    def _loads(self, value: Optional[bytes]) -> Any:
+        return self.serializer.loads(value) if value else None
+
+    async def set_value(self, key: str, value: Any, expire: int = 60 * 60 * 7) -> None:
+        async with self._get_redis_client() as client:
+            await client.set(key, self.serializer.dumps(value), ex=expire)
+
+    async def set_value_if_absent(
+        self, key: str, value: Any, expire: Optional[int] = None
+    ) -> bool:
+        """키가 없을 때만 저장 (expire 가 없으면 만료되지 않음)"""
+        async with self._get_redis_client() as client:
+            return bool(
+                await client.set(key, self.serializer.dumps(value), ex=expire, nx=True)
+            )
+
+    async def set_value_if_counter_unchanged(
+        self,
+        key: str,
+        value: Any,
+        counter_key: str,
+        counter: Optional[int],
+        expire: int = 60 * 60 * 7,
+    ) -> bool:
+        """
+        counter_key 의 값이 counter 그대로일 때만 저장합니다. (없는 키는 None)
+        확인과 저장 사이에 counter_key 가 바뀌면(WATCH) 저장하지 않습니다.
+        """
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                try:
+                    await pipeline.watch(counter_key)
+                    current = await pipeline.get(counter_key)
+                    if (int(current) if current is not None else None) != counter:
+                        return False
+                    pipeline.multi()
+                    pipeline.set(key, self.serializer.dumps(value), ex=expire)
+                    await pipeline.execute()
+                except redis.WatchError:
+                    return False
+        return True
+
+    async def get_value(self, key: str) -> Any:
+        async with self._get_redis_client() as client:
+            return self._loads(await client.get(key))
+
+    async def get_values(self, keys: List[str]) -> List[Any]:
+        """MGET 으로 여러 키를 한 번에 조회 (없는 키는 None)"""
+        if not keys:
+            return []
+        async with self._get_redis_client() as client:
+            return [self._loads(value) for value in await client.mget(keys)]
+
+    async def set_values(
+        self, values: Dict[str, Any], expire: int = 60 * 60 * 7
+    ) -> None:
+        """파이프라인으로 여러 키를 한 번에 저장"""
+        if not values:
+            return
+        async with self._get_redis_client() as client:
+            pipeline = client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(key, self.serializer.dumps(value), ex=expire)
+            await pipeline.execute()
+
+    async def get_counter(self, key: str) -> Optional[int]:
+        """INCRBY 로 변경되는 정수 값은 직렬화 없이 그대로 저장/조회"""
+        async with self._get_redis_client() as client:
+            value = await client.get(key)
+            return int(value) if value is not None else None
+
+    async def get_counters(self, keys: List[str]) -> List[Optional[int]]:
+        if not keys:
+            return []
+        async with self._get_redis_client() as client:
+            return [
+                int(value) if value is not None else None
+                for value in await client.mget(keys)
+            ]
+
+    async def set_counters(
+        self, values: Dict[str, int], expire: int = 60 * 60 * 7
+    ) -> None:
+        if not values:
+            return
+        async with self._get_redis_client() as client:
+            pipeline = client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(key, int(value), ex=expire)
+            await pipeline.execute()
+
+    async def set_counter(
+        self, key: str, value: int, expire: int = 60 * 60 * 7
+    ) -> None:
+        await self.set_counters({key: value}, expire=expire)
+
+    async def get_values_with_ttl(
+        self, keys: List[str], counter: bool = False
+    ) -> List[Tuple[Any, float]]:
+        """
+        여러 키의 (값, 남은 만료 시간(초)) 을 파이프라인 1회로 조회합니다.
+        없는 키는 (None, 0), 만료 시간이 없는 키는 (값, inf) 입니다.
+        counter 가 True 면 set_counter 로 저장한 정수 값으로 읽습니다.
+        """
+        if not keys:
+            return []
+        async with self._get_redis_client() as client:
+            pipeline = client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.get(key)
+                pipeline.pttl(key)
+            results = await pipeline.execute()
+
+        values = []
+        for value, pttl in zip(results[::2], results[1::2]):
+            if value is None:
+                values.append((None, 0.0))
+                continue
+            loaded = int(value) if counter else self._loads(value)
+            values.append((loaded, pttl / 1000 if pttl >= 0 else float("inf")))
+        return values
+
+    async def acquire_locks(
+        self, keys: List[str], token: str, expire: float
+    ) -> List[bool]:
+        """SET NX 로 여러 잠금을 한 번에 시도 (expire 초 뒤 자동 해제)"""
+        if not keys:
+            return []
+        async with self._get_redis_client() as client:
+            pipeline = client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.set(key, token, px=int(expire * 1000), nx=True)
+            return [bool(result) for result in await pipeline.execute()]
+
+    async def release_locks(self, keys: List[str], token: str) -> None:
+        """token 으로 잡은 잠금만 해제 (만료 후 다른 워커가 잡은 잠금은 그대로 둠)"""
+        if not keys:
+            return
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                try:
+                    await pipeline.watch(*keys)
+                    owned_keys = [
+                        key
+                        for key, value in zip(keys, await pipeline.mget(keys))
+                        if value is not None and value.decode() == token
+                    ]
+                    if not owned_keys:
+                        return
+                    pipeline.multi()
+                    pipeline.delete(*owned_keys)
+                    await pipeline.execute()
+                except redis.WatchError:
+                    # 그 사이 잠금이 바뀌었으면 만료되도록 둔다
+                    pass
+
+    @asynccontextmanager
+    async def hold_lock(self, key: str, expire: float) -> AsyncIterator[bool]:
+        """
+        잠금을 한 번 시도하고 획득 여부를 반환합니다. (여러 워커의 스케줄러 작업 중복 실행 방지)
+        블록이 끝나면 직접 잡은 잠금만 해제합니다.
+        """
+        token = uuid.uuid4().hex
+        acquired = (await self.acquire_locks([key], token, expire))[0]
         try:
-            yield client
+            yield acquired
         finally:
-            # 필요에 따라 연결 해제 또는 추가 정리 작업을 수행
-            client.close()
+            if acquired:
+                await self.release_locks([key], token)
+
+    async def delete_hash_fields(self, key: str, fields: List[str]) -> None:
+        if not fields:
+            return
+        async with self._get_redis_client() as client:
+            await client.hdel(key, *fields)
+
+    async def delete_value(self, key: str) -> None:
+        async with self._get_redis_client() as client:
+            await client.delete(key)
+
+    async def delete_values(self, keys: List[str]) -> None:
+        if not keys:
+            return
+        async with self._get_redis_client() as client:
+            await client.delete(*keys)
+
+    async def delete_values_by_pattern(self, pattern: str) -> None:
+        """SCAN 으로 pattern 에 맞는 키를 찾아 삭제 (KEYS 와 달리 서버를 막지 않음)"""
+        async with self._get_redis_client() as client:
+            keys = [key async for key in client.scan_iter(match=pattern, count=500)]
+            if keys:
+                await client.delete(*keys)
+
+    async def publish(self, channel: str, message: Any) -> None:
+        async with self._get_redis_client() as client:
+            await client.publish(channel, self.serializer.dumps(message))
+
+    @asynccontextmanager
+    async def subscribe(self, *channels: str) -> AsyncIterator[Any]:
+        """
+        채널을 구독하는 PubSub 을 반환합니다. (구독 중에는 연결 하나를 점유)
+        메시지 data 는 publish 로 직렬화된 값이므로 load_message 로 읽습니다.
+        """
+        async with self._get_redis_client() as client:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*channels)
+                yield pubsub
+            finally:
+                await pubsub.aclose()  # type: ignore[attr-defined]
+
+    def load_message(self, data: bytes) -> Any:
+        return self._loads(data)
+
+    def _load_stream_entries(
+        self, entries: List[Tuple[bytes, Optional[Dict[bytes, bytes]]]]
+    ) -> List[Tuple[str, Any]]:
+        return [
+            (entry_id.decode(), self._loads((fields or {}).get(b"data")))
+            for entry_id, fields in entries
+        ]
+
+    async def add_stream_entry(self, key: str, value: Any, max_len: int) -> str:
+        """스트림 끝에 값을 추가 (max_len 을 넘으면 오래된 항목부터 대략적으로 잘라냄)"""
+        async with self._get_redis_client() as client:
+            entry_id = await client.xadd(
+                key,
+                {"data": self.serializer.dumps(value)},
+                maxlen=max_len,
+                approximate=True,
+            )
+            return str(entry_id.decode())
+
+    async def create_stream_group(self, key: str, group: str) -> None:
+        """소비자 그룹을 생성 (스트림이 없으면 함께 생성, 이미 있으면 무시)"""
+        async with self._get_redis_client() as client:
+            try:
+                await client.xgroup_create(key, group, id="0", mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def read_stream_group(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        count: int,
+        block: Optional[int] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        그룹에 아직 전달되지 않은 항목을 consumer 에게 가져옵니다. (block 밀리초까지 대기)
+        가져온 항목은 ack_stream_entries 를 호출할 때까지 pending 으로 남습니다.
+        """
+        async with self._get_redis_client() as client:
+            response = await client.xreadgroup(
+                group, consumer, {key: ">"}, count=count, block=block
+            )
+        if not response:
+            return []
+        return self._load_stream_entries(response[0][1])
+
+    async def claim_stream_entries(
+        self, key: str, group: str, consumer: str, min_idle_time: float, count: int
+    ) -> List[Tuple[str, Any]]:
+        """
+        min_idle_time 초 넘게 ack 되지 않은 pending 항목을 consumer 가 가져옵니다.
+        (처리 중에 종료된 워커가 남긴 항목을 다른 워커가 다시 처리)
+        """
+        async with self._get_redis_client() as client:
+            response = await client.xautoclaim(
+                key,
+                group,
+                consumer,
+                min_idle_time=int(min_idle_time * 1000),
+                start_id="0-0",
+                count=count,
+            )
+        return self._load_stream_entries(response[1])
+
+    async def ack_stream_entries(
+        self,
+        key: str,
+        group: str,
+        entry_ids: List[str],
+        dead_letter_key: Optional[str] = None,
+        dead_letter_values: Optional[List[Any]] = None,
+    ) -> None:
+        """
+        처리를 마친 항목을 ack 하고 스트림에서 삭제합니다.
+        dead_letter_key 가 있으면 dead_letter_values 를 그 스트림에 함께(원자적으로) 옮깁니다.
+        """
+        if not entry_ids:
+            return
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                pipeline.xack(key, group, *entry_ids)
+                pipeline.xdel(key, *entry_ids)
+                if dead_letter_key is not None:
+                    for value in dead_letter_values or []:
+                        pipeline.xadd(
+                            dead_letter_key, {"data": self.serializer.dumps(value)}
+                        )
+                await pipeline.execute()
+
+    async def increment_value(self, key: str, amount: int = 1) -> int:
+        async with self._get_redis_client() as client:
+            return int(await client.incr(key, amount))
+
+    async def increment_existing_value(self, key: str, amount: int = 1) -> None:
+        """
+        키가 있을 때만 증가시킵니다. (만료된 키가 INCR 로 TTL 없이 다시 생기는 것을 방지)
+        동시에 변경되면 키를 삭제해 다음 조회 때 다시 계산되도록 합니다.
+        """
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                try:
+                    await pipeline.watch(key)
+                    if not await pipeline.exists(key):
+                        return
+                    pipeline.multi()
+                    pipeline.incrby(key, amount)
+                    await pipeline.execute()
+                except redis.WatchError:
+                    await client.delete(key)
+
+    async def add_to_sorted_set(self, key: str, mapping: Dict[str, float]) -> None:
+        async with self._get_redis_client() as client:
+            await client.zadd(key, mapping)
+
+    async def get_sorted_set_members_by_score(
+        self, key: str, max_score: float, limit: int
+    ) -> List[str]:
+        async with self._get_redis_client() as client:
+            members = await client.zrangebyscore(
+                key, "-inf", max_score, start=0, num=limit
+            )
+            return [member.decode() for member in members]
+
+    async def increment_sorted_set_score(
+        self, key: str, member: str, amount: float
+    ) -> None:
+        async with self._get_redis_client() as client:
+            await client.zincrby(key, amount, member)
+
+    async def increment_sorted_set_score_by_epoch(
+        self,
+        key: str,
+        member: str,
+        epoch_key: str,
+        get_amount: Callable[[float], float],
+        default_epoch: float,
+        min_score: Optional[float] = None,
+        max_attempts: int = 5,
+    ) -> bool:
+        """
+        epoch_key 의 값으로 get_amount(epoch) 를 계산해 점수를 증가시킵니다.
+        (epoch 가 없으면 default_epoch 로 함께 저장)
+        계산한 뒤 증가시키기 전에 epoch 가 바뀌면(WATCH) 새 epoch 로 다시 계산합니다.
+        min_score 가 있으면 증가시킨 점수가 그보다 작을 때 min_score 로 맞춥니다. (ZADD GT)
+        :return: max_attempts 번 모두 epoch 가 바뀌어 반영하지 못하면 False
+        """
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                for _ in range(max_attempts):
+                    try:
+                        await pipeline.watch(epoch_key)
+                        epoch = self._loads(await pipeline.get(epoch_key))
+                        pipeline.multi()
+                        if epoch is None:
+                            epoch = default_epoch
+                            pipeline.set(epoch_key, self.serializer.dumps(epoch))
+                        pipeline.zincrby(key, get_amount(epoch), member)
+                        if min_score is not None:
+                            pipeline.zadd(key, {member: min_score}, gt=True)
+                        await pipeline.execute()
+                        return True
+                    except redis.WatchError:
+                        continue
+        return False
+
+    async def get_sorted_set_members_by_rank(
+        self, key: str, start: int, end: int
+    ) -> List[str]:
+        """점수 내림차순으로 start ~ end 순위(0부터, end 포함)의 멤버 조회"""
+        async with self._get_redis_client() as client:
+            return [
+                member.decode() for member in await client.zrevrange(key, start, end)
+            ]
+
+    async def get_sorted_set_size(self, key: str) -> int:
+        async with self._get_redis_client() as client:
+            return int(await client.zcard(key))
+
+    async def rebase_sorted_set(
+        self,
+        key: str,
+        epoch_key: str,
+        epoch: float,
+        get_factor: Callable[[float], float],
+        max_size: int,
+    ) -> bool:
+        """
+        epoch_key 를 epoch 로 바꾸면서 모든 점수에 get_factor(기존 epoch) 를 곱하고 상위 max_size 개만 남깁니다.
+        epoch 교체와 점수 변경은 같은 트랜잭션(MULTI)에서 실행되며,
+        그 사이 다른 곳에서 epoch 를 바꿨으면(WATCH) 중복으로 곱하지 않도록 아무것도 하지 않습니다.
+        :return: 반영했으면 True, epoch 가 없거나 바뀌어서 건너뛰었으면 False
+        """
+        async with self._get_redis_client() as client:
+            async with client.pipeline() as pipeline:
+                try:
+                    await pipeline.watch(epoch_key)
+                    old_epoch = self._loads(await pipeline.get(epoch_key))
+                    if old_epoch is None:
+                        return False
+                    pipeline.multi()
+                    pipeline.zunionstore(key, {key: get_factor(old_epoch)})
+                    pipeline.zremrangebyrank(key, 0, -(max_size + 1))
+                    pipeline.set(epoch_key, self.serializer.dumps(epoch))
+                    await pipeline.execute()
+                except redis.WatchError:
+                    return False
+        return True
+
+    async def remove_from_sorted_set(self, key: str, *members: str) -> None:
+        async with self._get_redis_client() as client:
+            await client.zrem(key, *members)
+
+    async def increment_hash_value(self, key: str, field: str, amount: int = 1) -> int:
+        async with self._get_redis_client() as client:
+            return int(await client.hincrby(key, field, amount))
 
-    def set_value(self, key: str, value: Any, expire: int = 60 * 60 * 7) -> None:
-        with self._get_redis_client() as client:
-            client.set(key, json.dumps(value), ex=expire)
+    async def get_hash_int_values(
+        self, keys: List[str], field_list: List[str]
+    ) -> List[int]:
+        """여러 hash 에서 같은 field 값을 합산해 조회 (없는 값은 0)"""
+        async with self._get_redis_client() as client:
+            pipeline = client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.hmget(key, field_list)
+            totals = [0] * len(field_list)
+            for values in await pipeline.execute():
+                for index, value in enumerate(values):
+                    totals[index] += int(value) if value else 0
+            return totals
 
-    def get_value(self, key: str) -> Any:
-        with self._get_redis_client() as client:
-            value = client.get(key)
-            return json.loads(value) if value else None
+    async def get_hash_all_int(self, key: str) -> Dict[str, int]:
+        async with self._get_redis_client() as client:
+            return {
+                field.decode(): int(value)
+                for field, value in (await client.hgetall(key)).items()
+            }
 
-    def delete_value(self, key: str) -> None:
-        with self._get_redis_client() as client:
-            client.delete(key)
+    async def rename_key_if_absent(self, key: str, new_key: str) -> bool:
+        """key 가 있고 new_key 가 없을 때만 이름을 변경"""
+        async with self._get_redis_client() as client:
+            if not await client.exists(key):
+                return False
+            return bool(await client.renamenx(key, new_key))
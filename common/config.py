@@ -27,6 +27,9 @@ IS_TEST = APP_ENV == APP_ENV_TEST
 
 LOGIN_REDIRECT_URL = getenv("LOGIN_REDIRECT_URL", default="http://localhost:3000")
 
+# 파티 삭제 시 즉시 삭제 대신 삭제 표시 후 스케줄러에서 정리
+PARTY_SOFT_DELETE = getenv("PARTY_SOFT_DELETE", "false").lower() == "true"
+
 # S3
 S3_BUCKET = "buooy"
 AWS_REGION = "ap-northeast-2"
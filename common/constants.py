@@ -30,5 +30,11 @@ NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_REJECTED = "participation_rejected"
 NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CANCELED = "participation_cancel"
 NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED = "participation_closed"
 
+# PAGINATION
+HEADER_NEXT_CURSOR = "X-Next-Cursor"
+
 # COMMUNITY
 VIEW_COUNT_UPDATE_THRESHOLD = 10
+COMMENT_PAGE_SIZE = 20  # 댓글 한 페이지 개수
+REPLY_PREVIEW_SIZE = 3  # 댓글 목록에 함께 내려주는 대댓글 개수
+REPLY_PAGE_SIZE = 20  # 대댓글 더보기 한 페이지 개수
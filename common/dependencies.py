@@ -1,16 +1,29 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from starlette.requests import Request
-from users.models import AdminUser
+from users.models import AdminUser, User
+from users.utils import user_cache
 from common.utils import verify_password
 
 security = HTTPBasic()
 
 
+async def get_request_user(request: Request) -> Optional[User]:
+    """
+    AuthMiddleware 가 검증한 토큰의 사용자 (없으면 None)
+    처음 호출될 때 사용자 캐시에서 조회해 request.state.user 에 저장합니다.
+    """
+    state = request.state
+    if not hasattr(state, "user"):
+        user_id = getattr(state, "user_id", None)
+        state.user = await user_cache.get(user_id) if user_id else None
+    return state.user
+
+
 async def get_current_user(request: Request):
-    user = request.state.user
+    user = await get_request_user(request)
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     return user
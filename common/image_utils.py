@@ -0,0 +1,94 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps
+
+# 업로드 허용 이미지 포맷 (Pillow 포맷 이름)
+ALLOWED_IMAGE_FORMATS = {"JPEG", "PNG", "WEBP", "GIF", "BMP", "MPO"}
+# 디코딩 폭탄 방지를 위한 최대 픽셀 수 (약 8000 x 5000)
+IMAGE_MAX_PIXELS = 40_000_000
+
+IMAGE_DERIVATIVE_THUMBNAIL = "thumbnail"
+IMAGE_DERIVATIVE_WEBP = "webp"
+# 파생 이미지 이름별 긴 변 최대 길이(px)
+IMAGE_DERIVATIVE_MAX_SIZES = {
+    IMAGE_DERIVATIVE_THUMBNAIL: 400,
+    IMAGE_DERIVATIVE_WEBP: 1920,
+}
+IMAGE_WEBP_QUALITY = 80
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+def build_image_derivatives(data: bytes) -> Dict[str, bytes]:
+    """
+    이미지를 디코딩/검증한 뒤 리사이즈한 WebP 파생 이미지를 생성합니다.
+    프로세스 풀에서 실행되므로 인자와 반환값은 bytes 만 사용합니다.
+    :return: {파생 이미지 이름: WebP bytes}
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.format not in ALLOWED_IMAGE_FORMATS:
+                raise InvalidImageError(f"Unsupported image format: {image.format}")
+            if image.width * image.height > IMAGE_MAX_PIXELS:
+                raise InvalidImageError(
+                    f"Image is too large: {image.width}x{image.height}"
+                )
+            image.verify()
+
+        # verify 이후에는 이미지를 다시 열어야 디코딩할 수 있음
+        with Image.open(io.BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+            derivatives = {}
+            for name, max_size in IMAGE_DERIVATIVE_MAX_SIZES.items():
+                resized = image.copy()
+                resized.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                resized.save(buffer, "WEBP", quality=IMAGE_WEBP_QUALITY)
+                derivatives[name] = buffer.getvalue()
+    except InvalidImageError:
+        raise
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError) as e:
+        raise InvalidImageError(f"Invalid image: {e}")
+
+    return derivatives
+
+
+class ImageProcessPool:
+    """이미지 디코딩/리사이즈(CPU 작업)를 이벤트 루프 밖의 프로세스 풀에서 실행"""
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        # 이벤트 루프/DB 커넥션 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    async def build_derivatives(self, data: bytes) -> Dict[str, bytes]:
+        """풀이 시작되지 않았으면(스크립트, 테스트 등) 스레드에서 실행합니다."""
+        if self._executor is None:
+            return await asyncio.to_thread(build_image_derivatives, data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, build_image_derivatives, data)
+
+
+image_process_pool = ImageProcessPool()
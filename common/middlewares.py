@@ -1,49 +1,58 @@
 from fastapi import Request, Response, FastAPI
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
-from users.models import User
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # from jwt import decode, PyJWTError
 from jose import JWTError, jwt, ExpiredSignatureError
 from common.config import SECRET_KEY, ALGORITHM
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, Optional
 from fastapi.responses import JSONResponse
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        token = request.headers.get("Authorization")
-        request.state.user = None
+class AuthMiddleware:
+    """
+    Authorization 헤더의 토큰을 검증하고 user_id 만 request.state 에 저장합니다.
+    사용자 조회는 get_request_user 를 처음 호출할 때 사용자 캐시를 거쳐 실행되므로
+    사용자가 필요 없는 요청에서는 DB 를 조회하지 않습니다.
+    BaseHTTPMiddleware 의 task/stream 오버헤드가 없도록 ASGI 미들웨어로 구현합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get("Authorization")
+        user_id = None
+        error_response: Optional[JSONResponse] = None
         if token and token.startswith("Bearer "):
             try:
                 token = token.split(" ")[1]
                 payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
                 user_id = payload.get("user_id")
-                if user_id:
-                    request.state.user = await User.get_or_none(id=user_id)
-            # except PyJWTError as e:
-            # except JWTError as e:
-            #     raise HTTPException(
-            #         status_code=403, detail=f"Could not validate credentials, msg-{e}"
-            #     )
             except ExpiredSignatureError:
-                return JSONResponse(
+                error_response = JSONResponse(
                     status_code=403, content={"detail": "Token has expired"}
                 )
             except JWTError as e:
-                return JSONResponse(
+                error_response = JSONResponse(
                     status_code=403,
                     content={"detail": f"Could not validate credentials: {str(e)}"},
                 )
             except Exception as e:
-                return JSONResponse(
+                error_response = JSONResponse(
                     status_code=403, content={"detail": f"An error occurred: {str(e)}"}
                 )
-            # except Exception as e:
-            #     raise HTTPException(status_code=403, detail=str(e))
-        response = await call_next(request)
-        return response
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["user_id"] = user_id
+        await self.app(scope, receive, send)
 
 
 class LimitUploadSizeMiddleware(BaseHTTPMiddleware):
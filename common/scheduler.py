@@ -1,16 +1,78 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from parties.utils import inactive_expired_parties
+from apscheduler.triggers.interval import IntervalTrigger
+from community.utils import (
+    flush_post_view_counts,
+    rebase_post_trending_scores,
+    refresh_tag_cache,
+)
+from parties.utils import (
+    inactive_expired_parties,
+    purge_deleted_parties,
+    refresh_party_approved_counts,
+    sync_party_expiry_queue,
+)
 
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
 
 def start_scheduler() -> None:
+    scheduler.add_job(
+        sync_party_expiry_queue,  # 서버 시작 시 1회 실행
+        id="sync_party_expiry_queue",
+        name="Sync party expiry queue",
+        replace_existing=True,
+    )
     scheduler.add_job(
         inactive_expired_parties,
-        CronTrigger(hour=0, minute=0),  # 매일 밤 12시에 실행
+        IntervalTrigger(minutes=1),  # 매분 실행
         id="inactive_expired_parties",
         name="Inactivate expired parties",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        refresh_party_approved_counts,
+        CronTrigger(hour=4, minute=0),  # 매일 새벽 4시에 실행
+        id="refresh_party_approved_counts",
+        name="Recalculate party approved counts",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        purge_deleted_parties,
+        IntervalTrigger(minutes=5),  # 5분마다 실행
+        id="purge_deleted_parties",
+        name="Purge soft-deleted parties",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        flush_post_view_counts,
+        IntervalTrigger(minutes=1),  # 매분 실행
+        id="flush_post_view_counts",
+        name="Flush post view counts",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        rebase_post_trending_scores,
+        IntervalTrigger(hours=1),  # 매시간 실행
+        id="rebase_post_trending_scores",
+        name="Rebase post trending scores",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        refresh_tag_cache,
+        IntervalTrigger(minutes=1),  # 매분 실행, 다른 워커에서 변경된 태그 반영
+        id="refresh_tag_cache",
+        name="Refresh tag cache",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
     )
     scheduler.start()
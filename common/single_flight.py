@@ -0,0 +1,219 @@
+import asyncio
+import functools
+import math
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+from common.cache_constants import (
+    CACHE_KEY_RECOMPUTE_LOCK,
+    RECOMPUTE_LOCK_EXPIRE_TIME,
+    RECOMPUTE_LOCK_WAIT_TIME,
+)
+from common.cache_utils import RedisManager
+
+# 키 목록을 받아 {키: 값} 을 계산하는 함수 (한 번의 쿼리로 여러 키를 계산할 수 있도록)
+BatchLoader = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class SingleFlight:
+    """
+    워커 안에서 같은 키에 대한 동시 계산을 한 번으로 합칩니다.
+    먼저 요청한 쪽이 계산을 시작하고, 계산 중에 들어온 요청은 같은 future 를 기다립니다.
+    계산은 별도 task 로 실행되므로 먼저 요청한 쪽이 취소되어도 기다리던 요청은 결과를 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._futures: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    async def do_many(self, keys: List[str], loader: BatchLoader) -> Dict[str, Any]:
+        """
+        keys 중 계산 중이 아닌 키만 loader 한 번으로 계산합니다.
+        loader 결과에 없는 키는 None 으로 반환됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, "asyncio.Future[Any]"] = {}
+        own_futures: Dict[str, "asyncio.Future[Any]"] = {}
+        for key in dict.fromkeys(keys):
+            future = self._futures.get(key)
+            if future is None:
+                future = own_futures[key] = self._futures[key] = loop.create_future()
+            futures[key] = future
+
+        if own_futures:
+            task = asyncio.ensure_future(loader(list(own_futures)))
+            task.add_done_callback(functools.partial(self._resolve, own_futures))
+
+        return {key: await asyncio.shield(future) for key, future in futures.items()}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        async def batch_loader(keys: List[str]) -> Dict[str, Any]:
+            return {key: await loader()}
+
+        return (await self.do_many([key], batch_loader))[key]
+
+    def _resolve(
+        self, futures: Dict[str, "asyncio.Future[Any]"], task: "asyncio.Task[Any]"
+    ) -> None:
+        for key, future in futures.items():
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())  # type: ignore[arg-type]
+            else:
+                future.set_result(task.result().get(key))
+
+
+def should_refresh_early(ttl: float, delta: float, beta: float = 1.0) -> bool:
+    """
+    XFetch(확률적 조기 갱신): 만료가 가까울수록, 재계산 시간(delta)이 길수록 높은 확률로 True
+    만료 시점에 요청이 한꺼번에 몰리지 않도록 미리 한 요청만 다시 계산하게 합니다.
+    """
+    # random() 이 0 이면 log 를 계산할 수 없으므로 (0, 1] 범위로 변환
+    return ttl <= -delta * beta * math.log(1.0 - random.random())
+
+
+class SingleFlightCache:
+    """
+    Redis 캐시 miss 시 재계산을 키마다 한 번으로 제한합니다.
+    - 워커 안: SingleFlight 로 동시 요청이 같은 계산을 기다림
+    - 워커 간: 짧은 Redis 잠금을 얻은 워커만 계산하고, 나머지는 저장될 때까지 잠시 기다림
+    - 만료 전: XFetch 로 뽑힌 요청이 잠금을 얻은 경우에만 미리 갱신 (나머지는 기존 값 사용)
+    counter 가 True 면 INCRBY 로 변경되는 정수 값(set_counters)으로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        expire: int,
+        counter: bool = False,
+        beta: float = 1.0,
+        lock_expire: float = RECOMPUTE_LOCK_EXPIRE_TIME,
+        lock_wait_time: float = RECOMPUTE_LOCK_WAIT_TIME,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.expire = expire
+        self.counter = counter
+        self.beta = beta
+        self.lock_expire = lock_expire
+        self.lock_wait_time = lock_wait_time
+        self.poll_interval = poll_interval
+        self.single_flight = SingleFlight()
+        # 이 워커에서 측정한 최근 재계산 시간(초), XFetch 의 delta 로 사용
+        self.recompute_time = 0.0
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        async def batch_loader(keys: List[str]) -> Dict[str, Any]:
+            return {key: await loader()}
+
+        return (await self.get_many([key], batch_loader))[key]
+
+    async def get_many(self, keys: List[str], loader: BatchLoader) -> Dict[str, Any]:
+        """
+        캐시된 값을 한 번에 조회하고, 없는 키만 loader 한 번으로 계산해 저장합니다.
+        loader 는 요청한 모든 키의 값을 반환해야 합니다.
+        """
+        redis = RedisManager()
+        values: Dict[str, Any] = {}
+        missed_keys = []
+        early_keys = []
+        for key, (value, ttl) in zip(
+            keys, await redis.get_values_with_ttl(keys, counter=self.counter)
+        ):
+            if value is None:
+                missed_keys.append(key)
+                continue
+            values[key] = value
+            if should_refresh_early(ttl, self.recompute_time, self.beta):
+                early_keys.append(key)
+
+        if missed_keys:
+            values.update(
+                await self.single_flight.do_many(
+                    missed_keys,
+                    functools.partial(self._recompute, loader=loader, wait=True),
+                )
+            )
+            # 만료 직전에 시작된 조기 갱신(잠금 실패 시 값 없음)을 함께 기다린 키는 직접 계산
+            unresolved_keys = [key for key in missed_keys if values[key] is None]
+            if unresolved_keys:
+                values.update(await self._load_and_store(unresolved_keys, loader))
+        if early_keys:
+            refreshed = await self.single_flight.do_many(
+                early_keys,
+                functools.partial(self._recompute, loader=loader, wait=False),
+            )
+            values.update(
+                {key: value for key, value in refreshed.items() if value is not None}
+            )
+        return values
+
+    async def _recompute(
+        self, keys: List[str], loader: BatchLoader, wait: bool
+    ) -> Dict[str, Any]:
+        """
+        잠금을 얻은 키만 계산해 저장합니다.
+        wait 가 True 면 다른 워커가 계산 중인 키는 저장될 때까지 기다리고,
+        기다려도 저장되지 않으면 직접 계산합니다.
+        """
+        redis = RedisManager()
+        token = uuid.uuid4().hex
+        lock_keys = {key: CACHE_KEY_RECOMPUTE_LOCK.format(key=key) for key in keys}
+        acquired = await redis.acquire_locks(
+            list(lock_keys.values()), token, self.lock_expire
+        )
+        locked_keys = [key for key, locked in zip(keys, acquired) if locked]
+
+        values: Dict[str, Any] = {}
+        if locked_keys:
+            try:
+                values = await self._load_and_store(locked_keys, loader)
+            finally:
+                await redis.release_locks(
+                    [lock_keys[key] for key in locked_keys], token
+                )
+
+        waiting_keys = [key for key in keys if key not in values]
+        if wait and waiting_keys:
+            values.update(await self._wait_for_values(waiting_keys, loader))
+        return values
+
+    async def _wait_for_values(
+        self, keys: List[str], loader: BatchLoader
+    ) -> Dict[str, Any]:
+        redis = RedisManager()
+        values: Dict[str, Any] = {}
+        deadline = time.monotonic() + self.lock_wait_time
+        while keys and time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            for key, (value, _) in zip(
+                keys, await redis.get_values_with_ttl(keys, counter=self.counter)
+            ):
+                if value is not None:
+                    values[key] = value
+            keys = [key for key in keys if key not in values]
+
+        if keys:
+            # 잠금을 잡은 워커가 실패했거나 너무 오래 걸리면 직접 계산
+            values.update(await self._load_and_store(keys, loader))
+        return values
+
+    async def _load_and_store(
+        self, keys: List[str], loader: BatchLoader
+    ) -> Dict[str, Any]:
+        redis = RedisManager()
+        started_at = time.monotonic()
+        values = await loader(keys)
+        self.recompute_time = time.monotonic() - started_at
+
+        stored_values = {key: values[key] for key in keys if values.get(key) is not None}
+        if self.counter:
+            await redis.set_counters(stored_values, expire=self.expire)
+        else:
+            await redis.set_values(stored_values, expire=self.expire)
+        return values
@@ -0,0 +1,284 @@
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from common.cache_constants import (
+    CACHE_CHANNEL_TWO_TIER_INVALIDATION,
+    CACHE_EXPIRE_TIME,
+    CACHE_KEY_TWO_TIER,
+    CACHE_KEY_TWO_TIER_GENERATION,
+    TWO_TIER_LOCAL_EXPIRE_TIME,
+    TWO_TIER_LOCAL_MAX_SIZE,
+)
+from common.cache_utils import RedisManager
+from common.config import IS_TEST, logger
+
+# 네임스페이스별 워커 메모리 캐시 삭제 함수 (key 가 None 이면 전체 삭제)
+LocalInvalidator = Callable[[Optional[str]], None]
+_local_invalidators: Dict[str, LocalInvalidator] = {}
+_two_tier_caches: Dict[str, "TwoTierCache"] = {}
+
+_MISSING = object()
+
+
+def register_local_invalidator(namespace: str, invalidator: LocalInvalidator) -> None:
+    """다른 워커에서 publish_cache_invalidation 을 호출하면 invalidator 가 실행됩니다."""
+    _local_invalidators[namespace] = invalidator
+
+
+async def publish_cache_invalidation(namespace: str, key: Optional[str] = None) -> None:
+    """모든 워커에 namespace(의 key) 워커 메모리 캐시 삭제를 알립니다."""
+    try:
+        await RedisManager().publish(
+            CACHE_CHANNEL_TWO_TIER_INVALIDATION, {"namespace": namespace, "key": key}
+        )
+    except Exception as e:
+        # 전달되지 않아도 다른 워커의 캐시는 TTL 이 지나면 만료됨
+        logger.warning(f"[Cache] failed to publish invalidation({namespace}): {e}")
+
+
+def clear_local_caches() -> None:
+    for invalidator in _local_invalidators.values():
+        invalidator(None)
+
+
+class LocalLRUCache:
+    """워커(프로세스) 메모리 캐시. 항목마다 TTL 이 있고 max_size 를 넘으면 가장 오래 안 쓴 항목부터 제거"""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """없거나 만료된 키는 default 를 반환"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class TwoTierCache:
+    """
+    워커 메모리(LocalLRUCache) -> Redis -> loader 순서로 조회하는 캐시
+    거의 바뀌지 않는 조회 결과(JSON 으로 직렬화 가능한 값)에만 사용합니다.
+    None 은 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local_ttl: float = TWO_TIER_LOCAL_EXPIRE_TIME,
+        redis_ttl: int = CACHE_EXPIRE_TIME,
+        max_size: int = TWO_TIER_LOCAL_MAX_SIZE,
+    ) -> None:
+        if namespace in _two_tier_caches:
+            raise ValueError(f"Two tier cache namespace already exists: {namespace}")
+        self.namespace = namespace
+        self.redis_ttl = redis_ttl
+        self.local = LocalLRUCache(max_size=max_size, ttl=local_ttl)
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        _two_tier_caches[namespace] = self
+        register_local_invalidator(namespace, self.invalidate_local)
+
+    def _redis_key(self, key: str) -> str:
+        return CACHE_KEY_TWO_TIER.format(namespace=self.namespace, key=key)
+
+    @property
+    def _generation_key(self) -> str:
+        return CACHE_KEY_TWO_TIER_GENERATION.format(namespace=self.namespace)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        loader 실행 중에 invalidate 되면(네임스페이스 generation 이 바뀌면) 결과를 반환만 하고
+        캐시에는 저장하지 않습니다. (무효화 전 데이터로 만든 값이 redis_ttl 동안 남지 않도록)
+        """
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self.local_hits += 1
+            return value
+
+        redis = RedisManager()
+        value = await redis.get_value(self._redis_key(key))
+        if value is not None:
+            self.redis_hits += 1
+            self.local.set(key, value)
+            return value
+
+        self.misses += 1
+        generation = await redis.get_counter(self._generation_key)
+        value = await loader()
+        if value is not None and await redis.set_value_if_counter_unchanged(
+            self._redis_key(key),
+            value,
+            counter_key=self._generation_key,
+            counter=generation,
+            expire=self.redis_ttl,
+        ):
+            self.local.set(key, value)
+        return value
+
+    def invalidate_local(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self.local.clear()
+        else:
+            self.local.delete(key)
+
+    async def invalidate(self, key: Optional[str] = None) -> None:
+        """Redis 와 모든 워커의 캐시를 삭제합니다. (key 가 None 이면 네임스페이스 전체)"""
+        redis = RedisManager()
+        # 먼저 generation 을 올려 진행 중인 loader 가 이전 값을 다시 저장하지 못하게 함
+        await redis.increment_value(self._generation_key)
+        if key is None:
+            await redis.delete_values_by_pattern(self._redis_key("*"))
+        else:
+            await redis.delete_value(self._redis_key(key))
+        self.invalidate_local(key)
+        await publish_cache_invalidation(self.namespace, key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": (
+                round((self.local_hits + self.redis_hits) / requests, 4)
+                if requests
+                else 0.0
+            ),
+            "local_size": len(self.local),
+            "local_max_size": self.local.max_size,
+            "local_evictions": self.local.evictions,
+        }
+
+
+def get_two_tier_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """이 워커의 네임스페이스별 캐시 적중 통계"""
+    return {
+        namespace: cache.get_stats() for namespace, cache in _two_tier_caches.items()
+    }
+
+
+class TwoTierCachedFunction:
+    """two_tier_cached 로 감싼 함수. 위치 인자를 ':' 로 이어 캐시 키로 사용합니다."""
+
+    def __init__(
+        self, func: Callable[..., Awaitable[Any]], cache: TwoTierCache
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.cache = cache
+
+    @staticmethod
+    def build_key(*args: Any) -> str:
+        return ":".join(str(arg) for arg in args) or "_"
+
+    async def __call__(self, *args: Any) -> Any:
+        return await self.cache.get_or_load(
+            self.build_key(*args), lambda: self.func(*args)
+        )
+
+    async def invalidate(self, *args: Any) -> None:
+        """인자가 없으면 모든 인자의 캐시를 삭제"""
+        await self.cache.invalidate(self.build_key(*args) if args else None)
+
+
+def two_tier_cached(
+    namespace: str,
+    local_ttl: float = TWO_TIER_LOCAL_EXPIRE_TIME,
+    redis_ttl: int = CACHE_EXPIRE_TIME,
+    max_size: int = TWO_TIER_LOCAL_MAX_SIZE,
+) -> Callable[[Callable[..., Awaitable[Any]]], TwoTierCachedFunction]:
+    """
+    async 함수의 결과를 워커 메모리 + Redis 에 캐시합니다.
+    인자는 str/int 처럼 str() 로 구분되는 값만, 반환값은 JSON 으로 직렬화 가능한 값만 사용합니다.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> TwoTierCachedFunction:
+        return TwoTierCachedFunction(
+            func,
+            TwoTierCache(
+                namespace, local_ttl=local_ttl, redis_ttl=redis_ttl, max_size=max_size
+            ),
+        )
+
+    return decorator
+
+
+class CacheInvalidationListener:
+    """
+    다른 워커가 publish 한 무효화 메시지를 받아 이 워커의 메모리 캐시를 삭제합니다.
+    연결이 끊긴 동안 놓친 메시지가 있을 수 있으므로 (재)구독할 때마다 전체 메모리 캐시를 비웁니다.
+    """
+
+    def __init__(self, retry_delay: float = 1.0) -> None:
+        self.retry_delay = retry_delay
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        # 테스트는 단일 워커이므로 invalidate 에서 바로 삭제되는 것으로 충분
+        if self._task is not None or IS_TEST:
+            return
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen(self) -> None:
+        redis = RedisManager()
+        while True:
+            try:
+                async with redis.subscribe(CACHE_CHANNEL_TWO_TIER_INVALIDATION) as pubsub:
+                    clear_local_caches()
+                    async for message in pubsub.listen():
+                        self._handle(redis.load_message(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Cache] invalidation listener error: {e}")
+                await asyncio.sleep(self.retry_delay)
+
+    @staticmethod
+    def _handle(message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        invalidator = _local_invalidators.get(message.get("namespace", ""))
+        if invalidator is not None:
+            invalidator(message.get("key"))
+
+
+cache_invalidation_listener = CacheInvalidationListener()
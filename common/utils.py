@@ -1,17 +1,45 @@
+import base64
+import io
+import json
 import os
 import uuid
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import Optional, Any
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import (
+    Optional,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import aioboto3
 import asyncio
 import bcrypt
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
 from fastapi import UploadFile
+from tortoise.backends.base.client import BaseTransactionWrapper
+from tortoise.exceptions import IntegrityError
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
 from common.config import logger, airtake_ins, IS_TEST, mixpanel_ins as mp
 from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ
+from common.image_utils import (
+    IMAGE_DERIVATIVE_THUMBNAIL,
+    IMAGE_DERIVATIVE_WEBP,
+    image_process_pool,
+)
 from common.mixpanel_constants import MIXPANEL_PROPERTY_KEY_USER_ID
 
+MODEL = TypeVar("MODEL", bound=Model)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> Any:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
@@ -25,30 +53,236 @@ def convert_string_to_datetime(string_datetime: str) -> Optional[datetime]:
         return None
 
 
-async def s3_upload_file(folder: str, file: UploadFile) -> str:
-    # 파일의 원본 이름에서 확장자 추출
-    _, ext = os.path.splitext(file.filename)
-    if not ext:
-        raise ValueError("No file extension found in the uploaded file.")
+def encode_cursor(**values: Any) -> str:
+    """페이지네이션 커서를 외부에 노출되는 불투명 문자열로 변환"""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(values, dict):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+async def fetch_id_keyset_page(
+    queryset: QuerySet[MODEL],
+    page_size: int,
+    cursor: Optional[str] = None,
+    page: int = 1,
+    ascending: bool = False,
+) -> Tuple[List[MODEL], Optional[str]]:
+    """
+    id 내림차순(ascending=True 면 오름차순) 목록을 조회합니다.
+    cursor 가 있으면 마지막으로 본 id 이후부터(keyset), 없으면 page 기준 offset 으로 조회합니다.
+    :return: (조회 결과, 다음 페이지 커서)
+    """
+    if cursor:
+        last_id = decode_cursor(cursor).get("id")
+        if not isinstance(last_id, int):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        queryset = (
+            queryset.filter(id__gt=last_id)
+            if ascending
+            else queryset.filter(id__lt=last_id)
+        )
+    else:
+        queryset = queryset.offset((page - 1) * page_size)
+
+    rows = await queryset.order_by("id" if ascending else "-id").limit(page_size + 1)
+    next_cursor = (
+        encode_cursor(id=rows[page_size - 1].id) if len(rows) > page_size else None
+    )
+    return rows[:page_size], next_cursor
+
+
+async def insert_ignore(model: Type[MODEL], **kwargs: Any) -> bool:
+    """
+    unique 제약에 걸리면 무시하는 insert
+    트랜잭션 밖에서만 호출할 수 있습니다. Tortoise(0.20) 의 중첩 in_transaction 은 savepoint 를
+    만들지 않아 IntegrityError 가 나면 바깥 트랜잭션 전체가 롤백되기 때문입니다.
+    :return: 새로 저장했으면 True, 같은 row 가 이미 있으면 False
+    """
+    if isinstance(model._meta.db, BaseTransactionWrapper):
+        raise RuntimeError("insert_ignore can not be called inside a transaction")
+    try:
+        # 트랜잭션 밖이므로 INSERT 한 문장만 autocommit 되고, 실패해도 다른 변경에 영향 없음
+        await model.create(**kwargs)
+    except IntegrityError:
+        return False
+    return True
+
+
+async def toggle_unique_row(model: Type[MODEL], **kwargs: Any) -> Tuple[bool, bool]:
+    """
+    unique 제약이 있는 row 를 조회 없이 토글합니다.
+    먼저 삭제를 시도하고, 지운 row 가 없을 때만 insert_ignore 합니다. (트랜잭션 밖에서만 호출)
+    :return: (토글 후 row 존재 여부, 상태 변경 여부)
+    """
+    if await model.filter(**kwargs).delete():
+        return False, True
+    return True, await insert_ignore(model, **kwargs)
+
+
+# 8MB 이상 파일은 multipart 로 나눠 병렬 업로드
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+
+class S3ClientManager:
+    """앱 시작 시 생성한 S3 클라이언트(커넥션 풀)를 재사용하기 위한 관리자"""
+
+    def __init__(self, max_pool_connections: int = 20) -> None:
+        self.max_pool_connections = max_pool_connections
+        self._client: Any = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    def _create_client(self) -> Any:
+        from common.config import AWS_S3_ACCESS_KEY, AWS_S3_SECRET_KEY
+
+        return aioboto3.Session().client(
+            "s3",
+            aws_access_key_id=AWS_S3_ACCESS_KEY,
+            aws_secret_access_key=AWS_S3_SECRET_KEY,
+            config=AioConfig(max_pool_connections=self.max_pool_connections),
+        )
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(self._create_client())
 
+    async def close(self) -> None:
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[Any]:
+        """공유 클라이언트를 반환합니다. start 전(스크립트 등)에는 임시 클라이언트를 생성합니다."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with self._create_client() as s3:
+            yield s3
+
+
+s3_client_manager = S3ClientManager()
+
+
+def _build_s3_object_name(folder: str) -> str:
+    # 동시에 업로드되는 파일끼리 이름이 겹치지 않도록 임의 문자열 추가
     timestamp = datetime.now(ZoneInfo("UTC")).strftime("%Y%m%d%H%M%S%f")
-    filename = f"{folder}/{timestamp}{ext}"
+    return f"{folder}/{timestamp}{uuid.uuid4().hex[:8]}"
+
 
-    session = aioboto3.Session()
-    from common.config import AWS_S3_ACCESS_KEY, AWS_S3_SECRET_KEY, S3_BUCKET
+async def s3_upload_fileobj(fileobj: BinaryIO, object_name: str) -> bool:
+    from common.config import S3_BUCKET
 
-    async with session.client(
-        "s3",
-        aws_access_key_id=AWS_S3_ACCESS_KEY,
-        aws_secret_access_key=AWS_S3_SECRET_KEY,
-    ) as s3:
+    async with s3_client_manager.client() as s3:
         try:
-            await s3.upload_fileobj(file.file, S3_BUCKET, filename)
+            # 파일 객체를 그대로 전달해 chunk 단위로 스트리밍 업로드
+            await s3.upload_fileobj(
+                fileobj, S3_BUCKET, object_name, Config=S3_TRANSFER_CONFIG
+            )
         except Exception as e:
-            logger.error(f"Unable to upload {file.filename} to S3: {e} ({type(e)})")
-            return ""
+            logger.error(f"Unable to upload {object_name} to S3: {e} ({type(e)})")
+            return False
+    return True
+
+
+class S3UploadedImage(NamedTuple):
+    image: str
+    thumbnail_image: Optional[str]
+    webp_image: Optional[str]
+
+
+async def _s3_upload_image(
+    folder: str, file: UploadFile, derivatives: Dict[str, bytes]
+) -> Optional[S3UploadedImage]:
+    _, ext = os.path.splitext(file.filename)
+    if not ext:
+        raise ValueError("No file extension found in the uploaded file.")
+
+    base_name = _build_s3_object_name(folder)
+    derivative_names = {
+        IMAGE_DERIVATIVE_THUMBNAIL: f"{base_name}_thumbnail.webp",
+        IMAGE_DERIVATIVE_WEBP: f"{base_name}.webp",
+    }
+    await file.seek(0)
+    uploaded, *derivatives_uploaded = await asyncio.gather(
+        s3_upload_fileobj(file.file, f"{base_name}{ext}"),
+        *(
+            s3_upload_fileobj(io.BytesIO(derivatives[name]), object_name)
+            for name, object_name in derivative_names.items()
+        ),
+    )
+    if not uploaded:
+        return None
+
+    # 파생 이미지 업로드에 실패하면 원본만 사용
+    thumbnail_image, webp_image = (
+        object_name if is_uploaded else None
+        for object_name, is_uploaded in zip(
+            derivative_names.values(), derivatives_uploaded
+        )
+    )
+    return S3UploadedImage(
+        image=f"{base_name}{ext}",
+        thumbnail_image=thumbnail_image,
+        webp_image=webp_image,
+    )
+
+
+async def build_upload_image_derivatives(
+    files: List[UploadFile],
+) -> List[Dict[str, bytes]]:
+    """
+    업로드 전에 이미지를 검증하고 썸네일/WebP 파생 이미지를 만듭니다.
+    하나라도 이미지가 아니면 InvalidImageError 를 발생시킵니다.
+    """
+    contents = [await f.read() for f in files]
+    return list(
+        await asyncio.gather(
+            *(image_process_pool.build_derivatives(data) for data in contents)
+        )
+    )
+
+
+async def s3_upload_images(
+    folder: str,
+    files: List[UploadFile],
+    all_derivatives: Optional[List[Dict[str, bytes]]] = None,
+) -> List[Optional[S3UploadedImage]]:
+    """
+    원본 이미지와 파생 이미지를 동시에 업로드합니다.
+    all_derivatives 가 없으면 build_upload_image_derivatives 로 먼저 생성합니다.
+    :return: 입력 순서대로 업로드된 경로 (원본 업로드에 실패한 파일은 None)
+    """
+    if all_derivatives is None:
+        all_derivatives = await build_upload_image_derivatives(files)
+    return list(
+        await asyncio.gather(
+            *(
+                _s3_upload_image(folder, f, derivatives)
+                for f, derivatives in zip(files, all_derivatives)
+            )
+        )
+    )
+
 
-    return filename
+async def s3_upload_image(folder: str, file: UploadFile) -> Optional[S3UploadedImage]:
+    return (await s3_upload_images(folder, [file]))[0]
 
 
 # def track_mixpanel(
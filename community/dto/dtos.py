@@ -53,11 +53,13 @@ class PostInfoBase(BaseModel):
 class PostDetailItemDto(PostInfoBase):
     tags: List[TagInfo]
     images: List[str]
+    webp_images: List[str] = []
 
 
 class PostListItemDto(PostInfoBase):
     tags: List[TagInfo]
     images: List[str]
+    thumbnail_images: List[str] = []
 
 
 class PostListResponse(BaseModel):
@@ -90,7 +92,18 @@ class CommentBaseDto(BaseModel):
 
 
 class CommentDto(CommentBaseDto):
-    replies: Optional[List[CommentBaseDto]]
+    reply_count: int = 0
+    reply_preview: List[CommentBaseDto] = []
+
+
+class CommentListResponse(BaseModel):
+    results: List[CommentDto]
+    next_cursor: Optional[str] = None
+
+
+class ReplyListResponse(BaseModel):
+    results: List[CommentBaseDto]
+    next_cursor: Optional[str] = None
 
 
 class PostCommentRequest(BaseModel):
@@ -33,6 +33,7 @@ class PostLike(BaseModel):
 
     class Meta:
         table = "post_likes"
+        unique_together = (("user", "post"),)
 
 
 class PostImage(BaseModel):
@@ -40,6 +41,8 @@ class PostImage(BaseModel):
         "models.Post", null=True, on_delete=fields.SET_NULL, related_name="images"
     )
     image = fields.CharField(null=True, blank=True, max_length=255)
+    thumbnail_image = fields.CharField(null=True, blank=True, max_length=255)
+    webp_image = fields.CharField(null=True, blank=True, max_length=255)
 
     class Meta:
         table = "post_images"
@@ -58,6 +61,8 @@ class PostTag(BaseModel):
 
     class Meta:
         table = "post_tags"
+        # 태그 필터(tag_id -> post_id)를 인덱스만으로 처리
+        indexes = (("tag_id", "post_id"),)
 
 
 class PostComment(BaseModel):
@@ -85,6 +90,7 @@ class PostCommentLike(BaseModel):
 
     class Meta:
         table = "post_comment_likes"
+        unique_together = (("user", "comment"),)
 
 
 class PostCommentReply(BaseModel):
@@ -118,3 +124,4 @@ class PostCommentReplyLike(BaseModel):
 
     class Meta:
         table = "post_comment_reply_likes"
+        unique_together = (("user", "comment"),)
@@ -1,15 +1,18 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi import APIRouter, Depends, UploadFile, File, Query, HTTPException
 from starlette import status
 
+from common.constants import COMMENT_PAGE_SIZE, REPLY_PAGE_SIZE
+
 from common.dependencies import get_current_user
 from community.dto.dtos import (
     PostCreateResponse,
     PostCreateRequest,
     PostListResponse,
     PostDetailItemDto,
-    CommentDto,
+    CommentListResponse,
     PostCommentRequest,
+    ReplyListResponse,
 )
 from users.models import User
 from community.service.post_service import PostService, PostViewService
@@ -50,15 +53,30 @@ async def get_posts(
     page: int = 1,
     page_size: int = 10,
     search: Optional[str] = Query(None),
+    tag_ids: Optional[List[int]] = Query(None),
 ) -> PostListResponse:
     """
-    게시글 목록 (검색, 페이징)
+    게시글 목록 (검색, 태그 필터, 페이징)
     """
     service = PostViewService()
-    data = await service.get_post_list(search=search, page=page, page_size=page_size)
+    data = await service.get_post_list(
+        search=search, page=page, page_size=page_size, tag_ids=tag_ids
+    )
     return data
 
 
+# /post/{post_id} 보다 먼저 선언해야 trending 이 post_id 로 매칭되지 않음
+@community_router.get(
+    "/post/trending", response_model=PostListResponse, status_code=status.HTTP_200_OK
+)
+async def get_trending_posts(page: int = 1, page_size: int = 10) -> PostListResponse:
+    """
+    인기 게시글 목록 (조회/좋아요/댓글 기반 시간 감쇠 점수 순)
+    """
+    service = PostViewService()
+    return await service.get_trending_post_list(page=page, page_size=page_size)
+
+
 @community_router.get(
     "/post/{post_id}", status_code=status.HTTP_200_OK, response_model=PostDetailItemDto
 )
@@ -91,17 +109,48 @@ async def toggle_post_like(
 @community_router.get(
     "/post/{post_id}/comment",
     status_code=status.HTTP_200_OK,
-    response_model=List[CommentDto],
+    response_model=CommentListResponse,
 )
 async def get_comments_in_post(
-    post_id: int, user: User = Depends(get_current_user)
-) -> List[CommentDto]:
+    post_id: int,
+    cursor: Optional[str] = None,
+    page_size: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    user: User = Depends(get_current_user),
+) -> CommentListResponse:
+    """
+    댓글 조회 (최신순, 커서 기반)
+    댓글마다 대댓글은 앞쪽 일부(reply_preview)만 포함되며, 나머지는 대댓글 조회 API 로 가져옵니다.
+    """
+    service = CommentService(user)
+    try:
+        return await service.get_post_comments_with_replies(
+            post_id, cursor=cursor, page_size=page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@community_router.get(
+    "/comment/{comment_id}/replies",
+    status_code=status.HTTP_200_OK,
+    response_model=ReplyListResponse,
+)
+async def get_comment_replies(
+    comment_id: int,
+    cursor: Optional[str] = None,
+    page_size: int = Query(REPLY_PAGE_SIZE, ge=1, le=100),
+    user: User = Depends(get_current_user),
+) -> ReplyListResponse:
     """
-    댓글 조회
+    대댓글 조회 (작성순, 커서 기반)
     """
     service = CommentService(user)
-    comments = await service.get_post_comments_with_replies(post_id)
-    return comments
+    try:
+        return await service.get_comment_replies(
+            comment_id, cursor=cursor, page_size=page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @community_router.post("/post/{post_id}/comment", status_code=status.HTTP_201_CREATED)
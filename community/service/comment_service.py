@@ -1,8 +1,25 @@
-from typing import Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List, Type, Union
 from fastapi import HTTPException, status
+from tortoise.functions import Count
 
-from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS
-from community.dto.dtos import CommentBaseDto, CommentDto
+from pypika.analytics import RowNumber
+
+from common.cache_constants import POST_TRENDING_WEIGHT_COMMENT
+from common.constants import (
+    COMMENT_PAGE_SIZE,
+    FORMAT_YYYY_MM_DD_T_HH_MM_SS,
+    REPLY_PAGE_SIZE,
+    REPLY_PREVIEW_SIZE,
+)
+from common.utils import fetch_id_keyset_page, toggle_unique_row
+from community.dto.dtos import (
+    CommentBaseDto,
+    CommentDto,
+    CommentListResponse,
+    ReplyListResponse,
+)
+from community.utils import add_post_trending_score
 from community.models import (
     Post,
     PostComment,
@@ -30,6 +47,7 @@ class CommentService:
                 detail=f"Post({post_id}) not found",
             )
         await PostComment.create(post=post, writer=self.user, content=content)
+        await add_post_trending_score(post_id, POST_TRENDING_WEIGHT_COMMENT)
 
     async def update_comment(self, comment_id: int, content: str) -> None:
         comment = await PostComment.get_or_none(id=comment_id)
@@ -63,93 +81,188 @@ class CommentService:
         """
         return: True -> 좋아요 생성됨, False -> 좋아요 취소됨
         """
-        comment = await PostComment.get_or_none(id=comment_id)
-        if not comment or not comment.is_active:
+        if not await PostComment.exists(id=comment_id, is_active=True):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
             )
 
-        existing_like = await PostCommentLike.get_or_none(
-            user=self.user, comment=comment
+        liked, _ = await toggle_unique_row(
+            PostCommentLike, user=self.user, comment_id=comment_id
         )
-        if existing_like:
-            await existing_like.delete()
-            return False
-        else:
-            await PostCommentLike.create(user=self.user, comment=comment)
-            return True
+        return liked
 
-    async def _build_comment_writer_profile(
-        self, user: Optional[User]
-    ) -> UserSimpleProfile:
+    @staticmethod
+    def _build_comment_writer_profile(user: Optional[User]) -> UserSimpleProfile:
         """댓글 작성자 프로필 생성 헬퍼"""
         if user:
             return UserSimpleProfile(
                 user_id=user.id,
                 name=user.name,
-                profile_picture=user.profile_image or "",
+                profile_picture=user.profile_thumbnail_image
+                or user.profile_image
+                or "",
             )
         return UserSimpleProfile(user_id=0, name="Unknown", profile_picture="")
 
-    async def _build_comment_base_dto(self, comment: PostComment) -> CommentBaseDto:
-        """CommentBaseDto 생성 공통 로직"""
-        likes_count = await PostCommentLike.filter(comment=comment).count()
-        writer_profile = await self._build_comment_writer_profile(comment.user)
-
+    def _build_comment_base_dto(
+        self, comment: Union[PostComment, PostCommentReply], likes_count: int
+    ) -> CommentBaseDto:
+        """댓글/대댓글 CommentBaseDto 생성 공통 로직"""
         return CommentBaseDto(
             id=comment.id,
             created_at=comment.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS),
             content=comment.content,
-            writer=writer_profile,
+            writer=self._build_comment_writer_profile(comment.writer),
             likes=likes_count,
             is_active=comment.is_active,
         )
 
-    async def _build_reply_base_dto(self, reply: PostCommentReply) -> CommentBaseDto:
-        """대댓글 CommentBaseDto 생성 공통 로직"""
-        likes_count = await PostCommentReplyLike.filter(comment=reply).count()
-        writer_profile = await self._build_comment_writer_profile(reply.user)
-
-        return CommentBaseDto(
-            id=reply.id,
-            created_at=reply.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS),
-            content=reply.content,
-            writer=writer_profile,
-            likes=likes_count,
-            is_active=reply.is_active,
+    @staticmethod
+    async def _get_likes_counts(
+        like_model: Type[Union[PostCommentLike, PostCommentReplyLike]],
+        comment_ids: List[int],
+    ) -> Dict[int, int]:
+        """댓글(대댓글) id 별 좋아요 수를 group by 한 번으로 조회"""
+        if not comment_ids:
+            return {}
+        rows = (
+            await like_model.filter(comment_id__in=comment_ids)
+            .annotate(count=Count("id"))
+            .group_by("comment_id")
+            .values("comment_id", "count")
         )
-
-    async def get_post_comments_with_replies(self, post_id: int) -> List[CommentDto]:
+        return {row["comment_id"]: row["count"] for row in rows}
+
+    async def get_post_comments_with_replies(
+        self,
+        post_id: int,
+        cursor: Optional[str] = None,
+        page_size: int = COMMENT_PAGE_SIZE,
+        reply_preview_size: int = REPLY_PREVIEW_SIZE,
+    ) -> CommentListResponse:
+        """
+        댓글을 커서 기반으로 조회하고, 댓글마다 앞쪽 대댓글 일부(reply_preview)만 함께 내려줍니다.
+        나머지 대댓글은 get_comment_replies 로 조회합니다.
+        """
         # 게시글 존재 여부 체크
         if not await Post.exists(id=post_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
             )
 
-        # 댓글 조회 (prefetch 포함)
-        comments = (
-            await PostComment.filter(post_id=post_id, is_active=True)
-            .select_related("user")
-            .prefetch_related("replies__user")
-            .prefetch_related("replies")
-            .prefetch_related("replies__likes")
-            .order_by("-id")
+        # 댓글, 대댓글, 좋아요 수를 각각 한 번씩 조회한 뒤 메모리에서 조립
+        comments, next_cursor = await fetch_id_keyset_page(
+            PostComment.filter(post_id=post_id, is_active=True).select_related(
+                "writer"
+            ),
+            page_size=page_size,
+            cursor=cursor,
+        )
+        comment_ids = [comment.id for comment in comments]
+        reply_counts = await self._get_reply_counts(comment_ids)
+        preview_reply_ids = await self._get_preview_reply_ids(
+            [comment_id for comment_id in comment_ids if reply_counts.get(comment_id)],
+            reply_preview_size,
+        )
+        replies = (
+            await PostCommentReply.filter(id__in=preview_reply_ids)
+            .select_related("writer")
+            .order_by("id")
+            if preview_reply_ids
+            else []
+        )
+        comment_likes = await self._get_likes_counts(PostCommentLike, comment_ids)
+        reply_likes = await self._get_likes_counts(
+            PostCommentReplyLike, [reply.id for reply in replies]
         )
 
-        result: List[CommentDto] = []
-        for comment in comments:
-            # 기본 댓글 정보 생성
-            comment_base = await self._build_comment_base_dto(comment)
+        replies_by_comment_id: Dict[int, List[CommentBaseDto]] = defaultdict(list)
+        for reply in replies:
+            replies_by_comment_id[reply.parent_comment_id].append(
+                self._build_comment_base_dto(reply, reply_likes.get(reply.id, 0))
+            )
 
-            active_replies = [r for r in comment.replies.all()]
-            reply_list = [
-                await self._build_reply_base_dto(reply) for reply in active_replies
-            ]
+        return CommentListResponse(
+            results=[
+                CommentDto(
+                    **self._build_comment_base_dto(
+                        comment, comment_likes.get(comment.id, 0)
+                    ).model_dump(),
+                    reply_count=reply_counts.get(comment.id, 0),
+                    reply_preview=replies_by_comment_id[comment.id],
+                )
+                for comment in comments
+            ],
+            next_cursor=next_cursor,
+        )
 
-            # 최종 댓글 DTO 생성
-            result.append(CommentDto(**comment_base.model_dump(), replies=reply_list))
+    async def get_comment_replies(
+        self,
+        comment_id: int,
+        cursor: Optional[str] = None,
+        page_size: int = REPLY_PAGE_SIZE,
+    ) -> ReplyListResponse:
+        """대댓글 더보기 (작성순, 커서 기반)"""
+        if not await PostComment.exists(id=comment_id, is_active=True):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+            )
+
+        replies, next_cursor = await fetch_id_keyset_page(
+            PostCommentReply.filter(parent_comment_id=comment_id).select_related(
+                "writer"
+            ),
+            page_size=page_size,
+            cursor=cursor,
+            ascending=True,
+        )
+        reply_likes = await self._get_likes_counts(
+            PostCommentReplyLike, [reply.id for reply in replies]
+        )
+        return ReplyListResponse(
+            results=[
+                self._build_comment_base_dto(reply, reply_likes.get(reply.id, 0))
+                for reply in replies
+            ],
+            next_cursor=next_cursor,
+        )
 
-        return result
+    @staticmethod
+    async def _get_reply_counts(comment_ids: List[int]) -> Dict[int, int]:
+        """댓글 id 별 대댓글 수를 group by 한 번으로 조회"""
+        if not comment_ids:
+            return {}
+        rows = (
+            await PostCommentReply.filter(parent_comment_id__in=comment_ids)
+            .annotate(count=Count("id"))
+            .group_by("parent_comment_id")
+            .values("parent_comment_id", "count")
+        )
+        return {row["parent_comment_id"]: row["count"] for row in rows}
+
+    @staticmethod
+    async def _get_preview_reply_ids(
+        comment_ids: List[int], preview_size: int
+    ) -> List[int]:
+        """댓글마다 작성순 앞쪽 preview_size 개의 대댓글 id (ROW_NUMBER 윈도우 함수)"""
+        if not comment_ids or preview_size <= 0:
+            return []
+        table = PostCommentReply._meta.basetable
+        db = PostCommentReply._meta.db
+        reply_rank = RowNumber().over(table.parent_comment_id).orderby(table.id)
+        ranked = (
+            db.query_class.from_(table)
+            .select(table.id, reply_rank.as_("reply_rank"))
+            .where(table.parent_comment_id.isin(comment_ids))
+            .as_("ranked")
+        )
+        query = (
+            db.query_class.from_(ranked)
+            .select(ranked.id)
+            .where(ranked.reply_rank <= preview_size)
+        )
+        rows = await db.execute_query_dict(query.get_sql())
+        return [row["id"] for row in rows]
 
 
 class ReplyService:
@@ -169,6 +282,7 @@ class ReplyService:
         await PostCommentReply.create(
             parent_comment=comment, writer=self.user, content=content
         )
+        await add_post_trending_score(comment.post_id, POST_TRENDING_WEIGHT_COMMENT)
 
     async def update_reply(self, reply_id: int, content: str) -> None:
         reply = await PostCommentReply.get_or_none(id=reply_id)
@@ -204,18 +318,12 @@ class ReplyService:
         """
         return: True -> 좋아요 생성됨, False -> 좋아요 취소됨
         """
-        reply = await PostCommentReply.get_or_none(id=reply_id)
-        if not reply or not reply.is_active:
+        if not await PostCommentReply.exists(id=reply_id, is_active=True):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Reply not found"
             )
 
-        existing_like = await PostCommentReplyLike.get_or_none(
-            user=self.user, comment=reply
+        liked, _ = await toggle_unique_row(
+            PostCommentReplyLike, user=self.user, comment_id=reply_id
         )
-        if existing_like:
-            await existing_like.delete()
-            return False
-        else:
-            await PostCommentReplyLike.create(user=self.user, comment=reply)
-            return True
+        return liked
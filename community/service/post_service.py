@@ -1,7 +1,9 @@
-from typing import List, Optional, Any
+import hashlib
+from typing import Dict, List, Optional, Any
 from fastapi import UploadFile, HTTPException, status
-from tortoise.expressions import Q
-from tortoise.transactions import atomic
+from tortoise.expressions import Q, Subquery
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
 
 from community.dto.dtos import (
     PostListResponse,
@@ -9,17 +11,31 @@ from community.dto.dtos import (
     TagInfo,
     PostDetailItemDto,
 )
-from community.models import Post, PostLike, PostImage, Tag, PostTag
+from community.models import Post, PostLike, PostImage, PostTag
 from common.cache_utils import RedisManager
 from common.cache_constants import (
-    CACHE_KEY_POST_VIEWS,
+    CACHE_KEY_POST_ACTIVE_COUNT,
+    CACHE_KEY_POST_SEARCH_COUNT,
+    CACHE_KEY_POST_VIEW_DELTAS,
+    CACHE_KEY_POST_VIEW_DELTAS_FLUSHING,
     CACHE_KEY_POST_LIKES,
-    VIEW_COUNT_UPDATE_THRESHOLD,
+    CACHE_KEY_POST_TRENDING,
     CACHE_EXPIRE_TIME,
+    POST_ACTIVE_COUNT_EXPIRE_TIME,
+    POST_SEARCH_COUNT_EXPIRE_TIME,
+    POST_TRENDING_WEIGHT_LIKE,
+    POST_TRENDING_WEIGHT_VIEW,
 )
 from users.dtos import UserSimpleProfile
 from users.models import User
-from common.utils import s3_upload_file
+from common.image_utils import InvalidImageError
+from common.single_flight import SingleFlightCache
+from common.utils import (
+    build_upload_image_derivatives,
+    s3_upload_images,
+    toggle_unique_row,
+)
+from community.utils import add_post_trending_score, tag_cache
 
 
 class PostService:
@@ -28,60 +44,37 @@ class PostService:
         self.redis = RedisManager()
 
     async def increment_view(self, post_id: int) -> None:
-        cache_key = CACHE_KEY_POST_VIEWS.format(post_id=post_id)
-        views_data = self.redis.get_value(cache_key)
-        if views_data is None:
-            post = await Post.get_or_none(id=post_id)
-            if not post:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
-                )
-            views_data = {"count": post.views, "update_count": 0}
-
-        views_data["count"] += 1
-        views_data["update_count"] += 1
-        self.redis.set_value(cache_key, views_data, expire=CACHE_EXPIRE_TIME)
-
-        if views_data["update_count"] >= VIEW_COUNT_UPDATE_THRESHOLD:
-            post = await Post.get_or_none(id=post_id)
-            if post:
-                post.views = views_data["count"]
-                await post.save()
-                views_data["update_count"] = 0
-                self.redis.set_value(cache_key, views_data, expire=CACHE_EXPIRE_TIME)
+        """
+        조회수 증가분을 Redis hash 에 원자적으로 누적합니다.
+        DB 반영은 스케줄러(flush_post_view_counts)에서 일괄 처리합니다.
+        """
+        await self.redis.increment_hash_value(CACHE_KEY_POST_VIEW_DELTAS, str(post_id))
+        await add_post_trending_score(post_id, POST_TRENDING_WEIGHT_VIEW, self.redis)
 
     async def toggle_like(self, post_id: int) -> bool:
         """
         좋아요 토글
         return: True -> 좋아요 생성, False -> 좋아요 해제
         """
-        post = await Post.get_or_none(id=post_id)
-        if not post:
+        if not await Post.exists(id=post_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
             )
 
-        cache_key = CACHE_KEY_POST_LIKES.format(post_id=post_id)
-        existing_like = await PostLike.get_or_none(user=self.user, post=post)
-
-        if existing_like:
-            # 좋아요 취소
-            await existing_like.delete()
-            # 캐시 감소
-            likes_count = self.redis.get_value(cache_key)
-            if likes_count is not None:
-                self.redis.set_value(cache_key, likes_count - 1)
-            return False
-        else:
-            # 좋아요 생성
-            await PostLike.create(user=self.user, post=post)
-            # 캐시 증가
-            likes_count = self.redis.get_value(cache_key)
-            if likes_count is not None:
-                self.redis.set_value(cache_key, likes_count + 1)
-            return True
-
-    @atomic()
+        liked, changed = await toggle_unique_row(
+            PostLike, user=self.user, post_id=post_id
+        )
+        # 동시 요청으로 상태가 바뀌지 않았으면 캐시/점수도 그대로 둔다
+        if changed:
+            delta = 1 if liked else -1
+            await self.redis.increment_existing_value(
+                CACHE_KEY_POST_LIKES.format(post_id=post_id), delta
+            )
+            await add_post_trending_score(
+                post_id, delta * POST_TRENDING_WEIGHT_LIKE, self.redis
+            )
+        return liked
+
     async def create_post(
         self,
         title: str,
@@ -99,74 +92,178 @@ class PostService:
                 detail="Maximum 4 images allowed",
             )
 
-        post = await Post.create(
-            title=title,
-            body=body,
-            writer=self.user,
-        )
+        # 게시글을 만들기 전에 이미지 검증 및 썸네일/WebP 생성 (프로세스 풀)
+        image_derivatives = []
+        if images:
+            try:
+                image_derivatives = await build_upload_image_derivatives(images)
+            except InvalidImageError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
 
-        # 태그 처리
-        if tag_ids:
-            # 1. 유효한 태그 ID들만 필터링
-            existing_tags = await Tag.filter(id__in=tag_ids).all()
+        async with in_transaction():
+            post = await Post.create(
+                title=title,
+                body=body,
+                writer=self.user,
+            )
 
-            if existing_tags:
-                # 2. PostTag 객체 리스트 생성
-                post_tags = [PostTag(post=post, tag=tag) for tag in existing_tags]
+            # 태그 처리
+            if tag_ids:
+                # 1. 유효한 태그 ID들만 필터링 (태그 캐시 사용)
+                existing_tag_ids = await tag_cache.get_names(dict.fromkeys(tag_ids))
 
-                # 3. 벌크 생성
-                await PostTag.bulk_create(post_tags)
+                if existing_tag_ids:
+                    # 2. PostTag 객체 리스트 생성
+                    post_tags = [
+                        PostTag(post=post, tag_id=tag_id) for tag_id in existing_tag_ids
+                    ]
 
-        # 이미지 업로드 처리
+                    # 3. 벌크 생성
+                    await PostTag.bulk_create(post_tags)
+
+        # 이미지 업로드 처리 (DB 커넥션을 잡지 않도록 트랜잭션 밖에서 동시에 업로드)
         if images:
-            for image in images:
-                folder = f"post/{post.id}/images"
-                image_url = await s3_upload_file(folder, image)
-                if image_url:
-                    await PostImage.create(post=post, image=image_url)
+            uploaded_images = await s3_upload_images(
+                f"post/{post.id}/images", images, image_derivatives
+            )
+            post_images = [
+                PostImage(
+                    post=post,
+                    image=uploaded_image.image,
+                    thumbnail_image=uploaded_image.thumbnail_image,
+                    webp_image=uploaded_image.webp_image,
+                )
+                for uploaded_image in uploaded_images
+                if uploaded_image
+            ]
+            if post_images:
+                await PostImage.bulk_create(post_images)
 
+        await self.redis.increment_existing_value(CACHE_KEY_POST_ACTIVE_COUNT)
         return post
 
 
+# 워커 전체에서 공유해야 동시 요청의 재계산을 합칠 수 있으므로 모듈 단위로 생성
+post_likes_cache = SingleFlightCache(expire=CACHE_EXPIRE_TIME, counter=True)
+post_active_count_cache = SingleFlightCache(
+    expire=POST_ACTIVE_COUNT_EXPIRE_TIME, counter=True
+)
+post_search_count_cache = SingleFlightCache(
+    expire=POST_SEARCH_COUNT_EXPIRE_TIME, counter=True
+)
+
+
 class PostViewService:
     def __init__(self, user: Optional[User] = None) -> None:
         self.user = user
         self.redis = RedisManager()
 
-    async def _get_post_views(self, post_id: int, db_views: int) -> Any:
-        """캐시된 조회수 조회"""
-        cache_key = CACHE_KEY_POST_VIEWS.format(post_id=post_id)
-        views_data = self.redis.get_value(cache_key)
-        return views_data["count"] if views_data else db_views
-
-    async def _get_post_likes(self, post_id: int) -> Any:
-        """캐시된 좋아요 수 조회"""
-        cache_key = CACHE_KEY_POST_LIKES.format(post_id=post_id)
-        likes_count = self.redis.get_value(cache_key)
-        if likes_count is None:
-            likes_count = await PostLike.filter(post_id=post_id).count()
-            self.redis.set_value(cache_key, likes_count, expire=CACHE_EXPIRE_TIME)
-        return likes_count
+    async def _get_pending_views(self, post_ids: List[int]) -> Dict[int, int]:
+        """아직 DB 에 반영되지 않은 조회수 증가분 (파이프라인 1회)"""
+        pending_views = await self.redis.get_hash_int_values(
+            [CACHE_KEY_POST_VIEW_DELTAS, CACHE_KEY_POST_VIEW_DELTAS_FLUSHING],
+            [str(post_id) for post_id in post_ids],
+        )
+        return dict(zip(post_ids, pending_views))
+
+    async def _get_likes_counts(self, post_ids: List[int]) -> Dict[int, int]:
+        """
+        좋아요 수를 한 번에 조회하고,
+        캐시에 없는 게시글은 group by 한 번으로 집계해 캐시에 다시 저장합니다.
+        같은 게시글의 집계는 워커 간에도 동시에 한 번만 실행됩니다.
+        """
+        cache_keys = {
+            CACHE_KEY_POST_LIKES.format(post_id=post_id): post_id
+            for post_id in post_ids
+        }
+
+        async def count_likes(keys: List[str]) -> Dict[str, int]:
+            missed_post_ids = [cache_keys[key] for key in keys]
+            rows = (
+                await PostLike.filter(post_id__in=missed_post_ids)
+                .annotate(count=Count("id"))
+                .group_by("post_id")
+                .values("post_id", "count")
+            )
+            counted = {row["post_id"]: row["count"] for row in rows}
+            return {key: counted.get(cache_keys[key], 0) for key in keys}
+
+        likes_counts = await post_likes_cache.get_many(list(cache_keys), count_likes)
+        return {
+            post_id: int(likes_counts[key]) for key, post_id in cache_keys.items()
+        }
+
+    async def _get_post_tags(self, post_ids: List[int]) -> Dict[int, List[TagInfo]]:
+        """게시글별 태그 (post_tags 만 조회하고 이름은 태그 캐시에서 채움)"""
+        post_tag_rows = (
+            await PostTag.filter(post_id__in=post_ids, tag_id__isnull=False)
+            .order_by("id")
+            .values_list("post_id", "tag_id")
+        )
+        tag_names = await tag_cache.get_names({tag_id for _, tag_id in post_tag_rows})
+
+        post_tags: Dict[int, List[TagInfo]] = {post_id: [] for post_id in post_ids}
+        for post_id, tag_id in post_tag_rows:
+            if tag_id in tag_names:
+                post_tags[post_id].append(
+                    TagInfo(id=tag_id, name=tag_names[tag_id] or "")
+                )
+        return post_tags
+
+    async def _get_total_count(
+        self, query: Q, search: Optional[str], tag_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        게시글 전체 개수를 캐시에서 조회합니다.
+        검색어/태그 필터가 없으면 create_post 에서 함께 증가시키는 카운터를,
+        있으면 정규화한 검색어와 태그 id 기준으로 짧게 캐시한 값을 사용합니다.
+        """
+        if search or tag_ids:
+            normalized_search = " ".join((search or "").lower().split())
+            if tag_ids:
+                normalized_search += f"|tags:{','.join(map(str, sorted(tag_ids)))}"
+            cache_key = CACHE_KEY_POST_SEARCH_COUNT.format(
+                search_hash=hashlib.sha1(normalized_search.encode()).hexdigest()
+            )
+            count_cache = post_search_count_cache
+        else:
+            cache_key = CACHE_KEY_POST_ACTIVE_COUNT
+            count_cache = post_active_count_cache
+
+        async def count_posts() -> int:
+            return await Post.filter(query).count()
+
+        return int(await count_cache.get(cache_key, count_posts))
 
     async def get_post_list(
-        self, search: Optional[str] = None, page: int = 1, page_size: int = 10
+        self,
+        search: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 10,
+        tag_ids: Optional[List[int]] = None,
     ) -> PostListResponse:
         """
-        게시글 목록 조회 (페이징, 검색)
+        게시글 목록 조회 (페이징, 검색, 태그 필터)
         검색 필터: title, body, tag__name
+        태그 필터: tag_ids 중 하나라도 달린 게시글
         """
         # 검색
         query = Q(is_active=True)
         if search:
             # title, body, tag_name 중 하나라도 검색어가 포함되면 필터
-            query &= (
-                Q(title__icontains=search)
-                | Q(body__icontains=search)
-                | Q(tags__name__icontains=search)
-            )
+            # 태그 이름은 캐시에서 id 로 바꿔 post_tags 인덱스만 조회
+            search_query = Q(title__icontains=search) | Q(body__icontains=search)
+            search_tag_ids = await tag_cache.search_ids(search)
+            if search_tag_ids:
+                search_query |= Q(id__in=self._tagged_post_ids_subquery(search_tag_ids))
+            query &= search_query
+        if tag_ids:
+            query &= Q(id__in=self._tagged_post_ids_subquery(tag_ids))
 
         # 전체 개수
-        total_count = await Post.filter(query).count()
+        total_count = await self._get_total_count(query, search, tag_ids)
 
         # 페이징 계산
         offset = (page - 1) * page_size
@@ -175,40 +272,96 @@ class PostViewService:
         posts = (
             await Post.filter(query)
             .select_related("writer")
-            .prefetch_related("images", "tags")
+            .prefetch_related("images")
             .order_by("-id")
             .offset(offset)
             .limit(page_size)
         )
 
+        return PostListResponse(
+            total_count=total_count,
+            results=await self._build_post_list_items(posts),
+            page=page,
+            page_size=page_size,
+        )
+
+    async def get_trending_post_list(
+        self, page: int = 1, page_size: int = 10
+    ) -> PostListResponse:
+        """
+        인기 게시글 목록 조회
+        조회/좋아요/댓글 이벤트마다 갱신되는 sorted set 에서 순위 구간만 읽으므로
+        게시글 수와 관계없이 페이지 단위 비용으로 조회됩니다.
+        """
+        start = (page - 1) * page_size
+        post_ids = [
+            int(post_id)
+            for post_id in await self.redis.get_sorted_set_members_by_rank(
+                CACHE_KEY_POST_TRENDING, start, start + page_size - 1
+            )
+        ]
+        total_count = await self.redis.get_sorted_set_size(CACHE_KEY_POST_TRENDING)
+
+        posts_by_id = {
+            post.id: post
+            for post in await Post.filter(id__in=post_ids, is_active=True)
+            .select_related("writer")
+            .prefetch_related("images")
+        }
+        # 비활성화된 게시글은 순위에서 제거
+        removed_post_ids = [str(pid) for pid in post_ids if pid not in posts_by_id]
+        if removed_post_ids:
+            await self.redis.remove_from_sorted_set(
+                CACHE_KEY_POST_TRENDING, *removed_post_ids
+            )
+
+        posts = [posts_by_id[pid] for pid in post_ids if pid in posts_by_id]
+        return PostListResponse(
+            total_count=total_count - len(removed_post_ids),
+            results=await self._build_post_list_items(posts),
+            page=page,
+            page_size=page_size,
+        )
+
+    @staticmethod
+    def _tagged_post_ids_subquery(tag_ids: List[int]) -> Subquery:
+        """post_tags(tag_id, post_id) 인덱스로 처리되는 태그별 게시글 id 서브쿼리"""
+        return Subquery(PostTag.filter(tag_id__in=tag_ids).values("post_id"))
+
+    async def _build_post_list_items(self, posts: List[Post]) -> List[PostListItemDto]:
+        # 조회수/좋아요 수/태그는 페이지 단위로 한 번에 조회
+        post_ids = [p.id for p in posts]
+        pending_views = await self._get_pending_views(post_ids)
+        likes_counts = await self._get_likes_counts(post_ids)
+        post_tags = await self._get_post_tags(post_ids)
+
         # 5) 응답용 데이터 구성
         results = []
         for p in posts:
-            tags = [TagInfo(id=pt.id, name=pt.name) for pt in p.tags]
             images = [img.image for img in p.images]
+            # 파생 이미지가 없는 이전 게시글은 원본으로 대체
+            thumbnail_images = [img.thumbnail_image or img.image for img in p.images]
             results.append(
                 PostListItemDto(
                     id=p.id,
                     title=p.title,
                     body=p.body,
-                    tags=tags,
+                    tags=post_tags[p.id],
                     writer=UserSimpleProfile(
                         user_id=p.writer.id,
-                        profile_picture=p.writer.profile_image or "",
+                        profile_picture=p.writer.profile_thumbnail_image
+                        or p.writer.profile_image
+                        or "",
                         name=p.writer.name,
                     ),
                     created_at=p.created_at.isoformat(),
                     images=images,
-                    views=await self._get_post_views(p.id, p.views),
-                    likes=await self._get_post_likes(p.id),
+                    thumbnail_images=thumbnail_images,
+                    views=p.views + pending_views[p.id],
+                    likes=likes_counts[p.id],
                 )
             )
-        return PostListResponse(
-            total_count=total_count,
-            results=results,
-            page=page,
-            page_size=page_size,
-        )
+        return results
 
     async def get_post_detail(self, post_id: int) -> PostDetailItemDto:
         """
@@ -219,7 +372,7 @@ class PostViewService:
         post = (
             await Post.get_or_none(id=post_id)
             .select_related("writer")
-            .prefetch_related("images", "tags")
+            .prefetch_related("images")
         )
         if not post:
             raise HTTPException(
@@ -231,8 +384,9 @@ class PostViewService:
         await post_service.increment_view(post_id)
 
         # 관계된 Tag, Images 가져 오기
-        tags = [TagInfo(id=tag.id, name=tag.name) for tag in post.tags]
+        tags = (await self._get_post_tags([post.id]))[post.id]
         images = [img.image for img in post.images]
+        webp_images = [img.webp_image or img.image for img in post.images]
 
         return PostDetailItemDto(
             id=post.id,
@@ -246,6 +400,7 @@ class PostViewService:
             ),
             created_at=post.created_at.isoformat(),
             images=images,
-            views=await self._get_post_views(post.id, post.views),
-            likes=await self._get_post_likes(post.id),
+            webp_images=webp_images,
+            views=post.views + (await self._get_pending_views([post.id]))[post.id],
+            likes=(await self._get_likes_counts([post.id]))[post.id],
         )
@@ -0,0 +1,212 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from pypika.terms import Case
+from tortoise.signals import post_delete, post_save
+
+from common.cache_constants import (
+    CACHE_KEY_JOB_LOCK,
+    CACHE_KEY_POST_TRENDING,
+    CACHE_KEY_POST_TRENDING_EPOCH,
+    CACHE_KEY_POST_VIEW_DELTAS,
+    CACHE_KEY_POST_VIEW_DELTAS_FLUSHING,
+    POST_TRENDING_HALF_LIFE,
+    POST_TRENDING_MAX_SIZE,
+    POST_TRENDING_REBASE_LOCK_EXPIRE_TIME,
+    POST_VIEW_FLUSH_BATCH_SIZE,
+    POST_VIEW_FLUSH_LOCK_EXPIRE_TIME,
+    TAG_CACHE_MISS_REFRESH_INTERVAL,
+)
+from common.cache_utils import RedisManager
+from common.config import logger
+from common.two_tier_cache import publish_cache_invalidation, register_local_invalidator
+from community.models import Post, Tag
+
+
+async def flush_post_view_counts(batch_size: int = POST_VIEW_FLUSH_BATCH_SIZE) -> int:
+    """
+    Redis 에 누적된 게시글 조회수 증가분을 posts.views 에 반영합니다.
+    증가분 hash 를 flushing 키로 옮긴 뒤 배치마다 UPDATE ... CASE 한 번으로 반영하고,
+    반영한 배치의 field 는 바로 flushing 키에서 삭제합니다.
+    반영 도중 실패하면 남은 field 만 다음 실행에서 다시 반영하며,
+    워커마다 실행되는 스케줄러가 같은 증가분을 중복 반영하지 않도록 잠금을 잡은 워커만 실행합니다.
+    :return: 반영된 게시글 수
+    """
+    redis = RedisManager()
+    async with redis.hold_lock(
+        CACHE_KEY_JOB_LOCK.format(name="flush_post_view_counts"),
+        expire=POST_VIEW_FLUSH_LOCK_EXPIRE_TIME,
+    ) as acquired:
+        if not acquired:
+            return 0
+
+        # 이전 실행에서 남은 flushing 키가 없을 때만 새 증가분을 가져온다
+        await redis.rename_key_if_absent(
+            CACHE_KEY_POST_VIEW_DELTAS, CACHE_KEY_POST_VIEW_DELTAS_FLUSHING
+        )
+        flushing_deltas = await redis.get_hash_all_int(
+            CACHE_KEY_POST_VIEW_DELTAS_FLUSHING
+        )
+        view_deltas = {
+            int(post_id): delta for post_id, delta in flushing_deltas.items() if delta
+        }
+
+        post_ids = sorted(view_deltas)
+        for start in range(0, len(post_ids), batch_size):
+            batch = post_ids[start : start + batch_size]
+            await _add_post_views({post_id: view_deltas[post_id] for post_id in batch})
+            await redis.delete_hash_fields(
+                CACHE_KEY_POST_VIEW_DELTAS_FLUSHING,
+                [str(post_id) for post_id in batch],
+            )
+
+        # 값이 0 인 field 등 남은 항목 정리
+        await redis.delete_value(CACHE_KEY_POST_VIEW_DELTAS_FLUSHING)
+        return len(post_ids)
+
+
+async def _add_post_views(view_deltas: Dict[int, int]) -> None:
+    """UPDATE posts SET views = CASE WHEN id=.. THEN views+.. END WHERE id IN (..)"""
+    table = Post._meta.basetable
+    views_case = Case()
+    for post_id, delta in view_deltas.items():
+        views_case = views_case.when(table.id == post_id, table.views + delta)
+    views_case = views_case.else_(table.views)
+
+    db = Post._meta.db
+    query = (
+        db.query_class.update(table)
+        .set(table.views, views_case)
+        .where(table.id.isin(list(view_deltas)))
+    )
+    await db.execute_query(query.get_sql())
+
+
+async def add_post_trending_score(
+    post_id: int, weight: float, redis: Optional[RedisManager] = None
+) -> None:
+    """
+    인기 게시글 점수에 이벤트 가중치를 누적합니다.
+    점수는 sum(weight * 2^((이벤트 시각 - epoch) / half_life)) 로, 최근 이벤트일수록
+    크게 더해 주므로 기존 점수를 다시 계산하지 않아도 시간에 따라 감쇠한 순위가 유지됩니다.
+    rebase 로 epoch 가 바뀌는 사이에 이전 epoch 로 계산한 값이 더해지지 않도록 epoch 를 WATCH 합니다.
+    좋아요 취소처럼 음수 가중치는 현재 시각 기준으로 빼므로 원래 더한 값보다 클 수 있어,
+    점수가 0 아래로 내려가지 않도록 0 에서 멈춥니다.
+    """
+    redis = redis or RedisManager()
+    now = time.time()
+
+    def get_amount(epoch: float) -> float:
+        return weight * 2 ** ((now - epoch) / POST_TRENDING_HALF_LIFE)
+
+    if not await redis.increment_sorted_set_score_by_epoch(
+        CACHE_KEY_POST_TRENDING,
+        str(post_id),
+        CACHE_KEY_POST_TRENDING_EPOCH,
+        get_amount=get_amount,
+        default_epoch=now,
+        min_score=0.0 if weight < 0 else None,
+    ):
+        logger.warning(f"[Trending] failed to add score of post_id:{post_id}")
+
+
+async def rebase_post_trending_scores() -> None:
+    """
+    epoch 를 현재 시각으로 옮기고 기존 점수를 그만큼 감쇠시킵니다.
+    가중치 지수가 계속 커져 float 범위를 넘지 않도록 주기적으로 실행하며,
+    상위 POST_TRENDING_MAX_SIZE 개만 남겨 sorted set 크기를 제한합니다.
+    워커마다 실행되는 스케줄러가 점수를 두 번 감쇠시키지 않도록 잠금을 잡은 워커만 실행합니다.
+    """
+    redis = RedisManager()
+    async with redis.hold_lock(
+        CACHE_KEY_JOB_LOCK.format(name="rebase_post_trending_scores"),
+        expire=POST_TRENDING_REBASE_LOCK_EXPIRE_TIME,
+    ) as acquired:
+        if not acquired:
+            return
+        now = time.time()
+        await redis.rebase_sorted_set(
+            CACHE_KEY_POST_TRENDING,
+            CACHE_KEY_POST_TRENDING_EPOCH,
+            epoch=now,
+            get_factor=lambda epoch: 2 ** (-(now - epoch) / POST_TRENDING_HALF_LIFE),
+            max_size=POST_TRENDING_MAX_SIZE,
+        )
+
+
+class TagCache:
+    """
+    크기가 작은 tags 테이블 전체를 워커 메모리에 두고 조회합니다.
+    서버 시작 시 로드하고, 변경되면 signal 로 이 워커는 바로 다시 로드하고
+    다른 워커에는 무효화를 broadcast 합니다. DB 에서 직접 변경된 것은 스케줄러(refresh)로 다시 로드합니다.
+    """
+
+    namespace = "tags"
+
+    def __init__(
+        self, miss_refresh_interval: float = TAG_CACHE_MISS_REFRESH_INTERVAL
+    ) -> None:
+        self.miss_refresh_interval = miss_refresh_interval
+        self._names: Optional[Dict[int, Optional[str]]] = None
+        self._refreshed_at = 0.0
+
+    def clear(self) -> None:
+        self._names = None
+
+    async def refresh(self) -> None:
+        self._names = dict(await Tag.all().values_list("id", "name"))
+        self._refreshed_at = time.monotonic()
+
+    async def get_names(
+        self, tag_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Optional[str]]:
+        """
+        {tag_id: name} 을 반환합니다. (tag_ids 가 있으면 캐시에 있는 해당 태그만)
+        캐시에 없는 id 가 있으면 다른 워커에서 추가된 태그일 수 있으므로 다시 로드하되,
+        삭제된 태그 id 가 계속 요청되어도 매번 로드하지 않도록 miss_refresh_interval 에 한 번만 로드합니다.
+        """
+        if self._names is None:
+            await self.refresh()
+        assert self._names is not None
+        if tag_ids is None:
+            return dict(self._names)
+
+        tag_ids = list(tag_ids)
+        if any(tag_id not in self._names for tag_id in tag_ids) and (
+            time.monotonic() - self._refreshed_at >= self.miss_refresh_interval
+        ):
+            await self.refresh()
+            assert self._names is not None
+        return {
+            tag_id: self._names[tag_id] for tag_id in tag_ids if tag_id in self._names
+        }
+
+    async def search_ids(self, keyword: str) -> List[int]:
+        """태그 이름에 keyword 가 포함된 태그 id (대소문자 무시)"""
+        keyword = keyword.casefold()
+        return [
+            tag_id
+            for tag_id, name in (await self.get_names()).items()
+            if name and keyword in name.casefold()
+        ]
+
+
+tag_cache = TagCache()
+# 다른 워커에서 변경되면 비워두고 다음 조회 때 다시 로드
+register_local_invalidator(TagCache.namespace, lambda key: tag_cache.clear())
+
+
+@post_save(Tag)
+async def _refresh_tag_cache_on_save(*args: Any, **kwargs: Any) -> None:
+    await tag_cache.refresh()
+    await publish_cache_invalidation(TagCache.namespace)
+
+
+@post_delete(Tag)
+async def _refresh_tag_cache_on_delete(*args: Any, **kwargs: Any) -> None:
+    await tag_cache.refresh()
+    await publish_cache_invalidation(TagCache.namespace)
+
+
+async def refresh_tag_cache() -> None:
+    await tag_cache.refresh()
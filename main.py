@@ -11,7 +11,9 @@ from tortoise import Tortoise
 from fastapi.openapi.utils import get_openapi
 
 from admin.routers import admin_router
+from common.cache_utils import RedisManager
 from common.config import TORTOISE_ORM
+from common.constants import HEADER_NEXT_CURSOR
 from common.dependencies import get_admin
 from common.middlewares import AuthMiddleware, LimitUploadSizeMiddleware
 from community.routers import community_router
@@ -21,14 +23,30 @@ from users.routers import user_router
 from common.logging_configs import LoggingAPIRoute
 from feedback.routers import feedback_router
 from common.scheduler import scheduler, start_scheduler
+from common.image_utils import image_process_pool
+from common.two_tier_cache import cache_invalidation_listener
+from common.utils import s3_client_manager
+from community.utils import tag_cache
+from notifications.queue import notification_queue
 
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     await Tortoise.init(config=TORTOISE_ORM, timezone="Asia/Seoul")
+    RedisManager.start()
+    await tag_cache.refresh()
+    cache_invalidation_listener.start()
     start_scheduler()
+    notification_queue.start()
+    await s3_client_manager.start()
+    image_process_pool.start()
     yield
+    await notification_queue.stop()
+    await s3_client_manager.close()
+    image_process_pool.shutdown()
     scheduler.shutdown()
+    await cache_invalidation_listener.stop()
+    await RedisManager.close()
     await Tortoise.close_connections()
 
 
@@ -58,6 +76,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[HEADER_NEXT_CURSOR],
 )
 app.add_middleware(AuthMiddleware)
 
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` ADD `approved_count` INT NOT NULL  DEFAULT 0 COMMENT '승인된 참가자 수';
+        UPDATE `parties` SET `approved_count` = (
+    SELECT COUNT(*) FROM `party_participants`
+    WHERE `party_participants`.`party_id` = `parties`.`id` AND `party_participants`.`status` = 1
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` DROP COLUMN `approved_count`;"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` ADD `geohash` VARCHAR(12)   COMMENT '위치 geohash';
+        ALTER TABLE `parties` ADD INDEX `idx_parties_geohash_913ef9` (`geohash`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` DROP INDEX `idx_parties_geohash_913ef9`;
+        ALTER TABLE `parties` DROP COLUMN `geohash`;"""
@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` ADD FULLTEXT INDEX `ft_parties_search` (`title`, `place_name`, `body`) WITH PARSER ngram;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` DROP INDEX `ft_parties_search`;"""
@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` ADD `is_deleted` BOOL NOT NULL  DEFAULT 0 COMMENT '삭제 대기 여부';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` DROP COLUMN `is_deleted`;"""
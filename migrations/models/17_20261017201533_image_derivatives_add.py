@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `post_images` ADD `thumbnail_image` VARCHAR(255);
+        ALTER TABLE `post_images` ADD `webp_image` VARCHAR(255);
+        ALTER TABLE `users` ADD `profile_thumbnail_image` VARCHAR(255);
+        ALTER TABLE `users` ADD `profile_webp_image` VARCHAR(255);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `post_images` DROP COLUMN `thumbnail_image`;
+        ALTER TABLE `post_images` DROP COLUMN `webp_image`;
+        ALTER TABLE `users` DROP COLUMN `profile_thumbnail_image`;
+        ALTER TABLE `users` DROP COLUMN `profile_webp_image`;"""
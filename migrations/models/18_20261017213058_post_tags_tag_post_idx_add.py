@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `post_tags` ADD INDEX `idx_post_tags_tag_id_e8aa60` (`tag_id`, `post_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `post_tags` DROP INDEX `idx_post_tags_tag_id_e8aa60`;"""
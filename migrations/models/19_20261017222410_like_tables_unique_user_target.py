@@ -0,0 +1,22 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 중복 좋아요는 가장 먼저 생성된 row 만 남기고 삭제한 뒤 unique 인덱스 추가
+    return """
+        DELETE l1 FROM `post_likes` l1 JOIN `post_likes` l2 ON l1.`user_id` = l2.`user_id` AND l1.`post_id` = l2.`post_id` AND l1.`id` > l2.`id`;
+        DELETE l1 FROM `post_comment_likes` l1 JOIN `post_comment_likes` l2 ON l1.`user_id` = l2.`user_id` AND l1.`comment_id` = l2.`comment_id` AND l1.`id` > l2.`id`;
+        DELETE l1 FROM `post_comment_reply_likes` l1 JOIN `post_comment_reply_likes` l2 ON l1.`user_id` = l2.`user_id` AND l1.`comment_id` = l2.`comment_id` AND l1.`id` > l2.`id`;
+        DELETE l1 FROM `party_likes` l1 JOIN `party_likes` l2 ON l1.`user_id` = l2.`user_id` AND l1.`party_id` = l2.`party_id` AND l1.`id` > l2.`id`;
+        ALTER TABLE `post_likes` ADD UNIQUE INDEX `uid_post_likes_user_id_b341ec` (`user_id`, `post_id`);
+        ALTER TABLE `post_comment_likes` ADD UNIQUE INDEX `uid_post_commen_user_id_8c69b2` (`user_id`, `comment_id`);
+        ALTER TABLE `post_comment_reply_likes` ADD UNIQUE INDEX `uid_post_commen_user_id_2cac24` (`user_id`, `comment_id`);
+        ALTER TABLE `party_likes` ADD UNIQUE INDEX `uid_party_likes_user_id_883ea6` (`user_id`, `party_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `post_likes` DROP INDEX `uid_post_likes_user_id_b341ec`;
+        ALTER TABLE `post_comment_likes` DROP INDEX `uid_post_commen_user_id_8c69b2`;
+        ALTER TABLE `post_comment_reply_likes` DROP INDEX `uid_post_commen_user_id_2cac24`;
+        ALTER TABLE `party_likes` DROP INDEX `uid_party_likes_user_id_883ea6`;"""
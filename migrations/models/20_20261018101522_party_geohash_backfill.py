@@ -0,0 +1,12 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # geohash 컬럼 추가 전에 생성된 파티도 반경 검색에 포함되도록 채움 (encode_geohash 와 같은 precision 9)
+    return """
+        UPDATE `parties` SET `geohash` = ST_GeoHash(`longitude`, `latitude`, 9) WHERE `geohash` IS NULL AND `latitude` BETWEEN -90 AND 90 AND `longitude` BETWEEN -180 AND 180;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        SELECT 1;"""
@@ -33,3 +33,18 @@ class NotificationListDto(BaseModel):
 
 class NotificationUnreadCountDto(BaseModel):
     count: int
+
+
+class PartyNotificationEventDto(BaseModel):
+    """파티 참가자 전체에게 보낼 알림 이벤트 (워커에서 사용자별 알림으로 확장)"""
+
+    party_id: int
+    type: str
+    classification: Optional[str] = None
+    message: str
+    participant_statuses: List[int]
+    exclude_user_ids: List[int] = []
+    notify_organizer: bool = False
+    # 재시도 시 이미 저장한 배치를 건너뛰기 위한 진행 상태
+    organizer_notified: bool = False
+    last_participation_id: int = 0
@@ -0,0 +1,268 @@
+import asyncio
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.cache_constants import (
+    CACHE_KEY_NOTIFICATION_DEAD_LETTER,
+    CACHE_KEY_NOTIFICATION_STREAM,
+    NOTIFICATION_STREAM_GROUP,
+    NOTIFICATION_STREAM_MAX_LEN,
+)
+from common.cache_utils import RedisManager
+from common.config import IS_TEST, logger
+from notifications.dto import PartyNotificationEventDto
+from notifications.models import Notification
+from parties.models import Party, PartyParticipant
+
+NOTIFICATION_BATCH_SIZE = 500
+NOTIFICATION_MAX_RETRIES = 5
+NOTIFICATION_RETRY_BASE_DELAY = 1.0  # 초, 재시도마다 2배씩 증가
+NOTIFICATION_READ_COUNT = 10  # 워커가 한 번에 가져오는 이벤트 수
+NOTIFICATION_READ_BLOCK_TIME = 2.0  # 초, 새 이벤트를 기다리는 최대 시간 (종료 확인 주기)
+# 초, 이 시간 넘게 ack 되지 않은 이벤트는 처리 중 종료된 워커의 것으로 보고 다시 가져옴
+# (재시도 대기 시간을 포함한 이벤트 하나의 처리 시간보다 길어야 함)
+NOTIFICATION_CLAIM_IDLE_TIME = 60 * 5
+
+
+class NotificationQueue:
+    """
+    파티 알림 이벤트를 요청 밖에서 처리하는 Redis 스트림 기반 워커 큐.
+    이벤트 하나를 참가자 배치 단위의 알림 row 로 확장해 저장합니다.
+
+    이벤트는 처리를 마친 뒤에 ack 하므로 워커가 처리 중에 종료되어도 스트림에 pending 으로 남고,
+    NOTIFICATION_CLAIM_IDLE_TIME 뒤 다른 워커(또는 재시작한 워커)가 다시 가져와 처리합니다(at-least-once).
+    이때는 처음부터 다시 처리하므로 이미 저장한 알림이 중복될 수 있습니다.
+    워커 안에서의 재시도는 마지막으로 저장한 배치 이후부터 이어서 처리하며,
+    max_retries 번 실패한 이벤트는 진행 상태와 함께 dead letter 스트림으로 옮깁니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = NOTIFICATION_BATCH_SIZE,
+        max_retries: int = NOTIFICATION_MAX_RETRIES,
+        retry_base_delay: float = NOTIFICATION_RETRY_BASE_DELAY,
+        worker_count: int = 1,
+        claim_idle_time: float = NOTIFICATION_CLAIM_IDLE_TIME,
+        read_block_time: float = NOTIFICATION_READ_BLOCK_TIME,
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.worker_count = worker_count
+        self.claim_idle_time = claim_idle_time
+        self.read_block_time = read_block_time
+        self._workers: List[asyncio.Task[None]] = []
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        # 테스트에서는 publish 에서 바로 처리
+        if self.is_running or IS_TEST:
+            return
+        self._stopping = False
+        consumer_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._workers = [
+            asyncio.create_task(self._worker(f"{consumer_prefix}:{index}"))
+            for index in range(self.worker_count)
+        ]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        처리 중인 이벤트를 timeout 동안 마무리한 뒤 워커를 종료합니다.
+        처리하지 못한 이벤트는 스트림에 남아 있다가 다음 워커가 처리합니다.
+        """
+        if not self.is_running:
+            return
+        self._stopping = True
+        _, pending = await asyncio.wait(self._workers, timeout=timeout)
+        if pending:
+            logger.error(
+                f"[Notification Queue] {len(pending)} workers cancelled while processing"
+            )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def publish(self, event: PartyNotificationEventDto) -> None:
+        """
+        이벤트를 스트림에 추가합니다.
+        테스트 환경이거나 워커가 실행 중이 아니면, 또는 Redis 에 추가하지 못하면 바로 처리합니다.
+        """
+        if IS_TEST or not self.is_running:
+            await self.process_event(event)
+            return
+        try:
+            await RedisManager().add_stream_entry(
+                CACHE_KEY_NOTIFICATION_STREAM,
+                event.model_dump(mode="json"),
+                max_len=NOTIFICATION_STREAM_MAX_LEN,
+            )
+        except Exception as e:
+            logger.warning(
+                f"[Notification Queue] party_id:{event.party_id} "
+                f"failed to enqueue, processing inline, msg:{e}"
+            )
+            await self.process_event(event)
+
+    async def consume(
+        self, consumer: str, claim: bool = False, block: Optional[float] = None
+    ) -> int:
+        """
+        스트림에서 이벤트를 가져와 처리하고 처리한 이벤트 수를 반환합니다.
+        claim 이 True 면 새 이벤트 대신 오래 ack 되지 않은 이벤트를 가져옵니다.
+        """
+        redis = RedisManager()
+        await redis.create_stream_group(
+            CACHE_KEY_NOTIFICATION_STREAM, NOTIFICATION_STREAM_GROUP
+        )
+        if claim:
+            entries = await redis.claim_stream_entries(
+                CACHE_KEY_NOTIFICATION_STREAM,
+                NOTIFICATION_STREAM_GROUP,
+                consumer,
+                min_idle_time=self.claim_idle_time,
+                count=NOTIFICATION_READ_COUNT,
+            )
+        else:
+            entries = await redis.read_stream_group(
+                CACHE_KEY_NOTIFICATION_STREAM,
+                NOTIFICATION_STREAM_GROUP,
+                consumer,
+                count=NOTIFICATION_READ_COUNT,
+                block=int(block * 1000) if block is not None else None,
+            )
+        for entry in entries:
+            await self._handle_entry(redis, entry)
+        return len(entries)
+
+    async def _handle_entry(self, redis: RedisManager, entry: Tuple[str, Any]) -> None:
+        entry_id, data = entry
+        try:
+            event = PartyNotificationEventDto.model_validate(data)
+        except ValueError as e:
+            logger.error(
+                f"[Notification Queue] invalid event {entry_id}: {data}, msg:{e}"
+            )
+            await redis.ack_stream_entries(
+                CACHE_KEY_NOTIFICATION_STREAM,
+                NOTIFICATION_STREAM_GROUP,
+                [entry_id],
+                dead_letter_key=CACHE_KEY_NOTIFICATION_DEAD_LETTER,
+                dead_letter_values=[data],
+            )
+            return
+
+        if await self._process_with_retry(event):
+            await redis.ack_stream_entries(
+                CACHE_KEY_NOTIFICATION_STREAM, NOTIFICATION_STREAM_GROUP, [entry_id]
+            )
+            return
+
+        logger.error(
+            f"[Notification Queue] party_id:{event.party_id} moved to dead letter after "
+            f"{self.max_retries} attempts, event:{event.model_dump_json()}"
+        )
+        await redis.ack_stream_entries(
+            CACHE_KEY_NOTIFICATION_STREAM,
+            NOTIFICATION_STREAM_GROUP,
+            [entry_id],
+            dead_letter_key=CACHE_KEY_NOTIFICATION_DEAD_LETTER,
+            dead_letter_values=[event.model_dump(mode="json")],
+        )
+
+    async def _worker(self, consumer: str) -> None:
+        next_claim_at = 0.0
+        while not self._stopping:
+            try:
+                if time.monotonic() >= next_claim_at:
+                    next_claim_at = time.monotonic() + self.claim_idle_time / 2
+                    # 다른 워커가 처리하지 못하고 남긴 이벤트를 먼저 가져옴
+                    if await self.consume(consumer, claim=True):
+                        next_claim_at = 0.0
+                        continue
+                await self.consume(consumer, block=self.read_block_time)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Notification Queue] worker {consumer} error: {e}")
+                await asyncio.sleep(self.retry_base_delay)
+
+    async def _process_with_retry(self, event: PartyNotificationEventDto) -> bool:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self.process_event(event)
+                return True
+            except Exception as e:
+                logger.warning(
+                    f"[Notification Queue] party_id:{event.party_id} "
+                    f"attempt:{attempt}/{self.max_retries} failed, msg:{e}"
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_base_delay * 2 ** (attempt - 1))
+        return False
+
+    async def process_event(self, event: PartyNotificationEventDto) -> None:
+        """이벤트를 참가자별 알림으로 확장해 배치 단위로 저장합니다."""
+        if event.notify_organizer and not event.organizer_notified:
+            organizer_user_id = (
+                await Party.filter(id=event.party_id)
+                .first()
+                .values_list("organizer_user_id", flat=True)
+            )
+            if organizer_user_id and organizer_user_id not in event.exclude_user_ids:
+                await Notification.create(
+                    **self._build_notification_kwargs(event, organizer_user_id)
+                )
+            event.organizer_notified = True
+
+        while True:
+            participations = (
+                await PartyParticipant.filter(
+                    party_id=event.party_id,
+                    status__in=event.participant_statuses,
+                    id__gt=event.last_participation_id,
+                )
+                .order_by("id")
+                .limit(self.batch_size)
+                .values("id", "participant_user_id")
+            )
+            if not participations:
+                return
+
+            notifications = [
+                Notification(
+                    **self._build_notification_kwargs(
+                        event, participation["participant_user_id"]
+                    )
+                )
+                for participation in participations
+                if participation["participant_user_id"] not in event.exclude_user_ids
+            ]
+            if notifications:
+                await Notification.bulk_create(notifications)
+            event.last_participation_id = participations[-1]["id"]
+
+            if len(participations) < self.batch_size:
+                return
+
+    @staticmethod
+    def _build_notification_kwargs(
+        event: PartyNotificationEventDto, target_user_id: int
+    ) -> Dict[str, Any]:
+        return dict(
+            type=event.type,
+            classification=event.classification,
+            related_id=event.party_id,
+            message=event.message,
+            is_global=False,
+            target_user_id=target_user_id,
+        )
+
+
+notification_queue = NotificationQueue()
@@ -34,6 +34,12 @@ class PartyListDetail(PartyInfo):
     address: str
     longitude: float
     latitude: float
+    distance_km: Optional[float] = None
+
+
+class PartyListPage(BaseModel):
+    parties: List[PartyListDetail]
+    next_cursor: Optional[str] = None
 
 
 class PartyDetail(PartyInfo):
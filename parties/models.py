@@ -14,6 +14,9 @@ class Party(BaseModel):
     address = fields.CharField(null=True, blank=True, max_length=255)
     longitude = fields.FloatField(null=True, blank=True)
     latitude = fields.FloatField(null=True, blank=True)
+    geohash = fields.CharField(
+        null=True, blank=True, max_length=12, index=True, description="위치 geohash"
+    )
     organizer_user = fields.ForeignKeyField(
         "models.User", related_name="parties", null=True, on_delete=fields.SET_NULL
     )
@@ -24,6 +27,8 @@ class Party(BaseModel):
     )
     is_active = fields.BooleanField(null=True, default=True)
     notice = fields.CharField(max_length=255, null=True, blank=True)
+    approved_count = fields.IntField(default=0, description="승인된 참가자 수")
+    is_deleted = fields.BooleanField(default=False, description="삭제 대기 여부")
     participants = fields.ManyToManyField(
         "models.User",
         related_name="participated_parties",
@@ -32,6 +37,8 @@ class Party(BaseModel):
 
     class Meta:
         table = "parties"
+        # (title, place_name, body) FULLTEXT(ngram) 인덱스는 MySQL 전용이라
+        # 마이그레이션(15_party_fulltext_search_index)에서만 생성합니다.
 
     def __str__(self) -> str:
         return f"{self.id} - {self.title}"
@@ -88,3 +95,4 @@ class PartyLike(BaseModel):
 
     class Meta:
         table = "party_likes"
+        unique_together = (("user", "party"),)
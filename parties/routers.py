@@ -1,10 +1,19 @@
 from typing import List
 from typing import Optional, Any
 
-from fastapi import APIRouter, status, Depends, Request, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    status,
+    Depends,
+    Request,
+    HTTPException,
+    Query,
+    Response,
+)
 
 from common.config import logger
-from common.dependencies import get_current_user
+from common.constants import HEADER_NEXT_CURSOR
+from common.dependencies import get_current_user, get_request_user
 from common.logging_configs import LoggingAPIRoute
 from common.mixpanel_constants import (
     MIXPANEL_EVENT_PARTY_CREATE,
@@ -38,6 +47,7 @@ from parties.dtos import (
     PartyUpdateInfo,
 )
 from parties.models import Party
+from parties.utils import encode_geohash, schedule_party_expiry
 from parties.services import (
     PartyDetailService,
     PartyListService,
@@ -45,7 +55,8 @@ from parties.services import (
     PartyLikeService,
 )
 from parties.services import PartyParticipateService
-from users.models import User, Sport, SportName_Pydantic
+from users.models import User, SportName_Pydantic
+from users.utils import get_sport_list
 
 party_router = APIRouter(
     prefix="/api/party",
@@ -60,7 +71,7 @@ party_router = APIRouter(
 )
 async def get_sports_list(request: Request) -> Any:
     try:
-        sports_list = await SportName_Pydantic.from_queryset(Sport.all())
+        sports_list = await get_sport_list()
     except Exception as e:
         logger.error(f"[LAMBDA LOG]: Error: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -84,12 +95,14 @@ async def create_party(
             address=request_data.address,
             longitude=request_data.longitude,
             latitude=request_data.latitude,
+            geohash=encode_geohash(request_data.latitude, request_data.longitude),
             participant_limit=request_data.participant_limit,
             participant_cost=request_data.participant_cost,
             sport_id=request_data.sport_id,
             organizer_user=user,
             notice=request_data.notice,
         )
+        await schedule_party_expiry(party.id, party.gather_at)
 
         # analytics tracking
         await track_analytics(
@@ -233,9 +246,10 @@ async def organizer_change_participation_status(
 )
 async def get_party_details(party_id: int, request: Request) -> PartyDetail:
     try:
-        user = request.state.user
-        service = await PartyDetailService.create(party_id)
-        party_details = await service.get_party_details(user)
+        user = await get_request_user(request)
+        party_details = await PartyDetailService.get_cached_party_details(
+            party_id, user
+        )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return party_details
@@ -246,24 +260,63 @@ async def get_party_details(party_id: int, request: Request) -> PartyDetail:
 )
 async def get_party_list(
     request: Request,
+    response: Response,
     sport_id: Optional[List[int]] = Query(None),
     is_active: Optional[bool] = None,
     gather_date_min: Optional[str] = None,
     gather_date_max: Optional[str] = None,
     search_query: Optional[str] = None,
     page: int = 1,
+    cursor: Optional[str] = None,
 ) -> List[PartyListDetail]:
-    user = request.state.user
+    """
+    cursor 를 넘기면 page 대신 커서 기반으로 조회하며, 다음 커서는 X-Next-Cursor 헤더로 전달.
+    """
+    user = await get_request_user(request)
     service = PartyListService(user)
-    party_list = await service.get_party_list(
+    party_page = await service.get_party_list(
         sport_id_list=sport_id,
         is_active=is_active,
         gather_date_min=gather_date_min,
         gather_date_max=gather_date_max,
         search_query=search_query,
         page=page,
+        cursor=cursor,
+    )
+    if party_page.next_cursor:
+        response.headers[HEADER_NEXT_CURSOR] = party_page.next_cursor
+    return party_page.parties
+
+
+@party_router.get(
+    "/nearby", response_model=List[PartyListDetail], status_code=status.HTTP_200_OK
+)
+async def get_nearby_party_list(
+    request: Request,
+    latitude: float,
+    longitude: float,
+    radius_km: float = Query(5, gt=0, le=50),
+    sport_id: Optional[List[int]] = Query(None),
+    is_active: Optional[bool] = None,
+    gather_date_min: Optional[str] = None,
+    gather_date_max: Optional[str] = None,
+    limit: int = Query(20, gt=0, le=100),
+) -> List[PartyListDetail]:
+    """
+    내 주변 파티 조회 (가까운 순)
+    """
+    user = await get_request_user(request)
+    service = PartyListService(user)
+    return await service.get_nearby_parties(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        sport_id_list=sport_id,
+        is_active=is_active,
+        gather_date_min=gather_date_min,
+        gather_date_max=gather_date_max,
+        limit=limit,
     )
-    return party_list
 
 
 @party_router.get(
@@ -274,7 +327,7 @@ async def get_party_list(
 async def get_party_comments(
     request: Request, party_id: int
 ) -> List[PartyCommentDetail]:
-    user = request.state.user
+    user = await get_request_user(request)
     try:
         service = PartyCommentService(party_id, user)
         party_comments = await service.get_comments()
@@ -363,7 +416,9 @@ async def add_liked_party(
 ) -> str:
     service = PartyLikeService(user)
     try:
-        await service.party_like(party_id)
+        # 이미 좋아요 한 상태면 그대로 성공 처리 (중복 요청에 멱등)
+        if not await service.party_like(party_id):
+            return f"Party-{party_id} is already liked"
         # analytics tracking
         await track_analytics(
             event_name=MIXPANEL_EVENT_LIKE_PARTY,
@@ -388,7 +443,8 @@ async def cancel_liked_party(
 ) -> str:
     service = PartyLikeService(user)
     try:
-        await service.cancel_party_like(party_id)
+        if not await service.cancel_party_like(party_id):
+            return f"Party-{party_id} is not liked"
         # analytics tracking
         await track_analytics(
             event_name=MIXPANEL_EVENT_CANCEL_LIKE_PARTY,
@@ -408,13 +464,17 @@ async def cancel_liked_party(
     status_code=status.HTTP_200_OK,
 )
 async def get_self_organized_party(
+    response: Response,
     page: int = 1,
+    cursor: Optional[str] = None,
     user: User = Depends(get_current_user),
 ) -> List[PartyListDetail]:
     try:
         service = PartyListService(user)
-        party_list = await service.get_self_organized_parties(page=page)
-        return party_list
+        party_page = await service.get_self_organized_parties(page=page, cursor=cursor)
+        if party_page.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = party_page.next_cursor
+        return party_page.parties
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -425,13 +485,17 @@ async def get_self_organized_party(
     status_code=status.HTTP_200_OK,
 )
 async def get_participated_party(
+    response: Response,
     page: int = 1,
+    cursor: Optional[str] = None,
     user: User = Depends(get_current_user),
 ) -> List[PartyListDetail]:
     try:
         service = PartyListService(user)
-        party_list = await service.get_participated_parties(page=page)
-        return party_list
+        party_page = await service.get_participated_parties(page=page, cursor=cursor)
+        if party_page.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = party_page.next_cursor
+        return party_page.parties
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -7,12 +7,13 @@ from parties.models import (
     PartyComment,
     PartyLike,
 )
-from users.models import User
+from users.models import Sport, User
 from datetime import datetime, UTC, timedelta
 from parties.dtos import (
     ParticipantProfile,
     PartyDetail,
     PartyListDetail,
+    PartyListPage,
     PartyCommentDetail,
     PartyUpdateInfo,
 )
@@ -30,12 +31,14 @@ from common.constants import (
     NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CANCELED,
     NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED,
 )
-from typing import List, Optional, Union
-from tortoise.expressions import Q
+from typing import Dict, List, Optional, Union
+from tortoise.expressions import Q, F
+from tortoise.transactions import in_transaction
 from fastapi import HTTPException, status
 from parties.dto.request import PartyUpdateRequest
 from notifications.service import NotificationService
-from notifications.dto import NotificationSpecificDto
+from notifications.dto import NotificationSpecificDto, PartyNotificationEventDto
+from notifications.queue import notification_queue
 from notifications.message_format import (
     MESSAGE_FORMAT_PARTY_PARTICIPATE,
     MESSAGE_FORMAT_PARTY_ACCEPTED,
@@ -44,7 +47,24 @@ from notifications.message_format import (
     MESSAGE_FORMAT_PARTY_DETAILS_CHANGED,
     MESSAGE_FORMAT_PARTY_COMMENT_ADDED,
 )
-from common.config import TIME_ZONE, logger
+from common.config import PARTY_SOFT_DELETE, TIME_ZONE, logger
+from common.cache_constants import PARTY_DETAIL_CACHE_EXPIRE_TIME
+from common.single_flight import SingleFlightCache
+from common.utils import fetch_id_keyset_page, insert_ignore
+from parties.utils import (
+    build_party_search_relevance,
+    encode_geohash,
+    get_bounding_box,
+    get_nearby_geohash_prefixes,
+    get_party_detail_cache_key,
+    haversine_km,
+    invalidate_party_detail_cache,
+    PARTY_NEARBY_MAX_CANDIDATES,
+    PARTY_NEARBY_MAX_SHRINK_COUNT,
+    purge_party,
+    schedule_party_expiry,
+    supports_party_fulltext_search,
+)
 
 
 class PartyParticipateService:
@@ -57,7 +77,7 @@ class PartyParticipateService:
 
     @classmethod
     async def create(cls, party_id: int, user: User) -> "PartyParticipateService":
-        party = await Party.get_or_none(id=party_id)
+        party = await Party.get_or_none(id=party_id, is_deleted=False)
         if party is None:
             raise ValueError("Party Does Not Exist")
         if not party.is_active:
@@ -84,10 +104,13 @@ class PartyParticipateService:
         ):
             raise ValueError("Already applied to the party.")
 
-        await PartyParticipant.create(
-            participant_user=self.user,
-            party=self.party,
-        )
+        async with in_transaction():
+            participation = await PartyParticipant.create(
+                participant_user=self.user,
+                party=self.party,
+            )
+            await self._apply_approved_count_change(None, participation.status)
+        await invalidate_party_detail_cache(self.party.id)
 
         # 파티장에게 알람 보내기
         notification_service = NotificationService(self.user)
@@ -123,10 +146,8 @@ class PartyParticipateService:
     async def organizer_change_participation_status(
         self, participation_id: int, new_status: ParticipationStatus
     ) -> PartyParticipant:
-        participation = await PartyParticipant.get_or_none(
-            id=participation_id
-        ).select_related("participant_user")
-        if participation is None:
+        participation = await PartyParticipant.get_or_none(id=participation_id)
+        if participation is None or participation.party_id != self.party.id:
             raise ValueError("Invalid Participation ID")
         if not self.is_user_organizer():
             raise PermissionError("Operation is Forbidden for the user.")
@@ -148,8 +169,9 @@ class PartyParticipateService:
         ):
             raise ValueError("Invalid status change requested by organizer.")
 
-        participation.status = new_status
-        await participation.save()
+        if not await self._change_participation_status(participation, new_status):
+            # 동시에 들어온 같은 요청이 이미 반영된 경우 알람도 다시 보내지 않음
+            return participation
 
         # 파티원에게 알람 보내기
         notification_service = NotificationService(self.user)
@@ -180,8 +202,8 @@ class PartyParticipateService:
         if new_status != ParticipationStatus.CANCELLED:
             raise ValueError("Participants can only cancel their own participation.")
 
-        participation.status = new_status
-        await participation.save()
+        if not await self._change_participation_status(participation, new_status):
+            return participation
 
         # 파티장에게 알람 보내기
         notification_service = NotificationService()
@@ -200,6 +222,44 @@ class PartyParticipateService:
 
         return participation
 
+    async def _change_participation_status(
+        self, participation: PartyParticipant, new_status: ParticipationStatus
+    ) -> bool:
+        """
+        참가 상태 변경과 승인 인원 수 갱신을 같은 트랜잭션에서 처리
+        읽어 온 상태 그대로일 때만 변경(조건부 UPDATE)하므로, 동시에 들어온 같은 요청은
+        한 번만 반영되고 승인 인원 수도 한 번만 바뀝니다.
+        :return: 상태가 변경되었으면 True, 다른 요청이 먼저 변경했으면 False
+        """
+        previous_status = participation.status
+        async with in_transaction():
+            changed = await PartyParticipant.filter(
+                id=participation.id, status=previous_status
+            ).update(status=new_status, updated_at=datetime.now(UTC))
+            if changed:
+                await self._apply_approved_count_change(previous_status, new_status)
+        if not changed:
+            await participation.refresh_from_db(fields=["status", "updated_at"])
+            return False
+        participation.status = new_status
+        await invalidate_party_detail_cache(self.party.id)
+        return True
+
+    async def _apply_approved_count_change(
+        self,
+        previous_status: Optional[ParticipationStatus],
+        new_status: ParticipationStatus,
+    ) -> None:
+        delta = int(new_status == ParticipationStatus.APPROVED) - int(
+            previous_status == ParticipationStatus.APPROVED
+        )
+        if not delta:
+            return
+        await Party.filter(id=self.party.id).update(
+            approved_count=F("approved_count") + delta
+        )
+        self.party.approved_count += delta
+
     async def set_party_deactivated(self, set_to_deactivate: bool = True) -> None:
         if not self.is_user_organizer():
             raise ValueError("Only Party of Organizer can set party status")
@@ -208,6 +268,13 @@ class PartyParticipateService:
         else:
             self.party.is_active = True
         await self.party.save()
+        if self.party.is_active:
+            await schedule_party_expiry(self.party.id, self.party.gather_at)
+        await invalidate_party_detail_cache(self.party.id)
+
+
+# 인기 파티의 캐시가 만료되어도 상세 정보는 키마다 한 번만 다시 만든다
+party_detail_cache = SingleFlightCache(expire=PARTY_DETAIL_CACHE_EXPIRE_TIME)
 
 
 class PartyDetailService:
@@ -218,21 +285,61 @@ class PartyDetailService:
 
     @classmethod
     async def create(cls, party_id: int) -> "PartyDetailService":
-        party = (
-            await Party.get_or_none(id=party_id)
-            .select_related("sport", "organizer_user")
-            .prefetch_related("participants")
+        party = await Party.get_or_none(id=party_id, is_deleted=False).select_related(
+            "sport", "organizer_user"
         )
         if party is None:
             raise ValueError("Party Does Not Exist")
         return cls(party)
 
-    async def get_party_details(self, user: User) -> PartyDetail:
-        # 필요한 데이터를 가져와서 파싱합니다.
-        participants = (
-            await PartyParticipant.filter(party=self.party)
-            .select_related("participant_user")
-            .all()
+    @classmethod
+    async def get_cached_party_details(
+        cls, party_id: int, user: Optional[User]
+    ) -> PartyDetail:
+        """
+        사용자와 무관한 상세 정보는 Redis 캐시에서 읽고, 사용자별 필드만 덧씌웁니다.
+        캐시는 파티/참가 상태가 바뀔 때 invalidate_party_detail_cache 로 무효화됩니다.
+        """
+        cache_key = await get_party_detail_cache_key(party_id)
+
+        async def build_party_details() -> Dict[str, Any]:
+            service = await cls.create(party_id)
+            return await service._build_cacheable_party_details()
+
+        cached_detail = await party_detail_cache.get(cache_key, build_party_details)
+        return cls._apply_user_fields(cached_detail, user)
+
+    @staticmethod
+    def _apply_user_fields(
+        cached_detail: Dict[str, Any], user: Optional[User]
+    ) -> PartyDetail:
+        """캐시된 상세 정보에 사용자별 필드(is_user_organizer, notice)를 적용"""
+        party_detail = PartyDetail(**cached_detail["detail"])
+        if not user:
+            return party_detail
+
+        party_detail.is_user_organizer = (
+            user.id == party_detail.organizer_profile.user_id
+        )
+        if (
+            party_detail.is_user_organizer
+            or user.id in cached_detail["approved_user_ids"]
+        ):
+            party_detail.notice = cached_detail["notice"]
+        return party_detail
+
+    async def _build_cacheable_party_details(self) -> Dict[str, Any]:
+        """사용자와 무관한 파티 상세 정보 (캐시 저장용)"""
+        # 응답에 필요한 참가자 컬럼만 조회합니다.
+        participants = await PartyParticipant.filter(
+            party=self.party,
+            status__in=[ParticipationStatus.PENDING, ParticipationStatus.APPROVED],
+        ).values(
+            "id",
+            "status",
+            "participant_user_id",
+            "participant_user__name",
+            "participant_user__profile_image",
         )
 
         approved_participants = []
@@ -252,28 +359,20 @@ class PartyDetailService:
         )
 
         for participant in participants:
-            if participant.status == ParticipationStatus.PENDING:
-                pending_participants.append(
-                    ParticipantProfile(
-                        profile_picture=participant.participant_user.profile_image,
-                        name=participant.participant_user.name,
-                        user_id=participant.participant_user_id,
-                        participation_id=participant.id,
-                        # application_date=p.created_at.strftime(FORMAT_YYYY_d_MM_d_DD)
-                    )
-                )
-            if participant.status == ParticipationStatus.APPROVED:
-                approved_participants.append(
-                    ParticipantProfile(
-                        profile_picture=participant.participant_user.profile_image,
-                        name=participant.participant_user.name,
-                        user_id=participant.participant_user_id,
-                        participation_id=participant.id,
-                    )
-                )
-                participants_id_list.append(participant.participant_user.id)
+            participant_profile = ParticipantProfile(
+                profile_picture=participant["participant_user__profile_image"],
+                name=participant["participant_user__name"],
+                user_id=participant["participant_user_id"],
+                participation_id=participant["id"],
+                # application_date=p.created_at.strftime(FORMAT_YYYY_d_MM_d_DD)
+            )
+            if participant["status"] == ParticipationStatus.PENDING:
+                pending_participants.append(participant_profile)
+            if participant["status"] == ParticipationStatus.APPROVED:
+                approved_participants.append(participant_profile)
+                participants_id_list.append(participant["participant_user_id"])
 
-        return PartyDetail(
+        party_detail = PartyDetail(
             id=self.party.id,
             sport_name=self.party.sport.name,
             title=self.party.title,
@@ -289,25 +388,20 @@ class PartyDetailService:
                 user_id=self.party.organizer_user_id,
             ),
             posted_date=self.party.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ),
-            is_user_organizer=user.id == self.party.organizer_user_id
-            if user
-            else False,
             pending_participants=pending_participants,
             approved_participants=approved_participants,
             is_active=self.party.is_active,
-            notice=self.party.notice
-            if user
-            and (
-                user.id in participants_id_list
-                or user.id == self.party.organizer_user_id
-            )
-            else None,
             place_name=self.party.place_name,
             place_id=self.party.place_id,
             address=self.party.address,
             longitude=self.party.longitude,
             latitude=self.party.latitude,
         )
+        return {
+            "detail": party_detail.model_dump(),
+            "notice": self.party.notice,
+            "approved_user_ids": participants_id_list,
+        }
 
     async def update_party(
         self, user: User, update_info: PartyUpdateRequest
@@ -335,32 +429,27 @@ class PartyDetailService:
                 continue
 
             setattr(self.party, field, value)
+        self.party.geohash = encode_geohash(self.party.latitude, self.party.longitude)
 
         # 업데이트된 내용 저장
         await self.party.save()
+        await schedule_party_expiry(self.party.id, self.party.gather_at)
+        await invalidate_party_detail_cache(self.party.id)
 
-        # 파티원들에게 알람 보내기
-        notification_service = NotificationService()
-        participant_list = await PartyParticipant.filter(
-            party=self.party, status=ParticipationStatus.APPROVED
-        ).all()
-        message_list = []
-        for participant in participant_list:
-            message = MESSAGE_FORMAT_PARTY_DETAILS_CHANGED.format(
-                party=self.party.title
-            )
-            notification_info = NotificationSpecificDto(
+        # 파티원들에게 알람 보내기 (알림 큐 워커에서 참가자별로 확장)
+        await notification_queue.publish(
+            PartyNotificationEventDto(
+                party_id=self.party.id,
                 type=NOTIFICATION_TYPE_PARTY,
                 classification=NOTIFICATION_CLASSIFY_PARTY_DETAILS_UPDATED
                 if self.party.is_active
                 else NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED,
-                related_id=self.party.id,
-                message=message,
-                is_global=False,
-                target_user_id=participant.participant_user_id,
+                message=MESSAGE_FORMAT_PARTY_DETAILS_CHANGED.format(
+                    party=self.party.title
+                ),
+                participant_statuses=[ParticipationStatus.APPROVED],
             )
-            message_list.append(notification_info)
-        await notification_service.create_notifications(message_list)
+        )
 
         return PartyUpdateInfo(
             id=self.party.id,
@@ -386,12 +475,15 @@ class PartyDetailService:
         if self.party.organizer_user_id != user.id:
             raise PermissionError("Only the organizer can delete this party.")
 
-        await PartyParticipant.filter(party=self.party).delete()
-        await PartyComment.filter(party=self.party).delete()
-        await PartyLike.filter(party=self.party).delete()
-
-        # 파티 최종 삭제
-        await self.party.delete()
+        if PARTY_SOFT_DELETE:
+            # 삭제 표시만 하고 실제 row 정리는 purge_deleted_parties 스케줄러에서 처리
+            await Party.filter(id=self.party.id).update(
+                is_deleted=True, is_active=False
+            )
+            await invalidate_party_detail_cache(self.party.id)
+        else:
+            # 상세 캐시와 버전 키도 함께 삭제
+            await purge_party(self.party.id)
 
 
 class PartyListService:
@@ -407,117 +499,282 @@ class PartyListService:
         search_query: Optional[str] = None,
         page: int = 1,
         page_size: int = 8,
-    ) -> List[PartyListDetail]:
+        cursor: Optional[str] = None,
+    ) -> PartyListPage:
         try:
-            query = Q()
+            query = self._build_filter_query(
+                sport_id_list=sport_id_list,
+                is_active=is_active,
+                gather_date_min=gather_date_min,
+                gather_date_max=gather_date_max,
+            )
 
-            if sport_id_list is not None:
-                query &= Q(sport_id__in=sport_id_list)
+            if search_query and supports_party_fulltext_search():
+                parties = await self._search_parties(
+                    query, search_query, page=page, page_size=page_size
+                )
+                next_cursor = None
+            else:
+                if search_query:
+                    # FULLTEXT 인덱스가 없는 DB(테스트용 SQLite 등)에서만 사용
+                    query &= (
+                        Q(title__icontains=search_query)
+                        | Q(place_name__icontains=search_query)
+                        | Q(body__icontains=search_query)
+                        | Q(sport__name__icontains=search_query)
+                    )
+                parties, next_cursor = await fetch_id_keyset_page(
+                    Party.filter(query).select_related("sport", "organizer_user"),
+                    page_size=page_size,
+                    cursor=cursor,
+                    page=page,
+                )
+            party_list = self._build_party_list(parties)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return PartyListPage(parties=party_list, next_cursor=next_cursor)
+
+    @staticmethod
+    async def _search_parties(
+        query: Q, search_query: str, page: int = 1, page_size: int = 8
+    ) -> List[Party]:
+        """
+        title/place_name/body FULLTEXT(ngram) 인덱스로 검색해 relevance 순으로 반환합니다.
+        종목명 일치는 sports 테이블에서 id 를 먼저 찾아 함께 포함합니다.
+        relevance 정렬이라 id 커서 대신 page 기반으로 조회합니다.
+
+        MATCH 조건과 sport_id 조건을 OR 로 묶으면 FULLTEXT 인덱스를 쓰지 못하므로,
+        각각 (relevance, id) 순으로 요청한 페이지까지만 조회한 뒤 합쳐서 정렬합니다.
+        """
+        relevance = build_party_search_relevance(search_query)
+        fetch_size = max(page, 1) * page_size
+        ranked = await (
+            Party.filter(query)
+            .annotate(relevance=relevance)
+            .filter(relevance__gt=0)
+            .order_by("-relevance", "-id")
+            .limit(fetch_size)
+            .values_list("id", "relevance")
+        )
+
+        sport_ids = await Sport.filter(name__icontains=search_query).values_list(
+            "id", flat=True
+        )
+        if sport_ids:
+            ranked += await (
+                Party.filter(query, sport_id__in=sport_ids)
+                .annotate(relevance=relevance)
+                .order_by("-relevance", "-id")
+                .limit(fetch_size)
+                .values_list("id", "relevance")
+            )
+
+        relevance_by_id = {party_id: score for party_id, score in ranked}
+        page_ids = sorted(
+            relevance_by_id,
+            key=lambda party_id: (relevance_by_id[party_id], party_id),
+            reverse=True,
+        )[fetch_size - page_size : fetch_size]
+        if not page_ids:
+            return []
+
+        parties = {
+            party.id: party
+            for party in await Party.filter(id__in=page_ids).select_related(
+                "sport", "organizer_user"
+            )
+        }
+        return [parties[party_id] for party_id in page_ids if party_id in parties]
 
+    async def get_nearby_parties(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        sport_id_list: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        gather_date_min: Optional[str] = None,
+        gather_date_max: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[PartyListDetail]:
+        """
+        반경 내 파티를 가까운 순으로 조회합니다.
+        geohash prefix(인덱스)와 위경도 범위로 후보를 좁힌 뒤, 후보에 대해서만 실제 거리를 계산합니다.
+        is_active 를 지정하지 않으면 모집 중(활성, 만남 시간 전)인 파티만 조회합니다.
+
+        후보는 최대 PARTY_NEARBY_MAX_CANDIDATES 개까지만 확인합니다.
+        후보가 그보다 많으면(밀집 지역) 검색 반경을 절반씩 줄여 다시 조회하므로,
+        결과는 줄어든 반경 안의 파티로만 채워져 limit 개보다 적을 수 있지만 항상 가장 가까운 파티들입니다.
+        PARTY_NEARBY_MAX_SHRINK_COUNT 번 줄여도 많으면 최신(id 역순) 후보만 확인합니다.
+        """
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid coordinates"
+            )
+        if is_active is None:
+            is_active = True
+        try:
+            query = self._build_filter_query(
+                sport_id_list=sport_id_list,
+                is_active=is_active,
+                gather_date_min=gather_date_min,
+                gather_date_max=gather_date_max,
+            )
             if is_active:
-                query &= Q(is_active=True)
+                # 지난 파티가 후보 개수를 차지하지 않도록 제외
+                query &= Q(gather_at__gte=datetime.now(UTC))
 
-            if gather_date_min:
-                gather_at_min = datetime.strptime(gather_date_min, FORMAT_YYYY_MM_DD)
-                gather_at_min = gather_at_min.replace(
-                    hour=0, minute=0, second=0, microsecond=0
+            for shrink_count in range(PARTY_NEARBY_MAX_SHRINK_COUNT + 1):
+                candidate_query = Party.filter(
+                    query & self._build_nearby_query(latitude, longitude, radius_km)
                 )
-                gather_at_min_with_tz = gather_at_min.replace(
-                    tzinfo=ZoneInfo(TIME_ZONE)
+                if shrink_count == PARTY_NEARBY_MAX_SHRINK_COUNT:
+                    candidate_query = candidate_query.order_by("-id")
+                # 좌표만 조회해 거리를 계산하고, 가까운 limit 개만 관계 데이터와 함께 조회
+                candidates = await candidate_query.limit(
+                    PARTY_NEARBY_MAX_CANDIDATES
+                ).values_list("id", "latitude", "longitude")
+                if len(candidates) < PARTY_NEARBY_MAX_CANDIDATES:
+                    break
+                if shrink_count < PARTY_NEARBY_MAX_SHRINK_COUNT:
+                    radius_km /= 2
+            else:
+                logger.warning(
+                    f"[Party Nearby] too many candidates around ({latitude}, {longitude}), "
+                    f"radius_km:{radius_km}"
                 )
-                query &= Q(gather_at__gte=gather_at_min_with_tz)
 
-            if gather_date_max:
-                gather_at_max = datetime.strptime(gather_date_max, FORMAT_YYYY_MM_DD)
-                gather_at_max += timedelta(days=1)
-                gather_at_max = gather_at_max.replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                gather_at_max_with_tz = gather_at_max.replace(
-                    tzinfo=ZoneInfo(TIME_ZONE)
+            distances = {}
+            for party_id, party_latitude, party_longitude in candidates:
+                distance_km = haversine_km(
+                    latitude, longitude, party_latitude, party_longitude
                 )
-                query &= Q(gather_at__lt=gather_at_max_with_tz)
-
-            if search_query:
-                # TODO 쿼리 개선 필요
-                query &= (
-                    Q(title__icontains=search_query)
-                    | Q(place_name__icontains=search_query)
-                    | Q(body__icontains=search_query)
-                    | Q(sport__name__icontains=search_query)
+                if distance_km <= radius_km:
+                    distances[party_id] = distance_km
+            nearest_ids = sorted(
+                distances, key=lambda party_id: (distances[party_id], -party_id)
+            )[:limit]
+            parties = {
+                party.id: party
+                for party in await Party.filter(id__in=nearest_ids).select_related(
+                    "sport", "organizer_user"
                 )
-                # query &= (Q(title__icontains=search_query) | Q(body__icontains=search_query) | Q(place_name__icontains=search_query))
-
-            # 페이징 계산
-            offset = (page - 1) * page_size
-            limit = page_size
-
-            parties = (
-                await Party.filter(query)
-                .select_related("sport", "organizer_user")
-                .prefetch_related("participants")
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
-            )
-            party_list = [await self._build_party_response(party) for party in parties]
+            }
+            nearby_parties = [
+                (distances[party_id], parties[party_id])
+                for party_id in nearest_ids
+                if party_id in parties
+            ]
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        party_list = []
+        for distance_km, party in nearby_parties:
+            party_detail = self._build_party_response(party)
+            party_detail.distance_km = round(distance_km, 3)
+            party_list.append(party_detail)
         return party_list
 
+    @staticmethod
+    def _build_nearby_query(latitude: float, longitude: float, radius_km: float) -> Q:
+        """반경을 감싸는 geohash prefix(인덱스)와 위경도 범위 조건"""
+        geohash_query = Q()
+        for prefix in get_nearby_geohash_prefixes(latitude, longitude, radius_km):
+            geohash_query |= Q(geohash__startswith=prefix)
+        # geohash 셀 중 반경을 감싸는 사각형 밖의 row 는 DB 에서 제외
+        min_lat, max_lat, min_lon, max_lon = get_bounding_box(
+            latitude, longitude, radius_km
+        )
+        if min_lon <= max_lon:
+            longitude_query = Q(longitude__gte=min_lon, longitude__lte=max_lon)
+        else:
+            # 날짜 변경선을 넘는 경우
+            longitude_query = Q(longitude__gte=min_lon) | Q(longitude__lte=max_lon)
+        return (
+            geohash_query
+            & Q(latitude__gte=min_lat, latitude__lte=max_lat)
+            & longitude_query
+        )
+
+    @staticmethod
+    def _build_filter_query(
+        sport_id_list: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        gather_date_min: Optional[str] = None,
+        gather_date_max: Optional[str] = None,
+    ) -> Q:
+        query = Q(is_deleted=False)
+
+        if sport_id_list is not None:
+            query &= Q(sport_id__in=sport_id_list)
+
+        if is_active:
+            query &= Q(is_active=True)
+
+        if gather_date_min:
+            gather_at_min = datetime.strptime(gather_date_min, FORMAT_YYYY_MM_DD)
+            gather_at_min = gather_at_min.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            gather_at_min_with_tz = gather_at_min.replace(tzinfo=ZoneInfo(TIME_ZONE))
+            query &= Q(gather_at__gte=gather_at_min_with_tz)
+
+        if gather_date_max:
+            gather_at_max = datetime.strptime(gather_date_max, FORMAT_YYYY_MM_DD)
+            gather_at_max += timedelta(days=1)
+            gather_at_max = gather_at_max.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            gather_at_max_with_tz = gather_at_max.replace(tzinfo=ZoneInfo(TIME_ZONE))
+            query &= Q(gather_at__lt=gather_at_max_with_tz)
+        return query
+
     async def get_self_organized_parties(
-        self, page: int = 1, page_size: int = 10
-    ) -> List[PartyListDetail]:
+        self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None
+    ) -> PartyListPage:
         try:
-            offset = (page - 1) * page_size
-            limit = page_size
-
-            parties = (
-                await Party.filter(organizer_user=self.user)
-                .select_related("sport", "organizer_user")
-                .prefetch_related("participants")
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
+            parties, next_cursor = await fetch_id_keyset_page(
+                Party.filter(organizer_user=self.user, is_deleted=False).select_related(
+                    "sport", "organizer_user"
+                ),
+                page_size=page_size,
+                cursor=cursor,
+                page=page,
             )
-            party_list = [await self._build_party_response(party) for party in parties]
+            party_list = self._build_party_list(parties)
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        return party_list
+        return PartyListPage(parties=party_list, next_cursor=next_cursor)
 
     async def get_participated_parties(
-        self, page: int = 1, page_size: int = 10
-    ) -> List[PartyListDetail]:
+        self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None
+    ) -> PartyListPage:
         try:
-            offset = (page - 1) * page_size
-            limit = page_size
-            party_participates = (
-                await PartyParticipant.filter(
+            # 커서는 참가 신청(party_participants) id 기준
+            party_participates, next_cursor = await fetch_id_keyset_page(
+                PartyParticipant.filter(
                     participant_user=self.user,
+                    party__is_deleted=False,
                     status__in=[
                         ParticipationStatus.APPROVED,
                         ParticipationStatus.PENDING,
                     ],
-                )
-                .select_related(
-                    "party", "party__sport", "participant_user", "party__organizer_user"
-                )
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
+                ).select_related("party", "party__sport", "party__organizer_user"),
+                page_size=page_size,
+                cursor=cursor,
+                page=page,
+            )
+            party_list = self._build_party_list(
+                [party_participate.party for party_participate in party_participates]
             )
-            party_list = [
-                await self._build_party_response(party_participate.party)
-                for party_participate in party_participates
-            ]
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        return party_list
+        return PartyListPage(parties=party_list, next_cursor=next_cursor)
+
+    def _build_party_list(self, parties: List[Party]) -> List[PartyListDetail]:
+        return [self._build_party_response(party) for party in parties]
 
-    async def _build_party_response(self, party: Party) -> PartyListDetail:
-        approved_participants = await PartyParticipant.filter(
-            party=party, status=ParticipationStatus.APPROVED
-        ).count()
+    def _build_party_response(self, party: Party) -> PartyListDetail:
         return PartyListDetail(
             id=party.id,
             sport_name=party.sport.name,
@@ -528,7 +785,7 @@ class PartyListService:
             gather_time=party.gather_at.strftime(FORMAT_HH_MM)
             if party.gather_at
             else "",
-            participants_info=f"{approved_participants + 1}/{party.participant_limit}",
+            participants_info=f"{party.approved_count + 1}/{party.participant_limit}",
             price=party.participant_cost,
             body=party.body,
             organizer_profile=UserSimpleProfile(
@@ -586,53 +843,29 @@ class PartyCommentService:
                 party_id=self.party_id, commenter=self.user, content=content
             )
 
-            # 파티원들에게 알람 보내기
-            notification_service = NotificationService()
-            party = await Party.get_or_none(id=self.party_id)
-            participant_list = (
-                await PartyParticipant.filter(
-                    party_id=self.party_id,
-                    status__in=[
-                        ParticipationStatus.APPROVED,
-                        ParticipationStatus.PENDING,
-                    ],
-                )
-                .select_related("participant_user")
-                .all()
-            )
-            message_list = []
-            for participant in participant_list:
-                # 자기 자신 제외한 사람들에게 알람
-                if not self.user:
-                    break
-                if self.user.id == participant.participant_user_id:
-                    continue
-                message = MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
-                    user=self.user.name, party=party.title
-                )
-                notification_info = NotificationSpecificDto(
-                    type=NOTIFICATION_TYPE_PARTY,
-                    classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
-                    related_id=self.party_id,
-                    message=message,
-                    is_global=False,
-                    target_user_id=participant.participant_user_id,
-                )
-                message_list.append(notification_info)
-            if self.user and party.organizer_user_id != self.user.id:
-                message = MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
-                    user=self.user.name, party=party.title
+            # 파티장과 파티원들에게 알람 보내기 (자기 자신 제외)
+            if self.user:
+                party_title = (
+                    await Party.filter(id=self.party_id)
+                    .first()
+                    .values_list("title", flat=True)
                 )
-                notification_info = NotificationSpecificDto(
-                    type=NOTIFICATION_TYPE_PARTY,
-                    classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
-                    related_id=self.party_id,
-                    message=message,
-                    is_global=False,
-                    target_user_id=party.organizer_user_id,
+                await notification_queue.publish(
+                    PartyNotificationEventDto(
+                        party_id=self.party_id,
+                        type=NOTIFICATION_TYPE_PARTY,
+                        classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
+                        message=MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
+                            user=self.user.name, party=party_title
+                        ),
+                        participant_statuses=[
+                            ParticipationStatus.APPROVED,
+                            ParticipationStatus.PENDING,
+                        ],
+                        exclude_user_ids=[self.user.id],
+                        notify_organizer=True,
+                    )
                 )
-                message_list.append(notification_info)
-            await notification_service.create_notifications(message_list)
 
             return PartyCommentDetail(
                 id=comment.id,
@@ -710,35 +943,31 @@ class PartyLikeService:
     def __init__(self, user: User):
         self.user = user
 
-    async def party_like(self, party_id: int) -> None:
-        party_exists = await Party.exists(id=party_id)
-        is_liked_party = await PartyLike.exists(user=self.user, party_id=party_id)
-        if not party_exists:
+    async def party_like(self, party_id: int) -> bool:
+        """
+        :return: 새로 좋아요 했으면 True, 이미 좋아요 한 상태면 False
+        """
+        if not await Party.exists(id=party_id, is_deleted=False):
             raise ValueError(f"Party-{party_id} is does not exists")
-        if is_liked_party:
-            raise ValueError(f"Party-{party_id} is already liked")
-        await PartyLike.create(user=self.user, party_id=party_id)
-
-    async def cancel_party_like(self, party_id: int) -> None:
-        party_exists = await Party.exists(id=party_id)
-        liked_party = await PartyLike.get_or_none(user=self.user, party_id=party_id)
-        if not party_exists:
+        return await insert_ignore(PartyLike, user=self.user, party_id=party_id)
+
+    async def cancel_party_like(self, party_id: int) -> bool:
+        """
+        :return: 좋아요를 취소했으면 True, 좋아요 하지 않은 상태였으면 False
+        """
+        if not await Party.exists(id=party_id, is_deleted=False):
             raise ValueError(f"Party-{party_id} is does not exists")
-        if not liked_party:
-            raise ValueError(f"Party-{party_id} is already liked")
-        await liked_party.delete()
-
-    async def _build_party_info(self, party: Party) -> PartyListDetail:
-        approved_participants = await PartyParticipant.filter(
-            party=party, status=ParticipationStatus.APPROVED
-        ).count()  # TODO 추후 캐시로 처리
+        return bool(await PartyLike.filter(user=self.user, party_id=party_id).delete())
+
+    @staticmethod
+    def _build_party_info(party: Party) -> PartyListDetail:
         return PartyListDetail(
             id=party.id,
             sport_name=party.sport.name,
             title=party.title,
             gather_date=party.gather_at.strftime(FORMAT_YYYY_MM_DD),
             gather_time=party.gather_at.strftime(FORMAT_HH_MM),
-            participants_info=f"{approved_participants}/{party.participant_limit}",
+            participants_info=f"{party.approved_count}/{party.participant_limit}",
             price=party.participant_cost,
             body=party.body,
             organizer_profile=UserSimpleProfile(
@@ -757,20 +986,18 @@ class PartyLikeService:
         )
 
     async def get_liked_parties(
-        self, page: int = 1, page_size: int = 8
-    ) -> List[PartyListDetail]:
-        # 페이징 계산
-        offset = (page - 1) * page_size
-        limit = page_size
-        liked_parties = (
-            await PartyLike.filter(user=self.user)
-            .select_related("party", "party__organizer_user", "party__sport")
-            .offset(offset)
-            .limit(limit)
-            .order_by("-id")
+        self, page: int = 1, page_size: int = 8, cursor: Optional[str] = None
+    ) -> PartyListPage:
+        # 커서는 좋아요(party_likes) id 기준
+        liked_parties, next_cursor = await fetch_id_keyset_page(
+            PartyLike.filter(user=self.user, party__is_deleted=False).select_related(
+                "party", "party__organizer_user", "party__sport"
+            ),
+            page_size=page_size,
+            cursor=cursor,
+            page=page,
         )
         liked_party_info_list = [
-            await self._build_party_info(liked_party.party)
-            for liked_party in liked_parties
+            self._build_party_info(liked_party.party) for liked_party in liked_parties
         ]
-        return liked_party_info_list
+        return PartyListPage(parties=liked_party_info_list, next_cursor=next_cursor)
@@ -1,7 +1,406 @@
-from parties.models import Party
-from datetime import datetime
+import math
+import time
+from typing import Dict, List, Optional, Tuple
 
+from pypika.terms import Term, ValueWrapper
+from tortoise.contrib.mysql.search import Mode, SearchCriterion
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
 
-async def inactive_expired_parties() -> None:
-    _now = datetime.now()
-    await Party.filter(gather_at__lte=_now).update(is_active=False)
+from common.cache_constants import (
+    CACHE_KEY_PARTY_DETAIL,
+    CACHE_KEY_PARTY_DETAIL_VERSION,
+    CACHE_KEY_PARTY_EXPIRY_QUEUE,
+    PARTY_DETAIL_VERSION_EXPIRE_TIME,
+)
+from common.cache_utils import RedisManager
+from common.config import logger
+from parties.models import (
+    Party,
+    PartyComment,
+    PartyLike,
+    PartyParticipant,
+    ParticipationStatus,
+)
+from datetime import UTC, datetime
+
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+PARTY_GEOHASH_PRECISION = 9  # 약 5m x 5m
+EARTH_RADIUS_KM = 6371.0
+PARTY_NEARBY_MAX_GEOHASH_CELLS = 32  # 반경 검색 시 사용할 geohash prefix 최대 개수
+PARTY_NEARBY_MAX_CANDIDATES = 2000  # 반경 검색 시 거리를 계산할 후보 최대 개수
+PARTY_NEARBY_MAX_SHRINK_COUNT = 4  # 후보가 너무 많을 때 검색 반경을 절반으로 줄이는 최대 횟수
+PARTY_SEARCH_MAX_LENGTH = 100
+PARTY_PURGE_CHUNK_SIZE = 1000
+
+
+async def schedule_party_expiry(party_id: int, gather_at: Optional[datetime]) -> None:
+    """만료 대기열(sorted set)에 파티의 gather_at 을 등록/갱신합니다."""
+    if gather_at is None:
+        return
+    await RedisManager().add_to_sorted_set(
+        CACHE_KEY_PARTY_EXPIRY_QUEUE, {str(party_id): gather_at.timestamp()}
+    )
+
+
+async def sync_party_expiry_queue(batch_size: int = 500) -> int:
+    """
+    활성 파티 전체를 만료 대기열에 다시 등록합니다. (서버 시작 시 누락분 보정용)
+    :return: 등록된 파티 수
+    """
+    redis = RedisManager()
+    synced_count = 0
+    last_id = 0
+    while True:
+        parties = (
+            await Party.filter(is_active=True, id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values("id", "gather_at")
+        )
+        if not parties:
+            break
+        mapping = {
+            str(party["id"]): party["gather_at"].timestamp()
+            for party in parties
+            if party["gather_at"]
+        }
+        if mapping:
+            await redis.add_to_sorted_set(CACHE_KEY_PARTY_EXPIRY_QUEUE, mapping)
+        synced_count += len(mapping)
+        last_id = parties[-1]["id"]
+    return synced_count
+
+
+async def inactive_expired_parties(batch_size: int = 500) -> int:
+    """
+    만료 대기열에서 gather_at 이 지난 파티만 꺼내 비활성화합니다.
+    아직 활성 상태인 row 만 갱신하며, 그 사이 gather_at 이 미뤄진 파티는 다시 등록합니다.
+    :return: 비활성화된 파티 수
+    """
+    redis = RedisManager()
+    deactivated_count = 0
+    while True:
+        _now = datetime.now(UTC)
+        due_members = await redis.get_sorted_set_members_by_score(
+            CACHE_KEY_PARTY_EXPIRY_QUEUE, _now.timestamp(), limit=batch_size
+        )
+        if not due_members:
+            break
+        due_party_ids = [int(member) for member in due_members]
+
+        expired_party_ids = await Party.filter(
+            id__in=due_party_ids, is_active=True, gather_at__lte=_now
+        ).values_list("id", flat=True)
+        if expired_party_ids:
+            deactivated_count += await Party.filter(
+                id__in=expired_party_ids, is_active=True
+            ).update(is_active=False)
+        await redis.remove_from_sorted_set(CACHE_KEY_PARTY_EXPIRY_QUEUE, *due_members)
+
+        # 조회 후 gather_at 이 변경된 파티는 새 시간으로 다시 등록
+        for party in await Party.filter(
+            id__in=due_party_ids, is_active=True, gather_at__gt=_now
+        ).values("id", "gather_at"):
+            await schedule_party_expiry(party["id"], party["gather_at"])
+
+        for party_id in expired_party_ids:
+            await invalidate_party_detail_cache(party_id)
+
+        if len(due_members) < batch_size:
+            break
+    return deactivated_count
+
+
+async def purge_party(party_id: int, chunk_size: int = PARTY_PURGE_CHUNK_SIZE) -> None:
+    """
+    파티와 하위 row(참가/댓글/좋아요)를 한 트랜잭션에서 삭제합니다.
+    하위 row 가 많은 경우를 위해 chunk_size 단위로 나눠 삭제하고, 삭제 후 상세 캐시도 함께 지웁니다.
+    """
+    async with in_transaction():
+        for model in (PartyParticipant, PartyComment, PartyLike):
+            while True:
+                child_ids = (
+                    await model.filter(party_id=party_id)
+                    .limit(chunk_size)
+                    .values_list("id", flat=True)
+                )
+                if not child_ids:
+                    break
+                await model.filter(id__in=child_ids).delete()
+        await Party.filter(id=party_id).delete()
+    await delete_party_detail_cache(party_id)
+
+
+async def purge_deleted_parties(batch_size: int = 100) -> int:
+    """
+    삭제 표시(is_deleted)된 파티를 실제로 삭제합니다.
+    :return: 삭제된 파티 수
+    """
+    purged_count = 0
+    last_id = 0
+    while True:
+        party_ids = (
+            await Party.filter(is_deleted=True, id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values_list("id", flat=True)
+        )
+        if not party_ids:
+            break
+        for party_id in party_ids:
+            try:
+                await purge_party(party_id)
+                purged_count += 1
+            except Exception as e:
+                logger.error(f"[Party Purge Error]: party_id:{party_id}, msg:{e}")
+        last_id = party_ids[-1]
+    return purged_count
+
+
+async def get_party_detail_cache_key(party_id: int) -> str:
+    """현재 버전의 파티 상세 캐시 키"""
+    version = await RedisManager().get_counter(
+        CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party_id)
+    )
+    return CACHE_KEY_PARTY_DETAIL.format(party_id=party_id, version=version or 0)
+
+
+async def invalidate_party_detail_cache(party_id: int) -> None:
+    """
+    버전을 바꿔 파티 상세 캐시를 무효화합니다.
+    무효화 전에 조회를 시작한 요청은 이전 버전 키에 저장하므로 오래된 값이 다시 읽히지 않습니다.
+    버전 키는 PARTY_DETAIL_VERSION_EXPIRE_TIME 뒤 만료되므로, 만료 후 다시 무효화할 때
+    예전 버전 번호가 재사용되지 않도록 INCR 대신 현재 시각(ns)을 버전으로 사용합니다.
+    """
+    await RedisManager().set_counter(
+        CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party_id),
+        time.time_ns(),
+        expire=PARTY_DETAIL_VERSION_EXPIRE_TIME,
+    )
+
+
+async def delete_party_detail_cache(party_id: int) -> None:
+    """삭제된 파티의 버전 키와 조회될 수 있는 상세 캐시(현재 버전, 버전 0)를 삭제"""
+    await RedisManager().delete_values(
+        [
+            await get_party_detail_cache_key(party_id),
+            CACHE_KEY_PARTY_DETAIL.format(party_id=party_id, version=0),
+            CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party_id),
+        ]
+    )
+
+
+async def get_approved_participant_counts(party_ids: List[int]) -> Dict[int, int]:
+    """파티별 승인된 참가자 수를 한 번의 group by 쿼리로 조회"""
+    if not party_ids:
+        return {}
+    rows = (
+        await PartyParticipant.filter(
+            party_id__in=party_ids, status=ParticipationStatus.APPROVED
+        )
+        .annotate(count=Count("id"))
+        .group_by("party_id")
+        .values("party_id", "count")
+    )
+    return {row["party_id"]: row["count"] for row in rows}
+
+
+async def refresh_party_approved_counts(
+    party_ids: Optional[List[int]] = None, batch_size: int = 500
+) -> int:
+    """
+    party_participants 기준으로 parties.approved_count 를 재계산합니다.
+    :return: 값이 보정된 파티 수
+    """
+    queryset = Party.all() if party_ids is None else Party.filter(id__in=party_ids)
+    updated_count = 0
+    last_id = 0
+    while True:
+        parties = (
+            await queryset.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values("id", "approved_count")
+        )
+        if not parties:
+            break
+        last_id = parties[-1]["id"]
+
+        approved_counts = await get_approved_participant_counts(
+            [party["id"] for party in parties]
+        )
+        for party in parties:
+            approved_count = approved_counts.get(party["id"], 0)
+            if party["approved_count"] != approved_count:
+                await Party.filter(id=party["id"]).update(approved_count=approved_count)
+                updated_count += 1
+    return updated_count
+
+
+def encode_geohash(
+    latitude: Optional[float],
+    longitude: Optional[float],
+    precision: int = PARTY_GEOHASH_PRECISION,
+) -> Optional[str]:
+    """위경도를 geohash 문자열로 변환 (유효하지 않은 좌표는 None)"""
+    if latitude is None or longitude is None:
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit_count = 0
+    is_lon_bit = True
+    while len(geohash) < precision:
+        value_range, value = (
+            (lon_range, longitude) if is_lon_bit else (lat_range, latitude)
+        )
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        is_lon_bit = not is_lon_bit
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(geohash)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """precision 별 geohash 셀의 (위도 폭, 경도 폭) - 단위: 도"""
+    lon_bits = (precision * 5 + 1) // 2
+    lat_bits = precision * 5 // 2
+    return 180.0 / (2**lat_bits), 360.0 / (2**lon_bits)
+
+
+def get_bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> Tuple[float, float, float, float]:
+    """
+    반경을 감싸는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)
+    날짜 변경선을 넘으면 최소 경도가 최대 경도보다 큽니다.
+    """
+    km_per_lat_degree = math.pi * EARTH_RADIUS_KM / 180
+    lat_delta = radius_km / km_per_lat_degree
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+    # 극점을 포함하거나 가까우면 경도 전체
+    cos_lat = min(
+        math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat))
+    )
+    lon_delta = radius_km / (km_per_lat_degree * max(cos_lat, 1e-6))
+    if lon_delta >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    min_lon = (longitude - lon_delta + 180) % 360 - 180
+    max_lon = (longitude + lon_delta + 180) % 360 - 180
+    return min_lat, max_lat, min_lon, max_lon
+
+
+def get_nearby_geohash_prefixes(
+    latitude: float, longitude: float, radius_km: float
+) -> List[str]:
+    """
+    반경을 감싸는 사각형을 모두 덮는 geohash prefix 목록을 반환합니다.
+    셀 개수가 PARTY_NEARBY_MAX_GEOHASH_CELLS 이하인 가장 정밀한 precision 을 사용합니다.
+    """
+    min_lat, max_lat, min_lon, max_lon = get_bounding_box(
+        latitude, longitude, radius_km
+    )
+    is_full_lon = (min_lon, max_lon) == (-180.0, 180.0)
+    lon_span = 360.0 if is_full_lon else (max_lon - min_lon) % 360
+
+    precision = 1
+    for candidate in range(PARTY_GEOHASH_PRECISION, 0, -1):
+        lat_size, lon_size = geohash_cell_size(candidate)
+        lat_cells = math.floor(max_lat / lat_size) - math.floor(min_lat / lat_size) + 1
+        lon_cells = math.floor(lon_span / lon_size) + 2
+        if lat_cells * lon_cells <= PARTY_NEARBY_MAX_GEOHASH_CELLS:
+            precision = candidate
+            break
+
+    lat_size, lon_size = geohash_cell_size(precision)
+    prefixes = set()
+    # 사각형이 걸치는 셀마다 셀 중심 좌표로 prefix 계산
+    cell_lat = (math.floor(min_lat / lat_size) + 0.5) * lat_size
+    while cell_lat - lat_size / 2 <= max_lat:
+        lon_offset = 0.0
+        while lon_offset <= lon_span + lon_size:
+            cell_lon = (min_lon + lon_offset + 180) % 360 - 180
+            cell_lon = (math.floor(cell_lon / lon_size) + 0.5) * lon_size
+            prefix = encode_geohash(
+                min(max(cell_lat, -90.0), 90.0), cell_lon, precision
+            )
+            if prefix:
+                prefixes.add(prefix)
+            lon_offset += lon_size
+        cell_lat += lat_size
+    return sorted(prefixes)
+
+
+def haversine_km(
+    latitude_1: float, longitude_1: float, latitude_2: float, longitude_2: float
+) -> float:
+    lat_1, lat_2 = math.radians(latitude_1), math.radians(latitude_2)
+    d_lat = lat_2 - lat_1
+    d_lon = math.radians(longitude_2 - longitude_1)
+    a = (
+        math.sin(d_lat / 2) ** 2
+        + math.cos(lat_1) * math.cos(lat_2) * math.sin(d_lon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+async def refresh_party_geohashes(batch_size: int = 500) -> int:
+    """
+    위경도 기준으로 parties.geohash 를 다시 계산합니다.
+    :return: 값이 보정된 파티 수
+    """
+    updated_count = 0
+    last_id = 0
+    while True:
+        parties = (
+            await Party.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values("id", "latitude", "longitude", "geohash")
+        )
+        if not parties:
+            break
+        last_id = parties[-1]["id"]
+
+        for party in parties:
+            geohash = encode_geohash(party["latitude"], party["longitude"])
+            if party["geohash"] != geohash:
+                await Party.filter(id=party["id"]).update(geohash=geohash)
+                updated_count += 1
+    return updated_count
+
+
+def supports_party_fulltext_search() -> bool:
+    """parties FULLTEXT(ngram) 인덱스는 MySQL 에만 존재합니다."""
+    return Party._meta.db.capabilities.dialect == "mysql"
+
+
+def build_party_search_relevance(search_query: str) -> Term:
+    """
+    title/place_name/body FULLTEXT 인덱스에 대한 MATCH ... AGAINST relevance 식을 생성합니다.
+    pypika 는 작은따옴표만 이스케이프하므로 백슬래시는 직접 이스케이프합니다.
+    """
+    keyword = search_query.strip()[:PARTY_SEARCH_MAX_LENGTH].replace("\\", "\\\\")
+    table = Party._meta.basetable
+    return SearchCriterion(
+        table.title,
+        table.place_name,
+        table.body,
+        expr=ValueWrapper(keyword),
+        mode=Mode.NATURAL_LANGUAGE_MODE,
+    )
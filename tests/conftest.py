@@ -44,8 +44,13 @@
 import asyncio
 from typing import Generator
 from httpx import AsyncClient
+import fakeredis
 import pytest
 
+from common.cache_utils import FAKE_REDIS_SERVER
+from common.two_tier_cache import clear_local_caches
+from community.utils import tag_cache
+
 
 @pytest.fixture(scope="session")
 def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -65,6 +70,10 @@ def prepare_db(request: pytest.FixtureRequest, loop: asyncio.AbstractEventLoop)
         except Exception:
             pass
         await db_init("sqlite://:memory:")
+        # 테스트마다 id 가 재사용되므로 fakeredis 데이터도 비운다
+        fakeredis.FakeRedis(server=FAKE_REDIS_SERVER).flushall()
+        tag_cache.clear()
+        clear_local_caches()
 
     loop.run_until_complete(setup_db())
 
@@ -1,10 +1,34 @@
+import asyncio
 import io
+import time
+from typing import Any, Dict, List
+
+import fakeredis
 import pytest
+from PIL import Image
 from starlette import status
 from httpx import AsyncClient
 
+from common.cache_constants import (
+    CACHE_KEY_JOB_LOCK,
+    CACHE_KEY_POST_LIKES,
+    CACHE_KEY_POST_TRENDING,
+    CACHE_KEY_POST_TRENDING_EPOCH,
+    CACHE_KEY_RECOMPUTE_LOCK,
+    POST_TRENDING_HALF_LIFE,
+    POST_TRENDING_WEIGHT_LIKE,
+)
+from common.cache_utils import FAKE_REDIS_SERVER, RedisManager
 from common.dependencies import get_current_user
-from community.service.post_service import PostViewService
+from common.utils import insert_ignore
+from community.service.post_service import (
+    PostService,
+    PostViewService,
+    post_likes_cache,
+)
+from community.service.comment_service import CommentService
+from community import utils as community_utils
+from community.utils import flush_post_view_counts, rebase_post_trending_scores
 from users.models import User
 from community.models import (
     Post,
@@ -19,6 +43,13 @@ from community.models import (
 )
 
 
+def _create_image_bytes(width: int, height: int, image_format: str) -> io.BytesIO:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (0, 128, 255)).save(buffer, image_format)
+    buffer.seek(0)
+    return buffer
+
+
 @pytest.mark.asyncio
 async def test_create_post_success(client: AsyncClient) -> None:
     """
@@ -59,6 +90,100 @@ async def test_create_post_success(client: AsyncClient) -> None:
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_create_post_with_images_success(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    이미지마다 썸네일/WebP 파생 이미지를 만들어 원본과 함께 업로드하고,
+    업로드된 순서대로 PostImage 가 저장된다
+    """
+    user = await User.create(name="imageuser", email="image@example.com")
+    uploaded_objects = {}
+
+    async def mock_upload_fileobj(fileobj: Any, object_name: str) -> bool:
+        uploaded_objects[object_name] = fileobj.read()
+        return True
+
+    monkeypatch.setattr("common.utils.s3_upload_fileobj", mock_upload_fileobj)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    files = [
+        ("image", ("img1.png", _create_image_bytes(1200, 800, "PNG"), "image/png")),
+        ("image", ("img2.jpg", _create_image_bytes(300, 600, "JPEG"), "image/jpeg")),
+    ]
+    response = await client.post(
+        "/api/community/post",
+        data={"title": "Images", "body": "Body"},
+        files=files,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    post_id = response.json()["post_id"]
+    images = await PostImage.filter(post_id=post_id).order_by("id")
+    assert [image.image.rsplit(".", 1)[1] for image in images] == ["png", "jpg"]
+    assert len(uploaded_objects) == 6
+    for image in images:
+        assert image.image.startswith(f"post/{post_id}/images/")
+        assert image.thumbnail_image and image.webp_image
+        assert image.webp_image == image.image.rsplit(".", 1)[0] + ".webp"
+
+    # 썸네일은 비율을 유지한 채 긴 변 400px 이하의 WebP 로 저장
+    with Image.open(io.BytesIO(uploaded_objects[images[0].thumbnail_image])) as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (400, 267)
+    with Image.open(io.BytesIO(uploaded_objects[images[1].webp_image])) as webp:
+        assert webp.size == (300, 600)
+
+    # 목록은 썸네일, 상세는 WebP 를 함께 내려준다
+    list_response = await client.get("/api/community/post")
+    assert list_response.json()["results"][0]["thumbnail_images"] == [
+        image.thumbnail_image for image in images
+    ]
+    detail_response = await client.get(f"/api/community/post/{post_id}")
+    assert detail_response.json()["webp_images"] == [
+        image.webp_image for image in images
+    ]
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_create_post_fail_invalid_image(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    이미지가 아닌 파일이 섞여 있으면 게시글을 만들지 않고 400 Bad Request
+    """
+    user = await User.create(name="imageuser", email="image@example.com")
+
+    async def mock_upload_fileobj(fileobj: Any, object_name: str) -> bool:
+        raise AssertionError("invalid images must not be uploaded")
+
+    monkeypatch.setattr("common.utils.s3_upload_fileobj", mock_upload_fileobj)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    files = [
+        ("image", ("img1.png", _create_image_bytes(100, 100, "PNG"), "image/png")),
+        ("image", ("img2.png", io.BytesIO(b"fake_image2"), "image/png")),
+    ]
+    response = await client.post(
+        "/api/community/post",
+        data={"title": "Images", "body": "Body"},
+        files=files,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not await Post.filter(writer_id=user.id).exists()
+
+    app.dependency_overrides.clear()
+
+
 @pytest.mark.asyncio
 async def test_create_post_fail_too_many_images(client: AsyncClient) -> None:
     """
@@ -151,6 +276,74 @@ async def test_get_post_detail_success(client: AsyncClient) -> None:
     # 필요 시 Redis mock 을 통해 실제로 뽑아볼 수도 있음.
 
 
+@pytest.mark.asyncio
+async def test_post_views_flushed_to_db(client: AsyncClient) -> None:
+    """
+    조회수는 Redis 에 누적되고, flush 시 DB 에 한 번에 반영되는지 테스트
+    """
+    user = await User.create(name="ViewUser", email="view@example.com")
+    post = await Post.create(title="View Title", body="View Body", writer=user, views=5)
+    other_post = await Post.create(title="Other", body="Other", writer=user, views=1)
+
+    for _ in range(2):
+        response = await client.get(f"/api/community/post/{post.id}")
+        assert response.status_code == status.HTTP_200_OK
+    await client.get(f"/api/community/post/{other_post.id}")
+
+    # DB 반영 전에도 누적된 조회수가 응답에 포함
+    assert response.json()["views"] == 7
+    assert (await Post.get(id=post.id)).views == 5
+
+    assert await flush_post_view_counts() == 2
+    assert (await Post.get(id=post.id)).views == 7
+    assert (await Post.get(id=other_post.id)).views == 2
+
+    # 이미 반영된 증가분은 다시 더해지지 않는다
+    assert await flush_post_view_counts() == 0
+    response = await client.get(f"/api/community/post/{post.id}")
+    assert response.json()["views"] == 8
+
+
+@pytest.mark.asyncio
+async def test_post_views_flush_retry_not_double_counted(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    배치 반영 중 실패해도 이미 반영한 배치는 다음 실행에서 다시 더해지지 않고,
+    다른 워커가 반영 중(잠금)이면 실행하지 않는다
+    """
+    user = await User.create(name="ViewUser", email="view@example.com")
+    first_post = await Post.create(title="First", body="Body", writer=user)
+    second_post = await Post.create(title="Second", body="Body", writer=user)
+    await client.get(f"/api/community/post/{first_post.id}")
+    await client.get(f"/api/community/post/{second_post.id}")
+
+    original_add_post_views = community_utils._add_post_views
+    calls = []
+
+    async def failing_add_post_views(view_deltas: Dict[int, int]) -> None:
+        calls.append(view_deltas)
+        if len(calls) == 2:
+            raise RuntimeError("db error")
+        await original_add_post_views(view_deltas)
+
+    monkeypatch.setattr(community_utils, "_add_post_views", failing_add_post_views)
+    with pytest.raises(RuntimeError):
+        await flush_post_view_counts(batch_size=1)
+    monkeypatch.setattr(community_utils, "_add_post_views", original_add_post_views)
+
+    redis = RedisManager()
+    async with redis.hold_lock(
+        CACHE_KEY_JOB_LOCK.format(name="flush_post_view_counts"), expire=5
+    ) as acquired:
+        assert acquired
+        assert await flush_post_view_counts() == 0
+
+    assert await flush_post_view_counts() == 1
+    assert (await Post.get(id=first_post.id)).views == 1
+    assert (await Post.get(id=second_post.id)).views == 1
+
+
 @pytest.mark.asyncio
 async def test_get_post_detail_includes_tags_images_success(
     client: AsyncClient
@@ -462,14 +655,291 @@ async def test_get_post_list_success() -> None:
     assert res_post2.tags[0].name == "Python"
 
     # 4) Pagination
-    await Post.create(title="Extra 1", body="Body x1", writer=user, is_active=True)
-    await Post.create(title="Extra 2", body="Body x2", writer=user, is_active=True)
+    # 전체 개수 카운터는 create_post 에서 함께 갱신된다
+    await PostService(user).create_post(title="Extra 1", body="Body x1")
+    await PostService(user).create_post(title="Extra 2", body="Body x2")
     # 이제 총 5개
     result_page2 = await service.get_post_list(page=2, page_size=2)
     assert result_page2.total_count == 5
     assert len(result_page2.results) == 2  # page2 => 2개
 
 
+@pytest.mark.asyncio
+async def test_get_post_list_counters() -> None:
+    user = await User.create(name="CounterUser", profile_image="/path/to/image.png")
+    liked_post = await Post.create(title="Liked", body="Body1", writer=user, views=3)
+    other_post = await Post.create(title="Other", body="Body2", writer=user)
+    await PostLike.create(post=liked_post, user=user)
+    await PostLike.create(post=liked_post, user=await User.create(name="AnotherUser"))
+    await PostService().increment_view(liked_post.id)
+
+    service = PostViewService(user=user)
+    # 첫 조회는 DB 집계 후 캐시에 저장, 두 번째 조회는 캐시에서 읽음
+    for _ in range(2):
+        result = await service.get_post_list(page=1, page_size=10)
+        counters = {item.id: (item.views, item.likes) for item in result.results}
+        assert counters == {liked_post.id: (4, 2), other_post.id: (0, 0)}
+
+
+@pytest.mark.asyncio
+async def test_toggle_like_cached_count_consistent() -> None:
+    """
+    좋아요 토글은 상태가 실제로 바뀐 경우에만 캐시된 좋아요 수를 증감한다
+    """
+    user = await User.create(name="LikeUser", profile_image="/path/to/image.png")
+    other_user = await User.create(name="OtherUser")
+    post = await Post.create(title="Like", body="Body", writer=user)
+    service = PostViewService(user=user)
+    # 좋아요 수 캐시 생성
+    await service.get_post_list()
+
+    assert await PostService(user).toggle_like(post.id) is True
+    assert await PostService(other_user).toggle_like(post.id) is True
+    # 이미 저장된 좋아요는 unique 제약으로 다시 저장되지 않음
+    assert await insert_ignore(PostLike, user=user, post_id=post.id) is False
+    assert await PostService(other_user).toggle_like(post.id) is False
+
+    assert await PostLike.filter(post=post).count() == 1
+    result = await service.get_post_list()
+    assert result.results[0].likes == 1
+
+
+@pytest.mark.asyncio
+async def test_get_likes_counts_single_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    캐시 miss 시 같은 게시글의 좋아요 수는 동시 요청이 와도 한 번만 집계하고,
+    다른 워커가 재계산 잠금을 잡고 있으면 그 결과가 저장될 때까지 기다린다
+    """
+    user = await User.create(name="LikeUser", profile_image="/path/to/image.png")
+    post = await Post.create(title="Like", body="Body", writer=user)
+    await PostLike.create(user=user, post=post)
+
+    load_calls: List[List[str]] = []
+    original_load_and_store = post_likes_cache._load_and_store
+
+    async def counting_load_and_store(keys: List[str], loader: Any) -> Dict[str, Any]:
+        load_calls.append(keys)
+        await asyncio.sleep(0.01)
+        return await original_load_and_store(keys, loader)
+
+    monkeypatch.setattr(post_likes_cache, "_load_and_store", counting_load_and_store)
+
+    results = await asyncio.gather(
+        *(PostViewService()._get_likes_counts([post.id]) for _ in range(5))
+    )
+    assert results == [{post.id: 1}] * 5
+    assert len(load_calls) == 1
+
+    # 다른 워커가 재계산 중인 상황
+    redis = RedisManager()
+    cache_key = CACHE_KEY_POST_LIKES.format(post_id=post.id)
+    await redis.delete_value(cache_key)
+    await redis.acquire_locks(
+        [CACHE_KEY_RECOMPUTE_LOCK.format(key=cache_key)], "other-worker", 5
+    )
+
+    async def other_worker_recompute() -> None:
+        await asyncio.sleep(0.1)
+        await redis.set_counter(cache_key, 7)
+
+    likes_counts, _ = await asyncio.gather(
+        PostViewService()._get_likes_counts([post.id]), other_worker_recompute()
+    )
+    assert likes_counts == {post.id: 7}
+    assert len(load_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_post_list_filter_by_tag_ids(client: AsyncClient) -> None:
+    """
+    tag_ids 중 하나라도 달린 게시글만 조회되고, 태그 이름은 태그 캐시에서 채워진다
+    """
+    user = await User.create(name="TagUser", profile_image="/path/to/image.png")
+    tag_diving = await Tag.create(name="Diving")
+    tag_surfing = await Tag.create(name="Surfing")
+    tag_hiking = await Tag.create(name="Hiking")
+    diving_post = await Post.create(title="Diving", body="Body1", writer=user)
+    both_post = await Post.create(title="Both", body="Body2", writer=user)
+    hiking_post = await Post.create(title="Hiking", body="Body3", writer=user)
+    await PostTag.create(post=diving_post, tag=tag_diving)
+    await PostTag.create(post=both_post, tag=tag_diving)
+    await PostTag.create(post=both_post, tag=tag_surfing)
+    await PostTag.create(post=hiking_post, tag=tag_hiking)
+
+    response = await client.get(
+        "/api/community/post",
+        params={"tag_ids": [tag_diving.id, tag_surfing.id]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    # 태그가 여러 개 걸려도 게시글은 한 번만 조회
+    assert data["total_count"] == 2
+    assert [item["id"] for item in data["results"]] == [both_post.id, diving_post.id]
+    assert data["results"][0]["tags"] == [
+        {"id": tag_diving.id, "name": "Diving"},
+        {"id": tag_surfing.id, "name": "Surfing"},
+    ]
+
+    # 태그 이름이 바뀌면 캐시도 갱신
+    tag_surfing.name = "Surf"
+    await tag_surfing.save()
+    response = await client.get(f"/api/community/post/{both_post.id}")
+    assert response.json()["tags"][1] == {"id": tag_surfing.id, "name": "Surf"}
+
+
+@pytest.mark.asyncio
+async def test_tag_cache_missing_id_refresh_rate_limited(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tag = await Tag.create(name="Diving")
+    tag_cache = community_utils.tag_cache
+    refresh_count = 0
+    original_refresh = tag_cache.refresh
+
+    async def counting_refresh() -> None:
+        nonlocal refresh_count
+        refresh_count += 1
+        await original_refresh()
+
+    monkeypatch.setattr(tag_cache, "refresh", counting_refresh)
+
+    # 태그 저장 signal 로 방금 다시 로드했으므로, 삭제된 태그 id 가 계속 요청되어도
+    # 간격 안에서는 다시 로드하지 않고 아는 태그만 반환
+    deleted_tag_id = tag.id + 1000
+    for _ in range(5):
+        names = await tag_cache.get_names([tag.id, deleted_tag_id])
+        assert names == {tag.id: "Diving"}
+    assert refresh_count == 0
+
+    # 간격이 지나면 다른 워커에서 추가된 태그일 수 있으므로 한 번 다시 로드
+    monkeypatch.setattr(tag_cache, "_refreshed_at", 0.0)
+    for _ in range(5):
+        await tag_cache.get_names([deleted_tag_id])
+    assert refresh_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_trending_posts(client: AsyncClient) -> None:
+    """
+    조회/좋아요/댓글 이벤트로 누적된 점수 순으로 조회되고,
+    epoch 를 옮겨도(rebase) 순위는 유지된다
+    """
+    user = await User.create(name="TrendUser", profile_image="/path/to/image.png")
+    viewed_post = await Post.create(title="Viewed", body="Body1", writer=user)
+    liked_post = await Post.create(title="Liked", body="Body2", writer=user)
+    inactive_post = await Post.create(
+        title="Inactive", body="Body3", writer=user, is_active=False
+    )
+    await Post.create(title="Quiet", body="Body4", writer=user)
+
+    post_service = PostService(user)
+    for _ in range(3):
+        await post_service.increment_view(viewed_post.id)
+    await post_service.toggle_like(liked_post.id)
+    await CommentService(user).create_comment(liked_post.id, "Comment")
+    await post_service.increment_view(inactive_post.id)
+
+    await rebase_post_trending_scores()
+
+    response = await client.get("/api/community/post/trending")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    # 좋아요(5) + 댓글(3) > 조회 3회, 비활성 게시글과 이벤트 없는 게시글은 제외
+    assert [item["id"] for item in data["results"]] == [liked_post.id, viewed_post.id]
+    assert data["total_count"] == 2
+
+    # 좋아요를 취소하면 점수도 함께 감소 (댓글 3 < 조회 4회)
+    await post_service.toggle_like(liked_post.id)
+    await post_service.increment_view(viewed_post.id)
+    response = await client.get("/api/community/post/trending?page_size=1")
+    assert [item["id"] for item in response.json()["results"]] == [viewed_post.id]
+
+
+@pytest.mark.asyncio
+async def test_trending_score_unlike_after_half_life_not_negative(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """t0 에 좋아요, t0 + half_life 에 취소해도 점수가 0 아래로 내려가지 않는다"""
+    now = time.time()
+    monkeypatch.setattr(community_utils.time, "time", lambda: now)
+    await community_utils.add_post_trending_score(1, POST_TRENDING_WEIGHT_LIKE)
+
+    monkeypatch.setattr(
+        community_utils.time, "time", lambda: now + POST_TRENDING_HALF_LIFE
+    )
+    await community_utils.add_post_trending_score(1, -POST_TRENDING_WEIGHT_LIKE)
+
+    client = fakeredis.FakeRedis(server=FAKE_REDIS_SERVER)
+    assert client.zscore(CACHE_KEY_POST_TRENDING, "1") == 0
+
+
+@pytest.mark.asyncio
+async def test_trending_score_epoch_changed_concurrently() -> None:
+    """
+    이전 epoch 로 계산한 점수가 rebase 뒤에 더해지지 않고,
+    다른 워커가 먼저 rebase 했으면 점수를 다시 감쇠시키지 않는다
+    """
+    redis = RedisManager()
+    client = fakeredis.FakeRedis(server=FAKE_REDIS_SERVER)
+    now = time.time()
+    old_epoch = now - 2 * POST_TRENDING_HALF_LIFE
+    await redis.set_value(CACHE_KEY_POST_TRENDING_EPOCH, old_epoch)
+    await redis.add_to_sorted_set(CACHE_KEY_POST_TRENDING, {"1": 4.0})
+
+    def concurrent_rebase() -> None:
+        # 다른 워커의 rebase 가 epoch 교체와 감쇠를 마친 상황
+        client.set(CACHE_KEY_POST_TRENDING_EPOCH, redis.serializer.dumps(now))
+        client.zadd(CACHE_KEY_POST_TRENDING, {"1": 1.0})
+
+    epochs: List[float] = []
+
+    def get_amount(epoch: float) -> float:
+        if not epochs:
+            concurrent_rebase()
+        epochs.append(epoch)
+        return 2 ** ((now - epoch) / POST_TRENDING_HALF_LIFE)
+
+    assert await redis.increment_sorted_set_score_by_epoch(
+        CACHE_KEY_POST_TRENDING,
+        "2",
+        CACHE_KEY_POST_TRENDING_EPOCH,
+        get_amount=get_amount,
+        default_epoch=now,
+    )
+    # epoch 가 바뀌어 새 epoch 로 다시 계산
+    assert epochs == [old_epoch, now]
+    assert client.zscore(CACHE_KEY_POST_TRENDING, "2") == pytest.approx(1.0)
+
+    await redis.set_value(CACHE_KEY_POST_TRENDING_EPOCH, old_epoch)
+    await redis.add_to_sorted_set(CACHE_KEY_POST_TRENDING, {"1": 4.0})
+
+    def get_factor(epoch: float) -> float:
+        concurrent_rebase()
+        return 2 ** (-(now - epoch) / POST_TRENDING_HALF_LIFE)
+
+    assert not await redis.rebase_sorted_set(
+        CACHE_KEY_POST_TRENDING,
+        CACHE_KEY_POST_TRENDING_EPOCH,
+        epoch=now,
+        get_factor=get_factor,
+        max_size=10,
+    )
+    assert client.zscore(CACHE_KEY_POST_TRENDING, "1") == pytest.approx(1.0)
+
+    # 다른 워커가 rebase 작업 잠금을 잡고 있으면 실행하지 않음
+    await redis.set_value(CACHE_KEY_POST_TRENDING_EPOCH, old_epoch)
+    await redis.add_to_sorted_set(CACHE_KEY_POST_TRENDING, {"1": 4.0})
+    async with redis.hold_lock(
+        CACHE_KEY_JOB_LOCK.format(name="rebase_post_trending_scores"), expire=10
+    ) as acquired:
+        assert acquired
+        await rebase_post_trending_scores()
+    assert client.zscore(CACHE_KEY_POST_TRENDING, "1") == pytest.approx(4.0)
+
+    await rebase_post_trending_scores()
+    assert client.zscore(CACHE_KEY_POST_TRENDING, "1") == pytest.approx(1.0, rel=1e-3)
+
+
 @pytest.mark.asyncio
 async def test_update_reply_success(client: AsyncClient) -> None:
     user = await User.create(name="ReplyUpdater", profile_image="/path/to/image.png")
@@ -515,3 +985,109 @@ async def test_delete_reply_success(client: AsyncClient) -> None:
     assert reply.is_active is False  # 실제 로직에 따라 비활성화 처리
 
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_post_comments_with_replies_success(client: AsyncClient) -> None:
+    user = await User.create(name="Commenter", profile_image="/path/to/image.png")
+    other_user = await User.create(name="OtherUser")
+    post = await Post.create(title="CommentTest", body="...", writer=user)
+    comment1 = await PostComment.create(post=post, writer=user, content="Comment 1")
+    comment2 = await PostComment.create(
+        post=post, writer=other_user, content="Comment 2"
+    )
+    reply1 = await PostCommentReply.create(
+        parent_comment=comment1, writer=other_user, content="Reply 1"
+    )
+    await PostCommentReply.create(
+        parent_comment=comment1, writer=user, content="Reply 2"
+    )
+    await PostCommentLike.create(comment=comment1, user=user)
+    await PostCommentLike.create(comment=comment1, user=other_user)
+    await PostCommentReplyLike.create(comment=reply1, user=user)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    response = await client.get(f"/api/community/post/{post.id}/comment")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["results"]
+
+    assert [comment["id"] for comment in data] == [comment2.id, comment1.id]
+    assert data[0]["likes"] == 0
+    assert data[0]["reply_count"] == 0
+    assert data[0]["reply_preview"] == []
+    assert data[0]["writer"]["name"] == "OtherUser"
+    assert data[1]["likes"] == 2
+    assert data[1]["reply_count"] == 2
+    assert [reply["content"] for reply in data[1]["reply_preview"]] == [
+        "Reply 1",
+        "Reply 2",
+    ]
+    assert [reply["likes"] for reply in data[1]["reply_preview"]] == [1, 0]
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_post_comments_cursor_and_replies_paging(
+    client: AsyncClient,
+) -> None:
+    user = await User.create(name="Commenter", profile_image="/path/to/image.png")
+    post = await Post.create(title="CommentTest", body="...", writer=user)
+    comments = [
+        await PostComment.create(post=post, writer=user, content=f"Comment {i}")
+        for i in range(3)
+    ]
+    for i in range(5):
+        await PostCommentReply.create(
+            parent_comment=comments[-1], writer=user, content=f"Reply {i}"
+        )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 댓글 커서 페이지네이션 (최신순)
+    response = await client.get(
+        f"/api/community/post/{post.id}/comment", params={"page_size": 2}
+    )
+    first_page = response.json()
+    assert [c["id"] for c in first_page["results"]] == [
+        comments[2].id,
+        comments[1].id,
+    ]
+    assert first_page["results"][0]["reply_count"] == 5
+    assert len(first_page["results"][0]["reply_preview"]) == 3
+    assert first_page["next_cursor"]
+
+    response = await client.get(
+        f"/api/community/post/{post.id}/comment",
+        params={"page_size": 2, "cursor": first_page["next_cursor"]},
+    )
+    second_page = response.json()
+    assert [c["id"] for c in second_page["results"]] == [comments[0].id]
+    assert second_page["next_cursor"] is None
+
+    # 대댓글 더보기 (작성순)
+    response = await client.get(
+        f"/api/community/comment/{comments[2].id}/replies", params={"page_size": 3}
+    )
+    replies_page = response.json()
+    assert [r["content"] for r in replies_page["results"]] == [
+        "Reply 0",
+        "Reply 1",
+        "Reply 2",
+    ]
+    response = await client.get(
+        f"/api/community/comment/{comments[2].id}/replies",
+        params={"page_size": 3, "cursor": replies_page["next_cursor"]},
+    )
+    assert [r["content"] for r in response.json()["results"]] == [
+        "Reply 3",
+        "Reply 4",
+    ]
+    assert response.json()["next_cursor"] is None
+
+    app.dependency_overrides.clear()
@@ -5,9 +5,17 @@ from httpx import AsyncClient
 from starlette import status
 from datetime import datetime, timedelta
 
+from common.cache_constants import (
+    CACHE_KEY_NOTIFICATION_STREAM,
+    NOTIFICATION_STREAM_GROUP,
+    NOTIFICATION_STREAM_MAX_LEN,
+)
+from common.cache_utils import RedisManager
 from common.dependencies import get_current_user
+from notifications.dto import PartyNotificationEventDto
 from notifications.models import Notification, NotificationRead
-from parties.models import Party
+from notifications.queue import NotificationQueue
+from parties.models import Party, PartyParticipant, ParticipationStatus
 from users.models import User, Sport
 
 
@@ -139,3 +147,91 @@ async def test_get_unread_notification_count(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_notification_queue_expands_party_event_in_batches() -> None:
+    organizer = await User.create(name="Organizer", sns_id="organizer_sns_id")
+    commenter = await User.create(name="Commenter", sns_id="commenter_sns_id")
+    party = await Party.create(
+        title="Freediving Party",
+        body="Freediving Party body",
+        organizer_user=organizer,
+        gather_at=datetime.now(ZoneInfo("UTC")) + timedelta(days=2),
+    )
+    participants = [
+        await User.create(name=f"Participant {i}", sns_id=f"participant_{i}")
+        for i in range(3)
+    ]
+    for participant in [commenter, *participants]:
+        await PartyParticipant.create(
+            party=party,
+            participant_user=participant,
+            status=ParticipationStatus.APPROVED,
+        )
+
+    queue = NotificationQueue(batch_size=2)
+    event = PartyNotificationEventDto(
+        party_id=party.id,
+        type="party",
+        message="comment added",
+        participant_statuses=[ParticipationStatus.APPROVED],
+        exclude_user_ids=[commenter.id],
+        notify_organizer=True,
+    )
+    await queue.process_event(event)
+
+    target_user_ids = await Notification.all().values_list("target_user_id", flat=True)
+    assert sorted(target_user_ids) == sorted(
+        [organizer.id, *[participant.id for participant in participants]]
+    )
+
+    # 재시도 시에는 이미 저장한 배치를 다시 저장하지 않는다
+    await queue.process_event(event)
+    assert await Notification.all().count() == 4
+
+
+@pytest.mark.asyncio
+async def test_notification_queue_reclaims_unacked_stream_event() -> None:
+    organizer = await User.create(name="Organizer", sns_id="organizer_sns_id")
+    participant = await User.create(name="Participant", sns_id="participant_sns_id")
+    party = await Party.create(
+        title="Freediving Party",
+        body="Freediving Party body",
+        organizer_user=organizer,
+        gather_at=datetime.now(ZoneInfo("UTC")) + timedelta(days=2),
+    )
+    await PartyParticipant.create(
+        party=party,
+        participant_user=participant,
+        status=ParticipationStatus.APPROVED,
+    )
+    event = PartyNotificationEventDto(
+        party_id=party.id,
+        type="party",
+        message="party updated",
+        participant_statuses=[ParticipationStatus.APPROVED],
+    )
+    redis = RedisManager()
+    queue = NotificationQueue(claim_idle_time=0)
+    await redis.create_stream_group(
+        CACHE_KEY_NOTIFICATION_STREAM, NOTIFICATION_STREAM_GROUP
+    )
+    await redis.add_stream_entry(
+        CACHE_KEY_NOTIFICATION_STREAM,
+        event.model_dump(mode="json"),
+        max_len=NOTIFICATION_STREAM_MAX_LEN,
+    )
+
+    # 이벤트를 가져간 워커가 처리 전에 종료된 상황
+    entries = await redis.read_stream_group(
+        CACHE_KEY_NOTIFICATION_STREAM, NOTIFICATION_STREAM_GROUP, "crashed", count=10
+    )
+    assert len(entries) == 1
+    assert await queue.consume("worker") == 0
+    assert await Notification.all().count() == 0
+
+    # ack 되지 않은 이벤트를 다른 워커가 다시 가져와 처리하고 ack
+    assert await queue.consume("worker", claim=True) == 1
+    assert await Notification.filter(target_user_id=participant.id).count() == 1
+    assert await queue.consume("worker", claim=True) == 0
@@ -1,11 +1,31 @@
+import asyncio
+import json
+from typing import Any, Dict, List
 from zoneinfo import ZoneInfo
 
+import fakeredis
 import pytest
 from httpx import AsyncClient
 from starlette import status
+from tortoise.expressions import RawSQL
+from tortoise.transactions import in_transaction
 
+from common.cache_constants import (
+    CACHE_KEY_PARTY_DETAIL_VERSION,
+    PARTY_DETAIL_CACHE_EXPIRE_TIME,
+    PARTY_DETAIL_VERSION_EXPIRE_TIME,
+)
+from common.cache_utils import (
+    CACHE_FLAG_COMPRESSED,
+    FAKE_REDIS_SERVER,
+    OrjsonCacheCodec,
+    RedisManager,
+)
 from common.dependencies import get_current_user
+from common.utils import insert_ignore
+from common.two_tier_cache import clear_local_caches
 from users.models import User, Sport
+from users.utils import get_sport_list
 from datetime import datetime, UTC, timedelta
 from parties.models import (
     Party,
@@ -16,6 +36,18 @@ from parties.models import (
 )
 from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ, NOTIFICATION_TYPE_PARTY
 from notifications.models import Notification
+from parties.services import PartyListService, PartyParticipateService
+from parties.utils import (
+    PARTY_NEARBY_MAX_GEOHASH_CELLS,
+    encode_geohash,
+    get_bounding_box,
+    get_nearby_geohash_prefixes,
+    get_party_detail_cache_key,
+    inactive_expired_parties,
+    purge_deleted_parties,
+    refresh_party_approved_counts,
+    schedule_party_expiry,
+)
 
 
 @pytest.mark.asyncio
@@ -191,6 +223,8 @@ async def test_organizer_accepts_participation(client: AsyncClient) -> None:
     changed_participation = await PartyParticipant.get_or_none(id=participation.id)
     assert changed_participation is not None
     assert changed_participation.status == ParticipationStatus.APPROVED
+    # 승인 인원 수 갱신
+    assert (await Party.get(id=test_party.id)).approved_count == 1
     # 파티원 알람(파티 수락)
     assert (
         await Notification.get_or_none(
@@ -200,6 +234,44 @@ async def test_organizer_accepts_participation(client: AsyncClient) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_concurrent_approvals_counted_once() -> None:
+    organizer_user = await User.create(name="Organizer User")
+    participant_user = await User.create(name="Participant User")
+    test_party = await Party.create(
+        title="Test Party",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+    )
+    participation = await PartyParticipant.create(
+        party=test_party, participant_user=participant_user
+    )
+
+    # 더블 탭처럼 두 요청이 모두 대기(PENDING) 상태를 읽은 뒤 동시에 승인
+    services = [
+        await PartyParticipateService.create(test_party.id, organizer_user)
+        for _ in range(2)
+    ]
+    participations = [await PartyParticipant.get(id=participation.id) for _ in range(2)]
+    results = await asyncio.gather(
+        *[
+            service._organizer_updates_participation(
+                stale_participation, ParticipationStatus.APPROVED
+            )
+            for service, stale_participation in zip(services, participations)
+        ]
+    )
+
+    assert all(result.status == ParticipationStatus.APPROVED for result in results)
+    assert (await Party.get(id=test_party.id)).approved_count == 1
+    assert (
+        await Notification.filter(
+            related_id=test_party.id, target_user=participant_user
+        ).count()
+        == 1
+    )
+
+
 @pytest.mark.asyncio
 async def test_organizer_cancels_participation(client: AsyncClient) -> None:
     organizer_user = await User.create(name="Organizer User")
@@ -354,6 +426,97 @@ async def test_get_party_details_success(client: AsyncClient) -> None:
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_get_party_details_cache_invalidated(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image.jpg"
+    )
+    pending_user = await User.create(
+        name="Pending User", profile_image="http://example.com/image2.jpg"
+    )
+    test_party = await Party.create(
+        title="Test Party",
+        body="Test Party body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        participant_cost=100,
+        sport=await Sport.create(name="Freediving"),
+        place_id=123215213,
+        place_name="딥스테이션",
+        address="경기도 용신시 처인구 784-2",
+        longitude=float(37.2805605),
+        latitude=float(127.1997416),
+    )
+    participation = await PartyParticipant.create(
+        party=test_party,
+        participant_user=pending_user,
+        status=ParticipationStatus.PENDING,
+    )
+
+    # 첫 조회로 캐시 생성
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    assert response.status_code == 200
+    assert len(response.json()["pending_participants"]) == 1
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: organizer_user
+    response = await client.post(
+        f"/api/party/organizer/{test_party.id}/status-change/{participation.id}",
+        json={"new_status": ParticipationStatus.APPROVED.value},
+    )
+    assert response.status_code == 200
+
+    # 상태 변경 후에는 캐시가 무효화되어 새 참가 정보가 조회되어야 한다
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    response_data = response.json()
+    assert response.status_code == 200
+    assert response_data["current_participants"] == 2
+    assert response_data["pending_participants"] == []
+    assert len(response_data["approved_participants"]) == 2
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_party_details_cache_codec(client: AsyncClient) -> None:
+    """
+    큰 파티 상세 캐시는 version 바이트와 함께 압축 저장되고,
+    version 도입 전 json 으로 저장된 값도 그대로 읽힌다
+    """
+    organizer_user = await User.create(name="Organizer User")
+    test_party = await Party.create(
+        title="Test Party",
+        body="Long body " * 200,
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        participant_cost=100,
+        sport=await Sport.create(name="Freediving"),
+        place_id=123215213,
+        place_name="딥스테이션",
+        address="경기도 용신시 처인구 784-2",
+        longitude=float(37.2805605),
+        latitude=float(127.1997416),
+    )
+
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    assert response.status_code == 200
+
+    fake_redis = fakeredis.FakeRedis(server=FAKE_REDIS_SERVER)
+    cache_key = await get_party_detail_cache_key(test_party.id)
+    raw_value = fake_redis.get(cache_key)
+    assert raw_value[0] == OrjsonCacheCodec.version | CACHE_FLAG_COMPRESSED
+    assert len(raw_value) < len(test_party.body)
+
+    # 이전 형식(json 텍스트)으로 저장된 캐시
+    cached_detail = await RedisManager().get_value(cache_key)
+    fake_redis.set(cache_key, json.dumps(cached_detail))
+    legacy_response = await client.get(f"/api/party/details/{test_party.id}")
+    assert legacy_response.json() == response.json()
+
+
 @pytest.mark.asyncio
 async def test_get_party_list_success(client: AsyncClient) -> None:
     # 더미 데이터 생성
@@ -412,6 +575,98 @@ async def test_get_party_list_success(client: AsyncClient) -> None:
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_get_party_list_participants_info(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+    party_1 = await Party.create(
+        title="Party 1",
+        body="Party 1 body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=3),
+        participant_limit=5,
+        sport=sport,
+        place_name="딥스테이션",
+        address="경기도 용신시 처인구 784-2",
+        longitude=float(127.1997416),
+        latitude=float(37.2805605),
+    )
+    party_2 = await Party.create(
+        title="Party 2",
+        body="Party 2 body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=4),
+        participant_limit=6,
+        sport=sport,
+        place_name="딥스테이션",
+        address="경기도 용신시 처인구 784-2",
+        longitude=float(127.1997416),
+        latitude=float(37.2805605),
+    )
+    for i in range(2):
+        await PartyParticipant.create(
+            party=party_1,
+            participant_user=await User.create(name=f"Approved User {i}"),
+            status=ParticipationStatus.APPROVED,
+        )
+    await PartyParticipant.create(
+        party=party_1,
+        participant_user=await User.create(name="Pending User"),
+        status=ParticipationStatus.PENDING,
+    )
+    # 서비스를 거치지 않고 생성한 참가 정보는 재계산으로 반영
+    assert await refresh_party_approved_counts() == 1
+
+    response = await client.get("/api/party/list")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    participants_info = {
+        party["id"]: party["participants_info"] for party in response_data
+    }
+    assert participants_info[party_1.id] == "3/5"
+    assert participants_info[party_2.id] == "1/6"
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_cursor_pagination(client: AsyncClient) -> None:
+    organizer_user = await User.create(name="Organizer User")
+    sport = await Sport.create(name="Freediving")
+    for i in range(10):
+        await Party.create(
+            title=f"Party {i}",
+            body="Party body",
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=float(127.1997416),
+            latitude=float(37.2805605),
+        )
+
+    first_response = await client.get("/api/party/list")
+    assert first_response.status_code == 200
+    first_page = first_response.json()
+    assert len(first_page) == 8
+    next_cursor = first_response.headers.get("X-Next-Cursor")
+    assert next_cursor
+
+    second_response = await client.get(
+        "/api/party/list", params={"cursor": next_cursor}
+    )
+    assert second_response.status_code == 200
+    second_page = second_response.json()
+    assert [party["title"] for party in second_page] == ["Party 1", "Party 0"]
+    assert "X-Next-Cursor" not in second_response.headers
+
+    invalid_response = await client.get("/api/party/list", params={"cursor": "invalid"})
+    assert invalid_response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_sports_list_success(client: AsyncClient) -> None:
     await Sport.create(name="프리다이빙")
@@ -424,6 +679,58 @@ async def test_get_sports_list_success(client: AsyncClient) -> None:
     assert len(sports_list) == 3
 
 
+@pytest.mark.asyncio
+async def test_two_tier_cache_skips_write_back_after_invalidate() -> None:
+    sport = await Sport.create(name="프리다이빙")
+    cache = get_sport_list.cache
+    load_count = 0
+
+    async def loader() -> List[str]:
+        nonlocal load_count
+        load_count += 1
+        names = await Sport.all().values_list("name", flat=True)
+        if load_count == 1:
+            # 조회를 마친 뒤 저장하기 전에 다른 요청이 변경하고 무효화
+            await Sport.filter(id=sport.id).update(name="서핑")
+            await cache.invalidate("interleave")
+        return list(names)
+
+    # 무효화 전에 시작한 조회 결과는 반환만 하고 캐시에 저장하지 않음
+    assert await cache.get_or_load("interleave", loader) == ["프리다이빙"]
+    assert await RedisManager().get_value(cache._redis_key("interleave")) is None
+    assert await cache.get_or_load("interleave", loader) == ["서핑"]
+    assert await cache.get_or_load("interleave", loader) == ["서핑"]
+    assert load_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_sports_list_two_tier_cache(client: AsyncClient) -> None:
+    sport = await Sport.create(name="프리다이빙")
+    stats = get_sport_list.cache.get_stats()
+
+    first_response = await client.get("/api/party/sports")
+    assert first_response.json() == [{"id": sport.id, "name": "프리다이빙"}]
+
+    # signal 없이 DB 만 변경되면 캐시된 값을 그대로 반환
+    await Sport.filter(id=sport.id).update(name="서핑")
+    second_response = await client.get("/api/party/sports")
+    assert second_response.json() == [{"id": sport.id, "name": "프리다이빙"}]
+
+    new_stats = get_sport_list.cache.get_stats()
+    assert new_stats["misses"] == stats["misses"] + 1
+    assert new_stats["local_hits"] == stats["local_hits"] + 1
+
+    # 워커 메모리 캐시가 비어도 Redis 에서 조회
+    clear_local_caches()
+    await client.get("/api/party/sports")
+    assert get_sport_list.cache.get_stats()["redis_hits"] == stats["redis_hits"] + 1
+
+    # 모델 저장 시 캐시 무효화
+    await Sport.create(name="스쿠버다이빙")
+    third_response = await client.get("/api/party/sports")
+    assert [item["name"] for item in third_response.json()] == ["서핑", "스쿠버다이빙"]
+
+
 @pytest.mark.asyncio
 async def test_post_party_comment_success(client: AsyncClient) -> None:
     user = await User.create(
@@ -591,6 +898,79 @@ async def test_post_party_like_success(client: AsyncClient) -> None:
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_post_party_like_duplicate_request_idempotent(
+    client: AsyncClient,
+) -> None:
+    organizer = await User.create(name="organizer", email="organizer@example.com")
+    user = await User.create(name="liker", email="liker@example.com")
+    party = await Party.create(
+        title="Test Party", body="Test Party Body", organizer_user=organizer
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 더블 탭처럼 같은 요청이 연달아 와도 좋아요는 하나만 저장
+    for _ in range(2):
+        response = await client.post(f"/api/party/like/{party.id}")
+        assert response.status_code == status.HTTP_201_CREATED
+    assert await PartyLike.filter(user=user, party=party).count() == 1
+    assert response.json() == f"Party-{party.id} is already liked"
+
+    for _ in range(2):
+        response = await client.delete(f"/api/party/like/{party.id}")
+        assert response.status_code == status.HTTP_200_OK
+    assert not await PartyLike.filter(user=user, party=party).exists()
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_insert_ignore_rejects_open_transaction() -> None:
+    organizer = await User.create(name="organizer", email="organizer@example.com")
+    user = await User.create(name="liker", email="liker@example.com")
+    party = await Party.create(
+        title="Test Party", body="Test Party Body", organizer_user=organizer
+    )
+
+    # 실패한 INSERT 가 바깥 트랜잭션까지 롤백하지 않도록 트랜잭션 안에서는 호출할 수 없음
+    with pytest.raises(RuntimeError):
+        async with in_transaction():
+            await insert_ignore(PartyLike, user=user, party=party)
+    assert not await PartyLike.filter(user=user, party=party).exists()
+
+    assert await insert_ignore(PartyLike, user=user, party=party)
+    assert not await insert_ignore(PartyLike, user=user, party=party)
+
+
+@pytest.mark.asyncio
+async def test_party_like_soft_deleted_party_fails(client: AsyncClient) -> None:
+    organizer = await User.create(name="organizer", email="organizer@example.com")
+    user = await User.create(name="liker", email="liker@example.com")
+    party = await Party.create(
+        title="Test Party",
+        body="Test Party Body",
+        organizer_user=organizer,
+        is_deleted=True,
+    )
+    await PartyLike.create(user=user, party=party)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 삭제 표시되어 정리를 기다리는 파티는 좋아요/취소할 수 없음
+    response = await client.post(f"/api/party/like/{party.id}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = await client.delete(f"/api/party/like/{party.id}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert await PartyLike.filter(user=user, party=party).count() == 1
+
+    app.dependency_overrides.clear()
+
+
 @pytest.mark.asyncio
 async def test_post_party_like_cancel_success(client: AsyncClient) -> None:
     organizer = await User.create(
@@ -797,6 +1177,73 @@ async def test_organizer_can_delete_party(client: AsyncClient) -> None:
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_organizer_soft_delete_party_purged_later(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("parties.services.PARTY_SOFT_DELETE", True)
+    organizer = await User.create(
+        email="organizer@example.com",
+        sns_id="organizer_sns_id",
+        name="Organizer User",
+        profile_image="https://path/to/image",
+    )
+    participant = await User.create(
+        email="participant@example.com",
+        sns_id="participant_sns_id",
+        name="Participant User",
+    )
+    party = await Party.create(
+        title="Organizer's Party",
+        body="Party Body",
+        gather_at=datetime.now(ZoneInfo("UTC")) + timedelta(days=2),
+        organizer_user=organizer,
+        sport=await Sport.create(name="Test Sport"),
+        participant_limit=10,
+        participant_cost=100,
+        place_id=1111,
+        place_name="Place",
+        address="Address",
+        longitude=37.1234,
+        latitude=127.5678,
+    )
+    await PartyParticipant.create(
+        party=party,
+        participant_user=participant,
+        status=ParticipationStatus.APPROVED,
+    )
+    await PartyLike.create(party=party, user=participant)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: organizer
+
+    response = await client.delete(f"/api/party/{party.id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    # 삭제 표시된 파티는 조회되지 않고, row 는 purger 가 정리한다
+    response = await client.get("/api/party/list")
+    assert response.json() == []
+    assert (await Party.get(id=party.id)).is_deleted is True
+
+    # 상세 캐시 버전 키는 상세 캐시보다 오래 유지된 뒤 만료된다
+    fake_redis = fakeredis.FakeRedis(server=FAKE_REDIS_SERVER)
+    version_key = CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party.id)
+    assert (
+        PARTY_DETAIL_CACHE_EXPIRE_TIME
+        < fake_redis.ttl(version_key)
+        <= PARTY_DETAIL_VERSION_EXPIRE_TIME
+    )
+
+    assert await purge_deleted_parties() == 1
+    assert await Party.get_or_none(id=party.id) is None
+    assert not fake_redis.exists(version_key)
+    assert await PartyParticipant.filter(party_id=party.id).count() == 0
+    assert await PartyLike.filter(party_id=party.id).count() == 0
+
+    app.dependency_overrides.clear()
+
+
 @pytest.mark.asyncio
 async def test_non_organizer_cannot_delete_party(client: AsyncClient) -> None:
     # Create a user (organizer)
@@ -852,3 +1299,239 @@ async def test_non_organizer_cannot_delete_party(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_nearby_party_list_success(client: AsyncClient) -> None:
+    user = await User.create(name="Organizer User")
+    sport = await Sport.create(name="Freediving")
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    locations = {
+        "딥스테이션": (37.2805605, 127.1997416),
+        "근처 다이빙풀": (37.2905605, 127.1897416),  # 약 1.4km
+        "부산 바다": (35.1587, 129.1604),
+    }
+    for place_name, (latitude, longitude) in locations.items():
+        response = await client.post(
+            "/api/party",
+            json={
+                "title": f"{place_name} Party",
+                "body": "body",
+                "gather_date": "2099-12-27",
+                "gather_time": "17:13",
+                "place_name": place_name,
+                "address": "address",
+                "longitude": longitude,
+                "latitude": latitude,
+                "sport_id": sport.id,
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.get(
+        "/api/party/nearby",
+        params={"latitude": 37.2805605, "longitude": 127.1997416, "radius_km": 5},
+    )
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert [party["place_name"] for party in response_data] == [
+        "딥스테이션",
+        "근처 다이빙풀",
+    ]
+    assert response_data[0]["distance_km"] == 0
+    assert 1 < response_data[1]["distance_km"] < 2
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_nearby_parties_candidates_truncated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    후보가 PARTY_NEARBY_MAX_CANDIDATES 개 이상이면 반경을 줄여 다시 조회하므로
+    먼저 저장된 먼 파티 때문에 가까운 파티가 빠지지 않고, 지난/비활성 파티는 후보에서 제외된다
+    """
+    monkeypatch.setattr("parties.services.PARTY_NEARBY_MAX_CANDIDATES", 3)
+    organizer = await User.create(name="Organizer User")
+    sport = await Sport.create(name="Freediving")
+    latitude, longitude = 37.2805605, 127.1997416
+
+    async def create_party(
+        title: str,
+        latitude_offset: float,
+        gather_at: datetime,
+        is_active: bool = True,
+    ) -> Party:
+        party_latitude = latitude + latitude_offset
+        return await Party.create(
+            title=title,
+            body="body",
+            organizer_user=organizer,
+            sport=sport,
+            gather_at=gather_at,
+            is_active=is_active,
+            place_name=title,
+            address="address",
+            latitude=party_latitude,
+            longitude=longitude,
+            geohash=encode_geohash(party_latitude, longitude),
+        )
+
+    upcoming = datetime.now(UTC) + timedelta(days=1)
+    for i in range(4):
+        await create_party(f"Far {i}", 0.035, upcoming)  # 약 3.9km
+    await create_party("Past", 0.001, datetime.now(UTC) - timedelta(days=1))
+    await create_party("Inactive", 0.001, upcoming, is_active=False)
+    nearest = await create_party("Nearest", 0.002, upcoming)  # 약 0.2km
+    near = await create_party("Near", 0.003, upcoming)  # 약 0.3km
+
+    parties = await PartyListService().get_nearby_parties(
+        latitude=latitude, longitude=longitude, radius_km=5, limit=3
+    )
+
+    # 5km 안의 후보 6개가 상한(3)을 넘어 2.5km 로 줄여 조회하므로 그 안의 파티만 반환
+    assert [party.id for party in parties] == [nearest.id, near.id]
+
+
+def test_get_nearby_geohash_prefixes_cover_radius() -> None:
+    latitude, longitude, radius_km = 37.5, 127.0, 5
+    prefixes = get_nearby_geohash_prefixes(latitude, longitude, radius_km)
+
+    # 반경보다 작은 셀(precision 5, 약 4.9km x 3.9km)로 사각형을 덮는다
+    assert len(prefixes) <= PARTY_NEARBY_MAX_GEOHASH_CELLS
+    assert {len(prefix) for prefix in prefixes} == {5}
+
+    min_lat, max_lat, min_lon, max_lon = get_bounding_box(
+        latitude, longitude, radius_km
+    )
+    for point_latitude in (min_lat, latitude, max_lat):
+        for point_longitude in (min_lon, longitude, max_lon):
+            geohash = encode_geohash(point_latitude, point_longitude)
+            assert geohash is not None
+            assert any(geohash.startswith(prefix) for prefix in prefixes)
+
+
+@pytest.mark.asyncio
+async def test_inactive_expired_parties_only_due_parties() -> None:
+    organizer = await User.create(name="Organizer", sns_id="organizer_sns_id")
+    sport = await Sport.create(name="프리다이빙")
+    expired_party = await Party.create(
+        title="Expired Party",
+        organizer_user=organizer,
+        sport=sport,
+        gather_at=datetime.now(UTC) - timedelta(minutes=1),
+    )
+    upcoming_party = await Party.create(
+        title="Upcoming Party",
+        organizer_user=organizer,
+        sport=sport,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+    )
+    # 대기열에 등록되지 않은 파티는 건드리지 않는다
+    unscheduled_party = await Party.create(
+        title="Unscheduled Party",
+        organizer_user=organizer,
+        sport=sport,
+        gather_at=datetime.now(UTC) - timedelta(days=1),
+    )
+    for party in (expired_party, upcoming_party):
+        await schedule_party_expiry(party.id, party.gather_at)
+
+    assert await inactive_expired_parties() == 1
+
+    await expired_party.refresh_from_db()
+    await upcoming_party.refresh_from_db()
+    await unscheduled_party.refresh_from_db()
+    assert expired_party.is_active is False
+    assert upcoming_party.is_active is True
+    assert unscheduled_party.is_active is True
+
+    # 이미 처리된 파티는 다시 처리하지 않는다
+    assert await inactive_expired_parties() == 0
+
+
+@pytest.mark.asyncio
+async def test_search_parties_merges_fulltext_and_sport_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # SQLite 에는 MATCH ... AGAINST 가 없으므로 같은 의미의 relevance 식으로 MySQL 경로를 검증
+    def fake_relevance(search_query: str) -> RawSQL:
+        keyword = f"%{search_query}%"
+        return RawSQL(
+            f"CASE WHEN title LIKE '{keyword}' THEN 2 "
+            f"WHEN body LIKE '{keyword}' THEN 1 ELSE 0 END"
+        )
+
+    monkeypatch.setattr("parties.services.supports_party_fulltext_search", lambda: True)
+    monkeypatch.setattr("parties.services.build_party_search_relevance", fake_relevance)
+
+    organizer = await User.create(name="Organizer", sns_id="organizer_sns_id")
+    freediving = await Sport.create(name="Freediving")
+    surfing = await Sport.create(name="Surfing")
+    party_kwargs: Dict[str, Any] = dict(
+        organizer_user=organizer,
+        gather_at=datetime.now(UTC) + timedelta(days=2),
+        place_name="Place",
+        address="Address",
+        longitude=126.9780,
+        latitude=37.5665,
+    )
+    title_match = await Party.create(
+        title="Freediving Night",
+        body="body",
+        sport=surfing,
+        **party_kwargs,
+    )
+    body_match = await Party.create(
+        title="Trip",
+        body="Freediving trip",
+        sport=surfing,
+        **party_kwargs,
+    )
+    sport_match = await Party.create(
+        title="Beach",
+        body="body",
+        sport=freediving,
+        **party_kwargs,
+    )
+    both_match = await Party.create(
+        title="Freediving Class",
+        body="body",
+        sport=freediving,
+        **party_kwargs,
+    )
+    await Party.create(
+        title="Surf",
+        body="body",
+        sport=surfing,
+        **party_kwargs,
+    )
+
+    service = PartyListService()
+    first_page = await service.get_party_list(
+        search_query="Freediving", page=1, page_size=2
+    )
+    second_page = await service.get_party_list(
+        search_query="Freediving", page=2, page_size=2
+    )
+    third_page = await service.get_party_list(
+        search_query="Freediving", page=3, page_size=2
+    )
+
+    # relevance, id 순으로 정렬되며 두 쿼리에 모두 포함된 파티는 한 번만 반환
+    assert [party.id for party in first_page.parties] == [
+        both_match.id,
+        title_match.id,
+    ]
+    assert [party.id for party in second_page.parties] == [
+        body_match.id,
+        sport_match.id,
+    ]
+    assert third_page.parties == []
+    assert first_page.next_cursor is None
@@ -15,9 +15,11 @@ from starlette import status
 
 from common.config import AWS_S3_URL
 from common.dependencies import get_current_user
+from common.utils import S3UploadedImage
 from parties.models import Party, PartyLike, PartyParticipant, ParticipationStatus
 from users.auth import GoogleAuth
 from users.models import User, UserToken, Sport, UserInterestedSport
+from users.utils import create_access_token, user_cache
 
 
 @pytest.mark.asyncio
@@ -238,12 +240,18 @@ async def test_success_get_self_profile(client: AsyncClient) -> None:
 
 
 @pytest.fixture
-def mock_s3_upload(monkeypatch: MonkeyPatch) -> Callable[[], Coroutine[Any, Any, str]]:
-    async def mock_upload_file(*args: Any, **kwargs: Any) -> str:
-        return "user1/profile-image/fakeimage.jpg"
+def mock_s3_upload(
+    monkeypatch: MonkeyPatch,
+) -> Callable[[], Coroutine[Any, Any, S3UploadedImage]]:
+    async def mock_upload_image(*args: Any, **kwargs: Any) -> S3UploadedImage:
+        return S3UploadedImage(
+            image="user1/profile-image/fakeimage.jpg",
+            thumbnail_image="user1/profile-image/fakeimage_thumbnail.webp",
+            webp_image="user1/profile-image/fakeimage.webp",
+        )
 
-    monkeypatch.setattr("users.services.s3_upload_file", mock_upload_file)
-    return mock_upload_file
+    monkeypatch.setattr("users.services.s3_upload_image", mock_upload_image)
+    return mock_upload_image
 
 
 @pytest.mark.asyncio
@@ -329,6 +337,12 @@ async def test_update_self_profile_image(
     assert updated_user.profile_image == os.path.join(
         AWS_S3_URL, "user1/profile-image/fakeimage.jpg"
     )  # Mock에서 반환된 URL
+    assert updated_user.profile_thumbnail_image == os.path.join(
+        AWS_S3_URL, "user1/profile-image/fakeimage_thumbnail.webp"
+    )
+    assert response.json()["profile_thumbnail_image"] == (
+        updated_user.profile_thumbnail_image
+    )
 
     # 오버라이드 초기화
     app.dependency_overrides.clear()
@@ -483,3 +497,39 @@ async def test_get_user_party_statistics(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_cached_user(client: AsyncClient) -> None:
+    """
+    토큰의 사용자는 워커 캐시에서 조회하고, 사용자가 저장되면 캐시가 삭제된다
+    """
+    user = await User.create(name="Cached", email="cached@example.com")
+    headers = {"Authorization": f"Bearer {create_access_token({'user_id': user.id})}"}
+
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "Cached"
+
+    # signal 없이 DB 만 변경되면 캐시된 사용자를 사용
+    await User.filter(id=user.id).update(name="Direct")
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.json()["name"] == "Cached"
+
+    # 프로필 수정 시 캐시 삭제
+    response = await client.post(
+        "/api/user/me", headers=headers, json={"name": "Updated"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.json()["name"] == "Updated"
+
+    # 활성화 토글(save) 시 캐시 삭제
+    user.is_active = False
+    await user.save()
+    assert user_cache._users.get(str(user.id)) is None
+
+    response = await client.get(
+        "/api/user/me", headers={"Authorization": "Bearer invalid"}
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
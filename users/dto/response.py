@@ -15,6 +15,7 @@ class SelfProfileResponse(BaseModel):
     # introduction: Optional[str] = None
     profile_image: Optional[str]
     # profile_image: Optional[str] = None
+    profile_thumbnail_image: Optional[str] = None
     interested_sports: Optional[List[SportInfo]]
     # interested_sports: Optional[List[SportInfo]] = None
 
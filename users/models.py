@@ -67,6 +67,9 @@ class User(BaseModel):
         through="models.UserCertificate",
     )
     profile_image = fields.CharField(null=True, blank=True, max_length=255)
+    # 직접 업로드한 프로필 이미지의 파생 이미지 (소셜 프로필 이미지는 없음)
+    profile_thumbnail_image = fields.CharField(null=True, blank=True, max_length=255)
+    profile_webp_image = fields.CharField(null=True, blank=True, max_length=255)
     profile_image_add = fields.CharField(null=True, blank=True, max_length=255)
     region = fields.CharField(null=True, blank=True, max_length=100)
     introduction = fields.TextField(null=True, blank=True)
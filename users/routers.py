@@ -2,7 +2,7 @@ import uuid
 import traceback
 from typing import List, Optional, Any
 
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from fastapi import UploadFile
 from fastapi.responses import RedirectResponse
 
@@ -11,6 +11,7 @@ from common.cache_utils import RedisManager
 from common.choices import SocialAuthPlatform
 from common.config import LOGIN_REDIRECT_URL, logger
 from common.constants import (
+    HEADER_NEXT_CURSOR,
     AUTH_PLATFORM_GOOGLE,
     AUTH_PLATFORM_KAKAO,
     AUTH_PLATFORM_NAVER,
@@ -47,8 +48,6 @@ from users.dtos import (
     UserInfo,
 )
 from users.models import (
-    CertificateLevel,
-    Certificate,
     User,
     CertificateName_Pydantic,
     CertificateLevel_Pydantic,
@@ -59,6 +58,8 @@ from users.utils import (
     create_refresh_token,
     create_access_token,
     is_active_refresh_token,
+    get_certificate_list,
+    get_certificate_level_list,
 )
 
 user_router = APIRouter(
@@ -166,7 +167,10 @@ async def social_auth_callback(
                 or user.profile_image != user_info.profile_image
             ):
                 user.email = user_info.email
-                user.profile_image = user_info.profile_image
+                if user.profile_image != user_info.profile_image:
+                    user.profile_image = user_info.profile_image
+                    user.profile_thumbnail_image = None
+                    user.profile_webp_image = None
                 await user.save()
 
         # Access, Refresh 토큰 생성 및 저장
@@ -202,7 +206,7 @@ async def login_access_token(body: AccessTokenRequest) -> AccessTokenResponse:
     user_uuid = body.user_uid
     r = RedisManager()
     cache_key = CACHE_KEY_LOGIN_REDIRECT_UUID.format(uuid=user_uuid)
-    user_id, is_new_user = r.get_value(cache_key)
+    user_id, is_new_user = await r.get_value(cache_key)
     if not user_id:
         logger.error(f"[LOGIN API ERROR]: INVALID uuid: {user_uuid}")
         raise HTTPException(
@@ -280,8 +284,7 @@ async def logout(user: User = Depends(get_current_user)) -> str:
     status_code=status.HTTP_200_OK,
 )
 async def certificate_level_list() -> Any:
-    certificates = await CertificateName_Pydantic.from_queryset(Certificate.all())
-    return certificates
+    return await get_certificate_list()
 
 
 @user_router.get(
@@ -290,10 +293,7 @@ async def certificate_level_list() -> Any:
     status_code=status.HTTP_200_OK,
 )
 async def get_certificate_levels(certificate_id: int) -> Any:
-    levels = await CertificateLevel_Pydantic.from_queryset(
-        CertificateLevel.filter(certificate_id=certificate_id)
-    )
-    return levels
+    return await get_certificate_level_list(certificate_id)
 
 
 @user_router.get(
@@ -302,12 +302,17 @@ async def get_certificate_levels(certificate_id: int) -> Any:
     status_code=status.HTTP_200_OK,
 )
 async def get_liked_parties(
+    response: Response,
     user: User = Depends(get_current_user),
     page: int = 1,
+    cursor: Optional[str] = None,
 ) -> List[PartyListDetail]:
     service = PartyLikeService(user)
     try:
-        return await service.get_liked_parties(page=page)
+        party_page = await service.get_liked_parties(page=page, cursor=cursor)
+        if party_page.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = party_page.next_cursor
+        return party_page.parties
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -472,6 +477,8 @@ async def mobile_auth_token(body: MobileAuthRequest) -> AccessTokenResponse:
                 and user.profile_image != validated_user_info.profile_image
             ):
                 user.profile_image = validated_user_info.profile_image
+                user.profile_thumbnail_image = None
+                user.profile_webp_image = None
                 update_needed = True
 
             if update_needed:
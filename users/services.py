@@ -1,10 +1,11 @@
 import os
 from typing import Optional
 
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile, status
 
 from common.config import AWS_S3_URL
-from common.utils import s3_upload_file
+from common.image_utils import InvalidImageError
+from common.utils import s3_upload_image
 from parties.models import PartyParticipant, Party, ParticipationStatus, PartyLike
 from users.dto.response import SelfProfileResponse, UserPartyStatisticsResponse
 from users.dtos import SportInfo
@@ -29,6 +30,7 @@ class SelfProfileService:
             introduction=self.user.introduction,
             # profile_image=os.path.join(AWS_S3_URL, self.user.profile_image),
             profile_image=self.user.profile_image,
+            profile_thumbnail_image=self.user.profile_thumbnail_image,
             interested_sports=[
                 SportInfo(
                     id=interested_sport.sport_id, name=interested_sport.sport.name
@@ -67,23 +69,42 @@ class SelfProfileService:
     ) -> SelfProfileResponse:
         if profile_image:
             folder = f"user/{self.user.id}/profile_image"
-            image_url = await s3_upload_file(folder, profile_image)
+            try:
+                uploaded_image = await s3_upload_image(folder, profile_image)
+            except InvalidImageError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
 
-            if image_url:
-                full_image_url = os.path.join(AWS_S3_URL, image_url)
-                self.user.profile_image = full_image_url
+            if uploaded_image:
+                self.user.profile_image = os.path.join(AWS_S3_URL, uploaded_image.image)
+                self.user.profile_thumbnail_image = (
+                    os.path.join(AWS_S3_URL, uploaded_image.thumbnail_image)
+                    if uploaded_image.thumbnail_image
+                    else None
+                )
+                self.user.profile_webp_image = (
+                    os.path.join(AWS_S3_URL, uploaded_image.webp_image)
+                    if uploaded_image.webp_image
+                    else None
+                )
 
         await self.user.save()
 
         return await self.get_profile()
 
     async def get_party_statistics(self) -> UserPartyStatisticsResponse:
-        created_count = await Party.filter(organizer_user=self.user).count()
+        created_count = await Party.filter(
+            organizer_user=self.user, is_deleted=False
+        ).count()
         participated_count = await PartyParticipant.filter(
             participant_user=self.user,
+            party__is_deleted=False,
             status__in=(ParticipationStatus.APPROVED, ParticipationStatus.PENDING),
         ).count()
-        liked_count = await PartyLike.filter(user=self.user).count()
+        liked_count = await PartyLike.filter(
+            user=self.user, party__is_deleted=False
+        ).count()
         return UserPartyStatisticsResponse(
             created_count=created_count,
             participated_count=participated_count,
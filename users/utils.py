@@ -1,8 +1,9 @@
+import copy
 import json
 import logging
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Union, Any
+from typing import Optional, Dict, List, Union, Any
 from zoneinfo import ZoneInfo
 
 import httpx
@@ -10,7 +11,25 @@ from fastapi import HTTPException
 from jose import jwt, jwk
 from jose.utils import base64url_decode
 
-from users.models import UserToken, User
+from tortoise.signals import post_delete, post_save
+
+from common.cache_constants import USER_CACHE_EXPIRE_TIME, USER_CACHE_MAX_SIZE
+from common.two_tier_cache import (
+    LocalLRUCache,
+    publish_cache_invalidation,
+    register_local_invalidator,
+    two_tier_cached,
+)
+from users.models import (
+    UserToken,
+    User,
+    Sport,
+    Certificate,
+    CertificateLevel,
+    SportName_Pydantic,
+    CertificateName_Pydantic,
+    CertificateLevel_Pydantic,
+)
 from datetime import UTC
 
 
@@ -124,3 +143,89 @@ async def validate_kakao_id_token(
         return decoded_id_token
     except jwt.JWTError:
         return decoded_id_token
+
+
+# 운영 중에는 거의 바뀌지 않는 목록이므로 워커 메모리 + Redis 에 캐시
+@two_tier_cached("sports")
+async def get_sport_list() -> List[Dict[str, Any]]:
+    sports = await SportName_Pydantic.from_queryset(Sport.all())
+    return [sport.model_dump() for sport in sports]
+
+
+@two_tier_cached("certificates")
+async def get_certificate_list() -> List[Dict[str, Any]]:
+    certificates = await CertificateName_Pydantic.from_queryset(Certificate.all())
+    return [certificate.model_dump() for certificate in certificates]
+
+
+@two_tier_cached("certificate_levels")
+async def get_certificate_level_list(certificate_id: int) -> List[Dict[str, Any]]:
+    levels = await CertificateLevel_Pydantic.from_queryset(
+        CertificateLevel.filter(certificate_id=certificate_id)
+    )
+    return [level.model_dump() for level in levels]
+
+
+@post_save(Sport)
+@post_delete(Sport)
+async def _invalidate_sport_list(*args: Any, **kwargs: Any) -> None:
+    await get_sport_list.invalidate()
+
+
+@post_save(Certificate)
+@post_delete(Certificate)
+async def _invalidate_certificate_list(*args: Any, **kwargs: Any) -> None:
+    await get_certificate_list.invalidate()
+
+
+@post_save(CertificateLevel)
+@post_delete(CertificateLevel)
+async def _invalidate_certificate_level_list(*args: Any, **kwargs: Any) -> None:
+    await get_certificate_level_list.invalidate()
+
+
+class UserCache:
+    """
+    인증된 사용자 row 를 워커 메모리에 짧게 캐시합니다.
+    요청마다 다른 객체를 쓰도록 복사본을 반환하며,
+    사용자가 저장/삭제되면 모든 워커의 캐시에서 삭제합니다.
+    """
+
+    namespace = "users"
+
+    def __init__(
+        self, ttl: float = USER_CACHE_EXPIRE_TIME, max_size: int = USER_CACHE_MAX_SIZE
+    ) -> None:
+        self._users = LocalLRUCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, user_id: int) -> Optional[User]:
+        user = self._users.get(str(user_id))
+        if user is None:
+            user = await User.get_or_none(id=user_id)
+            if user is None:
+                return None
+            self._users.set(str(user_id), user)
+        return copy.copy(user)
+
+    def invalidate_local(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self._users.clear()
+        else:
+            self._users.delete(key)
+
+    async def invalidate(self, user_id: int) -> None:
+        self.invalidate_local(str(user_id))
+        await publish_cache_invalidation(self.namespace, str(user_id))
+
+
+user_cache = UserCache()
+register_local_invalidator(UserCache.namespace, user_cache.invalidate_local)
+
+
+# 프로필 수정, 활성화 토글 등 사용자 row 가 바뀌면 캐시 삭제
+@post_save(User)
+@post_delete(User)
+async def _invalidate_user_cache(
+    sender: Any, instance: User, *args: Any, **kwargs: Any
+) -> None:
+    await user_cache.invalidate(instance.pk)